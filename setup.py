@@ -76,7 +76,7 @@ setup(
     platforms='any',
     install_requires=[
         'six',
-        'SQLAlchemy>=1.0'
+        'SQLAlchemy>=1.1'
     ],
     extras_require=extras_require,
     classifiers=[
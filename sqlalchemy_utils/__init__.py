@@ -1,6 +1,8 @@
 from .aggregates import aggregated  # noqa
 from .asserts import (  # noqa
     assert_max_length,
+    assert_max_queries,
+    assert_max_query_time,
     assert_max_value,
     assert_min_value,
     assert_non_nullable,
@@ -10,12 +12,18 @@ from .exceptions import ImproperlyConfigured  # noqa
 from .expressions import Asterisk, row_to_json  # noqa
 from .functions import (  # noqa
     analyze,
+    capture_slow_queries,
     cast_if,
+    compare_plans,
+    compile_sorter,
     create_database,
+    create_databases,
     create_mock_engine,
     database_exists,
     dependent_objects,
+    dispose_admin_engines,
     drop_database,
+    drop_databases,
     escape_like,
     get_bind,
     get_class_by_table,
@@ -35,20 +43,30 @@ from .functions import (  # noqa
     has_index,
     has_unique_index,
     identity,
+    index_coverage,
     is_loaded,
     json_sql,
     merge_references,
     mock_engine,
     naturally_equivalent,
+    paginate_keyset,
+    plan_delete,
     render_expression,
     render_statement,
+    snapshot_database,
     sort_query,
     table_name
 )
-from .generic import generic_relationship  # noqa
-from .i18n import TranslationHybrid  # noqa
+from .generic import (  # noqa
+    generic_relationship,
+    generic_selectinload,
+    prefetch_generic
+)
+from .i18n import locale_cache, translation_only, TranslationHybrid  # noqa
 from .listeners import (  # noqa
+    apply_instant_defaults,
     auto_delete_orphans,
+    bulk_insert,
     coercion_listener,
     force_auto_coercion,
     force_instant_defaults
@@ -31,13 +31,34 @@ We can easily test the constraints by assert_* functions::
 
     # raises AssertionError because the max length of email is 255
     assert_max_length(user, 'email', 300)
+
+
+The query budget assertions can be used for catching N+1 query problems and
+additional round trips in tests::
+
+
+    from sqlalchemy_utils import assert_max_queries, assert_max_query_time
+
+
+    with assert_max_queries(2, bind=engine):
+        for article in session.query(Article).options(joinedload('author')):
+            article.author.name
+
+    with assert_max_query_time(100, bind=engine):
+        session.query(Article).all()
 """
+import contextlib
+import os
+import traceback
+from collections import namedtuple, OrderedDict
 from decimal import Decimal
 
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import DataError, IntegrityError
 
+from .functions.database import _fingerprint, _QueryTimer
+
 
 def _update_field(obj, field, value):
     session = sa.orm.object_session(obj)
@@ -180,3 +201,121 @@ def assert_max_value(obj, column, min_value):
     """
     _expect_successful_update(obj, column, min_value, IntegrityError)
     _expect_failing_update(obj, column, min_value + 1, IntegrityError)
+
+
+_IGNORED_PATHS = (
+    os.path.dirname(os.path.abspath(sa.__file__)) + os.sep,
+    os.path.dirname(os.path.abspath(__file__)) + os.sep
+)
+
+
+def _get_call_site():
+    for filename, lineno, name, line in reversed(traceback.extract_stack()):
+        if not os.path.abspath(filename).startswith(_IGNORED_PATHS):
+            return '%s:%d in %s' % (filename, lineno, name)
+
+
+class RecordedQuery(
+    namedtuple(
+        'RecordedQuery',
+        ['statement', 'parameters', 'duration', 'call_site']
+    )
+):
+    """
+    Statement recorded by :func:`assert_max_queries` and
+    :func:`assert_max_query_time`. Duration is given in milliseconds.
+    """
+    @property
+    def fingerprint(self):
+        return _fingerprint(self.statement)
+
+
+class _QueryRecorder(_QueryTimer):
+    def __init__(self, bind=None):
+        super(_QueryRecorder, self).__init__(
+            sa.engine.Engine if bind is None else bind
+        )
+        self.queries = []
+
+    def record(self, conn, statement, parameters, executemany, duration):
+        self.queries.append(
+            RecordedQuery(statement, parameters, duration, _get_call_site())
+        )
+
+    def report(self):
+        groups = OrderedDict()
+        for query in self.queries:
+            key = (query.fingerprint, query.call_site)
+            groups.setdefault(key, []).append(query)
+        lines = []
+        for (fingerprint, call_site), queries in groups.items():
+            lines.append(
+                '%d x %s (%.3f ms)' % (
+                    len(queries),
+                    fingerprint,
+                    sum(query.duration for query in queries)
+                )
+            )
+            lines.append('    at %s' % call_site)
+        return '\n'.join(lines)
+
+
+@contextlib.contextmanager
+def assert_max_queries(n, bind=None):
+    """
+    Assert that at most `n` statements are executed within the block. On
+    failure the executed statements are reported grouped by their
+    fingerprint and call site. ::
+
+
+        with assert_max_queries(1, bind=engine) as queries:
+            session.query(Article).all()
+
+
+    .. versionadded: 0.33.0
+
+    :param n: maximum number of statements
+    :param bind:
+        Engine or Connection whose statements are counted. If not given,
+        statements of all engines are counted.
+    :return: list of :class:`RecordedQuery` objects
+    """
+    with _QueryRecorder(bind) as recorder:
+        yield recorder.queries
+    if len(recorder.queries) > n:
+        raise AssertionError(
+            'Expected at most %d queries, got %d:\n%s' % (
+                n, len(recorder.queries), recorder.report()
+            )
+        )
+
+
+@contextlib.contextmanager
+def assert_max_query_time(ms, bind=None):
+    """
+    Assert that the total execution time of the statements executed within
+    the block is at most `ms` milliseconds. On failure the executed
+    statements are reported grouped by their fingerprint and call site. ::
+
+
+        with assert_max_query_time(50, bind=engine):
+            session.query(Article).all()
+
+
+    .. versionadded: 0.33.0
+
+    :param ms: maximum total execution time in milliseconds
+    :param bind:
+        Engine or Connection whose statements are timed. If not given,
+        statements of all engines are timed.
+    :return: list of :class:`RecordedQuery` objects
+    """
+    with _QueryRecorder(bind) as recorder:
+        yield recorder.queries
+    duration = sum(query.duration for query in recorder.queries)
+    if duration > ms:
+        raise AssertionError(
+            'Expected queries to take at most %s ms, took %.3f ms:\n%s' % (
+                ms, duration, recorder.report()
+            )
+        )
@@ -1,13 +1,23 @@
 from .database import (  # noqa
     analyze,
+    capture_slow_queries,
+    compare_plans,
     create_database,
+    create_databases,
     database_exists,
+    dispose_admin_engines,
     drop_database,
+    drop_databases,
     escape_like,
     has_index,
     has_unique_index,
+    index_coverage,
     is_auto_assigned_date_column,
-    json_sql
+    json_sql,
+    PlanNode,
+    QueryAnalysis,
+    SlowQuery,
+    snapshot_database
 )
 from .foreign_keys import (  # noqa
     dependent_objects,
@@ -15,7 +25,8 @@ from .foreign_keys import (  # noqa
     get_referencing_foreign_keys,
     group_foreign_keys,
     merge_references,
-    non_indexed_foreign_keys
+    non_indexed_foreign_keys,
+    plan_delete
 )
 from .mock import create_mock_engine, mock_engine  # noqa
 from .orm import (  # noqa
@@ -41,7 +52,12 @@ from .orm import (  # noqa
 )
 from .render import render_expression, render_statement  # noqa
 from .sort_query import (  # noqa
+    compile_sorter,
+    CompiledSorter,
+    KeysetPage,
     make_order_by_deterministic,
+    paginate_keyset,
     QuerySorterException,
-    sort_query
+    sort_query,
+    UnindexedSortWarning
 )
@@ -1,14 +1,23 @@
 import collections
+import contextlib
+import hashlib
 import itertools
+import json
 import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
 from copy import copy
+from multiprocessing.pool import ThreadPool
 
+import six
 import sqlalchemy as sa
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
 from ..expressions import explain_analyze
-from ..utils import starts_with
 from .orm import quote
 
 
@@ -26,8 +35,114 @@ class PlanAnalysis(object):
         return types
 
 
+class PlanNode(object):
+    """
+    Single node of a query plan tree as returned by
+    :attr:`QueryAnalysis.root`.
+
+    Row counts and timings are reported per loop, the same way PostgreSQL
+    reports them.
+    """
+    def __init__(self, plan, parent=None):
+        self.plan = plan
+        self.parent = parent
+        self.children = [
+            PlanNode(child, parent=self) for child in plan.get('Plans', [])
+        ]
+
+    @property
+    def node_type(self):
+        return self.plan['Node Type']
+
+    @property
+    def relation_name(self):
+        return self.plan.get('Relation Name')
+
+    @property
+    def index_name(self):
+        return self.plan.get('Index Name')
+
+    @property
+    def estimated_rows(self):
+        return self.plan.get('Plan Rows')
+
+    @property
+    def actual_rows(self):
+        return self.plan.get('Actual Rows')
+
+    @property
+    def loops(self):
+        return self.plan.get('Actual Loops', 1)
+
+    @property
+    def startup_time(self):
+        return self.plan.get('Actual Startup Time')
+
+    @property
+    def total_time(self):
+        return self.plan.get('Actual Total Time')
+
+    @property
+    def rows_scanned(self):
+        """
+        Total number of rows this node read over all loops, including the
+        rows removed by filter.
+        """
+        if self.actual_rows is None:
+            return self.estimated_rows
+        return (
+            self.actual_rows + self.plan.get('Rows Removed by Filter', 0)
+        ) * self.loops
+
+    @property
+    def buffers(self):
+        return dict(
+            (key, value) for key, value in self.plan.items()
+            if key.endswith(' Blocks')
+        )
+
+    @property
+    def misestimate_ratio(self):
+        """
+        Ratio between the estimated and actual row counts of this node. The
+        ratio is always at least 1 regardless of the direction of the
+        misestimate. Returns None for plans without actual row counts.
+        """
+        if self.actual_rows is None or self.estimated_rows is None:
+            return None
+        estimated = max(self.estimated_rows, 1)
+        actual = max(self.actual_rows, 1)
+        return float(max(estimated, actual)) / min(estimated, actual)
+
+    @property
+    def path(self):
+        """
+        Tuple of node types from the root of the plan to this node.
+        """
+        node = self
+        path = []
+        while node is not None:
+            path.insert(0, node.node_type)
+            node = node.parent
+        return tuple(path)
+
+    def __iter__(self):
+        yield self
+        for child in self.children:
+            for node in child:
+                yield node
+
+    def __repr__(self):
+        if self.relation_name:
+            return '<PlanNode %r on %r>' % (
+                self.node_type, self.relation_name
+            )
+        return '<PlanNode %r>' % self.node_type
+
+
 class QueryAnalysis(object):
     def __init__(self, result_set):
+        self.result_set = result_set
         self.plan = result_set[0]['Plan']
         if 'Total Runtime' in result_set[0]:
             # PostgreSQL versions < 9.4
@@ -39,14 +154,164 @@ class QueryAnalysis(object):
                 result_set[0]['Planning Time']
             )
 
+    @classmethod
+    def from_json(cls, value):
+        """
+        Create :class:`QueryAnalysis` from JSON string previously returned by
+        :meth:`to_json`.
+        """
+        return cls(json.loads(value))
+
+    def to_json(self, **kwargs):
+        """
+        Return the raw EXPLAIN output of this analysis as JSON string.
+        This can be used for storing plans as test fixtures.
+        """
+        return json.dumps(self.result_set, **kwargs)
+
     @property
     def node_types(self):
         return list(PlanAnalysis(self.plan).node_types)
 
+    @property
+    def root(self):
+        return PlanNode(self.plan)
+
+    @property
+    def nodes(self):
+        return list(self.root)
+
+    def seq_scans(self, min_rows=1000):
+        """
+        Return sequential scan nodes that read at least `min_rows` rows.
+
+        :param min_rows: minimum number of rows scanned
+        """
+        return [
+            node for node in self.root
+            if node.node_type == 'Seq Scan' and
+            (node.rows_scanned or 0) >= min_rows
+        ]
+
+    def misestimates(self, ratio=10):
+        """
+        Return nodes whose estimated row count differs from the actual row
+        count by at least given ratio.
+
+        :param ratio: minimum ratio between estimated and actual rows
+        """
+        return [
+            node for node in self.root
+            if node.misestimate_ratio is not None and
+            node.misestimate_ratio >= ratio
+        ]
+
     def __repr__(self):
         return '<QueryAnalysis runtime=%r>' % self.runtime
 
 
+def _get_plan_root(plan):
+    if isinstance(plan, QueryAnalysis):
+        return plan.root
+    if isinstance(plan, PlanNode):
+        return plan
+    if isinstance(plan, list):
+        plan = plan[0]
+    if 'Plan' in plan:
+        plan = plan['Plan']
+    return PlanNode(plan)
+
+
+def compare_plans(baseline, plan, misestimate_ratio=10, runtime_ratio=None):
+    """
+    Compare two query plans and return a list of regressions found in `plan`
+    compared to `baseline`. An empty list is returned if no regressions were
+    found.
+
+    The following changes are reported as regressions:
+
+    * Plan shape (the sequence of node types) changes
+    * A relation that was accessed using an index is scanned sequentially
+    * A node gets misestimated by at least `misestimate_ratio` while the
+      corresponding baseline node was not
+    * Total runtime grows by at least `runtime_ratio` (disabled by default
+      since runtimes tend to be noisy)
+
+    ::
+
+        from sqlalchemy_utils import analyze, compare_plans
+        from sqlalchemy_utils.functions import QueryAnalysis
+
+
+        with open('tests/fixtures/article_plan.json') as f:
+            baseline = QueryAnalysis.from_json(f.read())
+
+        assert compare_plans(baseline, analyze(conn, query)) == []
+
+
+    .. versionadded: 0.33.0
+
+    :param baseline:
+        :class:`QueryAnalysis`, :class:`PlanNode` or raw EXPLAIN JSON output
+    :param plan:
+        :class:`QueryAnalysis`, :class:`PlanNode` or raw EXPLAIN JSON output
+    :param misestimate_ratio:
+        minimum ratio between estimated and actual rows for misestimates
+    :param runtime_ratio:
+        minimum ratio between the runtimes considered as a regression
+    """
+    old = _get_plan_root(baseline)
+    new = _get_plan_root(plan)
+    regressions = []
+
+    old_types = [node.node_type for node in old]
+    new_types = [node.node_type for node in new]
+    if old_types != new_types:
+        regressions.append(
+            'Plan shape changed from %r to %r' % (old_types, new_types)
+        )
+
+    indexed = set(
+        node.relation_name for node in old
+        if node.relation_name and node.node_type != 'Seq Scan'
+    )
+    for node in new:
+        if node.node_type == 'Seq Scan' and node.relation_name in indexed:
+            regressions.append(
+                "Relation '%s' is scanned sequentially instead of using an "
+                "index" % node.relation_name
+            )
+
+    misestimated = set(
+        (node.path, node.relation_name) for node in old
+        if (node.misestimate_ratio or 0) >= misestimate_ratio
+    )
+    for node in new:
+        if (
+            (node.misestimate_ratio or 0) >= misestimate_ratio and
+            (node.path, node.relation_name) not in misestimated
+        ):
+            regressions.append(
+                '%r estimated %s rows but returned %s rows' % (
+                    node, node.estimated_rows, node.actual_rows
+                )
+            )
+
+    if (
+        runtime_ratio is not None and
+        isinstance(baseline, QueryAnalysis) and
+        isinstance(plan, QueryAnalysis) and
+        baseline.runtime and
+        plan.runtime >= baseline.runtime * runtime_ratio
+    ):
+        regressions.append(
+            'Runtime grew from %r ms to %r ms' % (
+                baseline.runtime, plan.runtime
+            )
+        )
+    return regressions
+
+
 def analyze(conn, query):
     """
     Analyze query using given connection and return :class:`QueryAnalysis`
@@ -81,8 +346,30 @@ def analyze(conn, query):
         assert 'Seq Scan' not in analysis.node_types
 
 
+    The full plan tree is available as :class:`PlanNode` objects. Each node
+    holds estimated and actual row counts, loops, timings, buffer usage and
+    the relation and index names::
+
+
+        for node in analysis.root:
+            print(node.node_type, node.relation_name, node.actual_rows)
+
+        # sequential scans reading at least 10000 rows
+        assert not analysis.seq_scans(min_rows=10000)
+
+        # nodes where the planner was off by a factor of 100 or more
+        assert not analysis.misestimates(ratio=100)
+
+
+    Plans can be stored as fixtures using :meth:`QueryAnalysis.to_json` and
+    compared against later using :func:`compare_plans`.
+
+
     .. versionadded: 0.26.17
 
+    .. versionchanged: 0.33.0
+        Added the plan tree, seq_scans and misestimates
+
     :param conn: SQLAlchemy Connection object
     :param query: SQLAlchemy Query object or query as a string
     """
@@ -93,6 +380,262 @@ def analyze(conn, query):
     )
 
 
+_FINGERPRINT_PATTERNS = [
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'%\(\w+\)s|%s|(?<![\w:]):\w+'), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(?)'),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def _fingerprint(statement):
+    """
+    Return normalized form of given SQL statement where literals and bound
+    parameters are replaced with placeholders. Statements that only differ
+    by their parameters get the same fingerprint.
+    """
+    for pattern, replacement in _FINGERPRINT_PATTERNS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+_EXPLAINABLE = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH')
+
+
+def _explain(conn, statement, parameters, analyze):
+    dialect = conn.dialect.name
+    keyword = statement.lstrip().split(None, 1)[0].upper()
+    if keyword not in _EXPLAINABLE:
+        return None
+    # EXPLAIN ANALYZE executes the statement, hence it is only used for plain
+    # SELECT statements. A WITH statement may contain data-modifying CTEs.
+    analyze = analyze and dialect == 'postgresql' and keyword == 'SELECT'
+    if dialect == 'postgresql':
+        if analyze:
+            prefix = 'EXPLAIN (ANALYZE true, BUFFERS true, FORMAT json) '
+        else:
+            prefix = 'EXPLAIN (FORMAT json) '
+    elif dialect == 'mysql':
+        prefix = 'EXPLAIN FORMAT=JSON '
+    elif dialect == 'sqlite':
+        prefix = 'EXPLAIN QUERY PLAN '
+    else:
+        return None
+
+    dbapi_connection = conn.connection
+    # A failing statement aborts the surrounding transaction on PostgreSQL,
+    # hence EXPLAIN is run inside a savepoint unless in autocommit mode. The
+    # effects of EXPLAIN ANALYZE are always rolled back.
+    if dialect != 'postgresql':
+        begin = release = rollback = None
+    elif getattr(dbapi_connection, 'autocommit', False):
+        begin = 'BEGIN' if analyze else None
+        release = None
+        rollback = 'ROLLBACK'
+    else:
+        begin = 'SAVEPOINT sqlalchemy_utils_explain'
+        release = 'RELEASE SAVEPOINT sqlalchemy_utils_explain'
+        rollback = 'ROLLBACK TO SAVEPOINT sqlalchemy_utils_explain'
+    cursor = dbapi_connection.cursor()
+    try:
+        if begin:
+            cursor.execute(begin)
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception:
+            if begin:
+                cursor.execute(rollback)
+            raise
+        if begin and analyze:
+            cursor.execute(rollback)
+        if release:
+            # Releasing a savepoint that was rolled back to only removes the
+            # savepoint itself.
+            cursor.execute(release)
+    finally:
+        cursor.close()
+    if dialect == 'sqlite':
+        return [tuple(row) for row in rows]
+    plan = rows[0][0]
+    if isinstance(plan, six.string_types):
+        plan = json.loads(plan)
+    return plan
+
+
+class SlowQuery(object):
+    """
+    Statement captured by :func:`capture_slow_queries`.
+
+    :param statement: the executed SQL statement
+    :param parameters: parameters the statement was executed with
+    :param duration: execution time in milliseconds
+    :param plan:
+        the EXPLAIN output of the statement or None if the statement could
+        not be explained. On PostgreSQL and MySQL this is the parsed JSON
+        plan, on SQLite a list of EXPLAIN QUERY PLAN rows.
+    """
+    def __init__(self, statement, parameters, duration, plan=None):
+        self.statement = statement
+        self.parameters = parameters
+        self.duration = duration
+        self.plan = plan
+
+    @property
+    def fingerprint(self):
+        return _fingerprint(self.statement)
+
+    def __repr__(self):
+        return '<SlowQuery duration=%.3f fingerprint=%r>' % (
+            self.duration,
+            self.fingerprint
+        )
+
+
+class _QueryTimer(object):
+    """
+    Times the statements executed using given engine or connection and
+    passes each of them to :meth:`record`. The start times are kept in a
+    stack in the info dictionary of the connection, which is removed as soon
+    as the stack is empty and on exit.
+    """
+    def __init__(self, bind):
+        self.bind = bind
+        self.key = object()
+        self.infos = {}
+
+    def record(self, conn, statement, parameters, executemany, duration):
+        raise NotImplementedError
+
+    def _pop_start_time(self, conn):
+        start_times = conn.info.get(self.key)
+        if not start_times:
+            return None
+        start = start_times.pop()
+        if not start_times:
+            del conn.info[self.key]
+        return start
+
+    def before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        self.infos[id(conn.info)] = conn.info
+        conn.info.setdefault(self.key, []).append(time.time())
+
+    def after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        start = self._pop_start_time(conn)
+        if start is not None:
+            duration = (time.time() - start) * 1000
+            self.record(conn, statement, parameters, executemany, duration)
+
+    def handle_error(self, context):
+        if context.connection is not None:
+            self._pop_start_time(context.connection)
+
+    @property
+    def events(self):
+        return [
+            ('before_cursor_execute', self.before_cursor_execute),
+            ('after_cursor_execute', self.after_cursor_execute),
+            ('handle_error', self.handle_error),
+        ]
+
+    def __enter__(self):
+        for name, listener in self.events:
+            sa.event.listen(self.bind, name, listener)
+        return self
+
+    def __exit__(self, *args):
+        for name, listener in self.events:
+            sa.event.remove(self.bind, name, listener)
+        for info in self.infos.values():
+            info.pop(self.key, None)
+        self.infos.clear()
+
+
+class _SlowQueryCapture(_QueryTimer):
+    def __init__(self, bind, threshold_ms, analyze, sink):
+        super(_SlowQueryCapture, self).__init__(bind)
+        self.threshold_ms = threshold_ms
+        self.analyze = analyze
+        self.sink = sink
+        self.queries = []
+
+    def record(self, conn, statement, parameters, executemany, duration):
+        if duration < self.threshold_ms:
+            return
+        plan = None
+        if not executemany:
+            try:
+                plan = _explain(conn, statement, parameters, self.analyze)
+            except Exception:
+                pass
+        query = SlowQuery(statement, parameters, duration, plan)
+        self.queries.append(query)
+        if self.sink is not None:
+            self.sink(query)
+
+
+@contextlib.contextmanager
+def capture_slow_queries(bind, threshold_ms=100, analyze=False, sink=None):
+    """
+    Capture statements executed using given engine or connection that take
+    longer than `threshold_ms` milliseconds. Each slow statement is explained
+    again using the same connection and parameters, which makes this a
+    client side equivalent of PostgreSQL's auto_explain module that does not
+    require superuser privileges.
+
+    The context manager yields a list of :class:`SlowQuery` objects that is
+    populated as slow statements are executed. ::
+
+
+        from sqlalchemy_utils import capture_slow_queries
+
+
+        with capture_slow_queries(engine, threshold_ms=50) as slow_queries:
+            session.query(Article).filter(Article.name == u'Some').all()
+
+        for query in slow_queries:
+            print(query.duration, query.fingerprint, query.plan)
+
+
+    Slow statements can also be passed to a custom sink, for example a
+    logger or a metrics client. ::
+
+
+        def log_slow_query(query):
+            logger.warning(
+                '%s took %.1f ms', query.fingerprint, query.duration
+            )
+
+
+        with capture_slow_queries(engine, sink=log_slow_query):
+            ...
+
+
+    Only SELECT, INSERT, UPDATE, DELETE and WITH statements are explained.
+    Plans are captured on PostgreSQL, MySQL and SQLite, for other dialects
+    and for statements that fail to be explained :attr:`SlowQuery.plan` is
+    None. On PostgreSQL the EXPLAIN is run inside a savepoint, so that a
+    failing EXPLAIN does not abort the current transaction.
+
+    .. versionadded: 0.33.0
+
+    :param bind: SQLAlchemy Engine or Connection object
+    :param threshold_ms: minimum statement duration in milliseconds
+    :param analyze:
+        Whether or not to use EXPLAIN ANALYZE on PostgreSQL. Note that this
+        executes the statement once more, hence it is only applied to plain
+        SELECT statements and always rolled back.
+    :param sink: callable that receives each :class:`SlowQuery`
+    """
+    with _SlowQueryCapture(bind, threshold_ms, analyze, sink) as capture:
+        yield capture.queries
+
+
 def escape_like(string, escape_char='*'):
     """
     Escape the string paremeter used in SQL LIKE expressions.
@@ -188,6 +731,75 @@ def json_sql(value, scalars_to_json=True):
     return value
 
 
+class IndexLookup(object):
+    """
+    Precomputed index column tuples of given table. The `prefixes` attribute
+    contains all leading column tuples of the primary key and the indexes of
+    the table. The `unique` attribute contains the column tuples of the
+    primary key, unique constraints and unique indexes.
+    """
+    def __init__(self, table):
+        primary_keys = tuple(table.primary_key.columns.values())
+        indexes = [tuple(index.columns.values()) for index in table.indexes]
+        if primary_keys:
+            indexes.append(primary_keys)
+        self.prefixes = frozenset(
+            columns[0:length]
+            for columns in indexes
+            for length in range(1, len(columns) + 1)
+        )
+        self.unique = frozenset(
+            columns for columns in itertools.chain(
+                [primary_keys],
+                (
+                    tuple(constraint.columns.values())
+                    for constraint in table.constraints
+                    if isinstance(constraint, sa.UniqueConstraint)
+                ),
+                (
+                    tuple(index.columns.values())
+                    for index in table.indexes
+                    if index.unique
+                )
+            )
+            if columns
+        )
+
+
+def _get_index_lookup(table):
+    # The lookup is stored on the table itself, since it refers to the
+    # columns of the table and would keep the table alive in a weak key
+    # dictionary.
+    try:
+        return table.__dict__['_index_lookup']
+    except KeyError:
+        lookup = table.__dict__['_index_lookup'] = IndexLookup(table)
+        return lookup
+
+
+def _expire_index_lookup(target, parent):
+    if isinstance(parent, sa.Table):
+        parent.__dict__.pop('_index_lookup', None)
+
+
+for cls in (sa.Column, sa.Constraint, sa.Index):
+    sa.event.listen(cls, 'after_parent_attach', _expire_index_lookup)
+
+
+def _get_table_and_columns(column_or_constraint):
+    table = column_or_constraint.table
+    if not isinstance(table, sa.Table):
+        raise TypeError(
+            'Only columns belonging to Table objects are supported. Given '
+            'column belongs to %r.' % table
+        )
+    if isinstance(column_or_constraint, sa.ForeignKeyConstraint):
+        columns = tuple(column_or_constraint.columns.values())
+    else:
+        columns = (column_or_constraint, )
+    return table, columns
+
+
 def has_index(column_or_constraint):
     """
     Return whether or not given column or the columns of given foreign key
@@ -281,26 +893,16 @@ def has_index(column_or_constraint):
         constraint = list(table.foreign_keys)[0].constraint
 
         has_index(constraint)  # True
-    """
-    table = column_or_constraint.table
-    if not isinstance(table, sa.Table):
-        raise TypeError(
-            'Only columns belonging to Table objects are supported. Given '
-            'column belongs to %r.' % table
-        )
-    primary_keys = table.primary_key.columns.values()
-    if isinstance(column_or_constraint, sa.ForeignKeyConstraint):
-        columns = list(column_or_constraint.columns.values())
-    else:
-        columns = [column_or_constraint]
 
-    return (
-        (primary_keys and starts_with(primary_keys, columns)) or
-        any(
-            starts_with(index.columns.values(), columns)
-            for index in table.indexes
-        )
-    )
+
+    The index columns of each table are cached, hence repeated calls for the
+    same table are cheap. The cache is invalidated whenever an index or a
+    constraint is added to the table.
+
+    .. seealso:: :func:`index_coverage`
+    """
+    table, columns = _get_table_and_columns(column_or_constraint)
+    return columns in _get_index_lookup(table).prefixes
 
 
 def has_unique_index(column_or_constraint):
@@ -381,32 +983,59 @@ def has_unique_index(column_or_constraint):
 
 
     :raises TypeError: if given column does not belong to a Table object
+
+    .. seealso:: :func:`index_coverage`
     """
-    table = column_or_constraint.table
-    if not isinstance(table, sa.Table):
-        raise TypeError(
-            'Only columns belonging to Table objects are supported. Given '
-            'column belongs to %r.' % table
-        )
-    primary_keys = list(table.primary_key.columns.values())
-    if isinstance(column_or_constraint, sa.ForeignKeyConstraint):
-        columns = list(column_or_constraint.columns.values())
-    else:
-        columns = [column_or_constraint]
+    table, columns = _get_table_and_columns(column_or_constraint)
+    return columns in _get_index_lookup(table).unique
 
-    return (
-        (columns == primary_keys) or
-        any(
-            columns == list(constraint.columns.values())
-            for constraint in table.constraints
-            if isinstance(constraint, sa.sql.schema.UniqueConstraint)
-        ) or
-        any(
-            columns == list(index.columns.values())
-            for index in table.indexes
-            if index.unique
-        )
-    )
+
+def index_coverage(columns_or_constraints):
+    """
+    Return an OrderedDict describing the index coverage of given columns or
+    foreign key constraints. The values of the dictionary are dicts with keys
+    `indexed` and `unique` corresponding to :func:`has_index` and
+    :func:`has_unique_index`.
+
+    ::
+
+        from sqlalchemy_utils import index_coverage
+
+
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            title = sa.Column(sa.String(100))
+            is_published = sa.Column(sa.Boolean, index=True)
+
+
+        table = Article.__table__
+
+        index_coverage([table.c.id, table.c.title, table.c.is_published])
+        # OrderedDict([
+        #     (table.c.id, {'indexed': True, 'unique': True}),
+        #     (table.c.title, {'indexed': False, 'unique': False}),
+        #     (table.c.is_published, {'indexed': True, 'unique': False})
+        # ])
+
+
+    :param columns_or_constraints:
+        A sequence of SQLAlchemy Column objects or SA ForeignKeyConstraint
+        objects
+
+    :raises TypeError: if given column does not belong to a Table object
+
+    .. versionadded: 0.33.0
+    """
+    coverage = OrderedDict()
+    for column_or_constraint in columns_or_constraints:
+        table, columns = _get_table_and_columns(column_or_constraint)
+        lookup = _get_index_lookup(table)
+        coverage[column_or_constraint] = {
+            'indexed': columns in lookup.prefixes,
+            'unique': columns in lookup.unique
+        }
+    return coverage
 
 
 def is_auto_assigned_date_column(column):
@@ -430,6 +1059,96 @@ def is_auto_assigned_date_column(column):
     )
 
 
+_admin_engines = {}
+_admin_engines_lock = threading.Lock()
+
+
+def _get_dialect_name(url):
+    # The dialect name is used instead of the drivername, since aliases such
+    # as postgres:// resolve to the postgresql dialect.
+    return url.get_dialect().name
+
+
+def _get_admin_engine(url):
+    """
+    Return engine for issuing server level statements, such as CREATE
+    DATABASE, against the server of given URL. The engines are cached by
+    server URL, so that provisioning many databases reuses the same
+    connection pool.
+    """
+    url = copy(make_url(url))
+    dialect_name = _get_dialect_name(url)
+    if dialect_name == 'postgresql':
+        url.database = 'template1'
+    else:
+        url.database = None
+
+    key = str(url)
+    with _admin_engines_lock:
+        engine = _admin_engines.get(key)
+        if engine is None:
+            kwargs = {}
+            if (
+                dialect_name == 'postgresql' and
+                url.get_driver_name() == 'psycopg2'
+            ):
+                kwargs['isolation_level'] = 'AUTOCOMMIT'
+            engine = sa.create_engine(url, **kwargs)
+            _admin_engines[key] = engine
+    return engine
+
+
+def dispose_admin_engines():
+    """
+    Dispose the engines cached by :func:`database_exists`,
+    :func:`create_database` and :func:`drop_database` and close their
+    connections.
+
+    .. versionadded: 0.33.0
+    """
+    with _admin_engines_lock:
+        engines = list(_admin_engines.values())
+        _admin_engines.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def _databases_exist(urls):
+    urls = [make_url(url) for url in urls]
+    names = {}
+    for url in urls:
+        if _get_dialect_name(url) == 'postgresql':
+            engine = _get_admin_engine(url)
+            names.setdefault(engine, set()).add(url.database)
+
+    existing = {}
+    for engine, databases in names.items():
+        query = (
+            sa.select([sa.column('datname')])
+            .select_from(sa.table('pg_database'))
+            .where(sa.column('datname').in_(sorted(databases)))
+        )
+        existing[engine] = set(row[0] for row in engine.execute(query))
+
+    return [
+        url.database in existing[_get_admin_engine(url)]
+        if _get_dialect_name(url) == 'postgresql'
+        else database_exists(url)
+        for url in urls
+    ]
+
+
+def _map_in_thread_pool(func, items, max_workers):
+    if not items:
+        return
+    pool = ThreadPool(min(max_workers, len(items)))
+    try:
+        pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
 def database_exists(url):
     """Check if a database exists.
 
@@ -453,12 +1172,7 @@ def database_exists(url):
 
     url = copy(make_url(url))
     database = url.database
-    if url.drivername.startswith('postgresql'):
-        url.database = 'template1'
-    else:
-        url.database = None
-
-    engine = sa.create_engine(url)
+    engine = _get_admin_engine(url)
 
     if engine.dialect.name == 'postgresql':
         text = "SELECT 1 FROM pg_database WHERE datname='%s'" % database
@@ -479,17 +1193,24 @@ def database_exists(url):
 
     else:
         text = 'SELECT 1'
+        engine = sa.create_engine(url)
         try:
-            url.database = database
-            engine = sa.create_engine(url)
             engine.execute(text)
             return True
 
         except (ProgrammingError, OperationalError):
             return False
 
+        finally:
+            engine.dispose()
+
 
-def create_database(url, encoding='utf8', template=None):
+def create_database(
+    url,
+    encoding='utf8',
+    template=None,
+    from_snapshot=None
+):
     """Issue the appropriate CREATE DATABASE statement.
 
     :param url: A SQLAlchemy engine URL.
@@ -497,6 +1218,10 @@ def create_database(url, encoding='utf8', template=None):
     :param template:
         The name of the template from which to create the new database. At the
         moment only supported by PostgreSQL driver.
+    :param from_snapshot:
+        The name of a snapshot created with :func:`snapshot_database` from
+        which to create the new database. Supported by PostgreSQL, MySQL and
+        SQLite.
 
     To create a database, you can pass a simple URL that would have
     been passed to ``create_engine``. ::
@@ -509,26 +1234,37 @@ def create_database(url, encoding='utf8', template=None):
 
     Has full support for mysql, postgres, and sqlite. In theory,
     other database engines should be supported.
+
+    Creating a database from a snapshot is much faster than creating the
+    schema and loading the fixtures again, which makes it useful for
+    creating a database for each test process. ::
+
+        snapshot = snapshot_database('postgres://postgres@localhost/name')
+
+        create_database(
+            'postgres://postgres@localhost/name_1',
+            from_snapshot=snapshot
+        )
+
+    .. versionchanged: 0.33.0
+        Added from_snapshot parameter
     """
 
     url = copy(make_url(url))
 
     database = url.database
 
-    if url.drivername.startswith('postgresql'):
-        url.database = 'template1'
-    elif not url.drivername.startswith('sqlite'):
-        url.database = None
+    if from_snapshot is not None:
+        if template is not None:
+            raise ValueError(
+                'Only one of template and from_snapshot can be given.'
+            )
+        if _get_dialect_name(url) == 'postgresql':
+            template = from_snapshot
 
-    engine = sa.create_engine(url)
+    engine = _get_admin_engine(url)
 
     if engine.dialect.name == 'postgresql':
-        if engine.driver == 'psycopg2':
-            from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-            engine.raw_connection().set_isolation_level(
-                ISOLATION_LEVEL_AUTOCOMMIT
-            )
-
         if not template:
             template = 'template0'
 
@@ -545,6 +1281,20 @@ def create_database(url, encoding='utf8', template=None):
             encoding
         )
         engine.execute(text)
+        if from_snapshot is not None:
+            _copy_mysql_database(engine, from_snapshot, database)
+
+    elif from_snapshot is not None:
+        if engine.dialect.name != 'sqlite':
+            raise NotImplementedError(
+                'Snapshots are not supported by %s dialect.' %
+                engine.dialect.name
+            )
+        if not database or database == ':memory:':
+            raise ValueError(
+                'Can not create in-memory database from snapshot.'
+            )
+        shutil.copyfile(from_snapshot, database)
 
     elif engine.dialect.name == 'sqlite' and database != ':memory:':
         if database:
@@ -555,6 +1305,154 @@ def create_database(url, encoding='utf8', template=None):
         engine.execute(text)
 
 
+def _get_schema_hash(engine):
+    inspector = sa.inspect(engine)
+    tables = []
+    for table in sorted(inspector.get_table_names()):
+        columns = [
+            (
+                column['name'],
+                column['type'].compile(dialect=engine.dialect),
+                column['nullable']
+            )
+            for column in inspector.get_columns(table)
+        ]
+        foreign_keys = sorted(
+            repr((
+                fk['constrained_columns'],
+                fk['referred_table'],
+                fk['referred_columns']
+            ))
+            for fk in inspector.get_foreign_keys(table)
+        )
+        indexes = sorted(
+            repr((index['column_names'], index['unique']))
+            for index in inspector.get_indexes(table)
+        )
+        tables.append(repr((
+            table,
+            columns,
+            inspector.get_pk_constraint(table)['constrained_columns'],
+            foreign_keys,
+            indexes
+        )))
+    text = '\n'.join(tables)
+    return hashlib.sha1(text.encode('utf8')).hexdigest()[:12]
+
+
+def _copy_mysql_database(engine, source, target):
+    # The statements are executed with qualified table names, since the
+    # connection is returned to the pool afterwards. CREATE TABLE commits
+    # implicitly on MySQL, hence only the rows are copied in a transaction.
+    connection = engine.connect()
+    try:
+        tables = [
+            row[0] for row in connection.execute(
+                "SHOW FULL TABLES FROM {0} WHERE Table_type = 'BASE TABLE'"
+                .format(quote(engine, source))
+            )
+        ]
+        connection.execute('SET FOREIGN_KEY_CHECKS = 0')
+        try:
+            for table in tables:
+                statement = connection.execute(
+                    'SHOW CREATE TABLE {0}.{1}'.format(
+                        quote(engine, source),
+                        quote(engine, table)
+                    )
+                ).fetchone()[1]
+                connection.execute(
+                    statement.replace(
+                        'CREATE TABLE ',
+                        'CREATE TABLE {0}.'.format(quote(engine, target)),
+                        1
+                    )
+                )
+            with connection.begin():
+                for table in tables:
+                    connection.execute(
+                        'INSERT INTO {0}.{1} SELECT * FROM {2}.{1}'.format(
+                            quote(engine, target),
+                            quote(engine, table),
+                            quote(engine, source)
+                        )
+                    )
+        finally:
+            connection.execute('SET FOREIGN_KEY_CHECKS = 1')
+    finally:
+        connection.close()
+
+
+def snapshot_database(url, name=None):
+    """Create a snapshot of given database and return the name of the
+    snapshot. The snapshot can be used for creating new databases with
+    :func:`create_database`.
+
+    :param url: A SQLAlchemy engine URL.
+    :param name:
+        The name of the snapshot. If not given, the name is derived from the
+        database name and a hash of the database schema.
+
+    This is useful for tests that create the same schema and load the same
+    fixtures for each test process. The schema and fixtures are created only
+    once and each test process gets its own copy of that database. ::
+
+        create_database(url)
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        load_fixtures(engine)
+        engine.dispose()
+
+        snapshot = snapshot_database(url)
+
+        for i in range(workers):
+            create_database('%s_%d' % (url, i), from_snapshot=snapshot)
+
+    On PostgreSQL the snapshot is a database that is used as the TEMPLATE of
+    the new databases. Note that PostgreSQL does not allow other connections
+    to the source database while the snapshot is created. On MySQL the
+    snapshot is a database, which the tables are copied from. The tables are
+    created first, after which the rows are copied in a single transaction,
+    since MySQL commits DDL statements implicitly. On SQLite the
+    snapshot is a copy of the database file.
+
+    An existing snapshot with the same name is replaced.
+
+    .. versionadded: 0.33.0
+    """
+
+    url = copy(make_url(url))
+    database = url.database
+    dialect_name = _get_dialect_name(url)
+
+    if dialect_name == 'sqlite':
+        if not database or database == ':memory:':
+            raise ValueError('Can not snapshot in-memory database.')
+    elif dialect_name not in ('postgresql', 'mysql'):
+        raise NotImplementedError(
+            'Snapshots are not supported by %s dialect.' % dialect_name
+        )
+
+    if name is None:
+        engine = sa.create_engine(url)
+        try:
+            schema_hash = _get_schema_hash(engine)
+        finally:
+            engine.dispose()
+        if dialect_name == 'sqlite':
+            root, ext = os.path.splitext(database)
+            name = '{0}_{1}{2}'.format(root, schema_hash, ext)
+        else:
+            name = '{0}_{1}'.format(database, schema_hash)
+
+    snapshot_url = copy(url)
+    snapshot_url.database = name
+    if database_exists(snapshot_url):
+        drop_database(snapshot_url)
+    create_database(snapshot_url, from_snapshot=database)
+    return name
+
+
 def drop_database(url):
     """Issue the appropriate DROP DATABASE statement.
 
@@ -572,39 +1470,89 @@ def drop_database(url):
 
     database = url.database
 
-    if url.drivername.startswith('postgresql'):
-        url.database = 'template1'
-    elif not url.drivername.startswith('sqlite'):
-        url.database = None
-
-    engine = sa.create_engine(url)
+    engine = _get_admin_engine(url)
 
     if engine.dialect.name == 'sqlite' and database != ':memory:':
         if database:
             os.remove(database)
 
     elif engine.dialect.name == 'postgresql' and engine.driver == 'psycopg2':
-        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-
         connection = engine.connect()
-        connection.connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-
-        # Disconnect all users from the database we are dropping.
-        version = connection.dialect.server_version_info
-        pid_column = (
-            'pid' if (version >= (9, 2)) else 'procpid'
-        )
-        text = '''
-        SELECT pg_terminate_backend(pg_stat_activity.%(pid_column)s)
-        FROM pg_stat_activity
-        WHERE pg_stat_activity.datname = '%(database)s'
-          AND %(pid_column)s <> pg_backend_pid();
-        ''' % {'pid_column': pid_column, 'database': database}
-        connection.execute(text)
-
-        # Drop the database.
-        text = 'DROP DATABASE {0}'.format(quote(connection, database))
-        connection.execute(text)
+        try:
+            # Disconnect all users from the database we are dropping.
+            version = connection.dialect.server_version_info
+            pid_column = (
+                'pid' if (version >= (9, 2)) else 'procpid'
+            )
+            text = '''
+            SELECT pg_terminate_backend(pg_stat_activity.%(pid_column)s)
+            FROM pg_stat_activity
+            WHERE pg_stat_activity.datname = '%(database)s'
+              AND %(pid_column)s <> pg_backend_pid();
+            ''' % {'pid_column': pid_column, 'database': database}
+            connection.execute(text)
+
+            # Drop the database.
+            text = 'DROP DATABASE {0}'.format(quote(connection, database))
+            connection.execute(text)
+        finally:
+            connection.close()
     else:
         text = 'DROP DATABASE {0}'.format(quote(engine, database))
         engine.execute(text)
+
+
+def create_databases(urls, max_workers=10, **kwargs):
+    """Create the databases of given URLs that do not exist yet. The
+    databases are created concurrently using a pool of at most
+    `max_workers` threads. Returns the URLs of the created databases.
+
+    :param urls: SQLAlchemy engine URLs.
+    :param max_workers: The maximum number of concurrent connections.
+    :param kwargs: Additional arguments passed to :func:`create_database`.
+
+    ::
+
+        create_databases(
+            [
+                'postgres://postgres@localhost/tenant_%d' % i
+                for i in range(100)
+            ],
+            from_snapshot='tenant_template'
+        )
+
+    On PostgreSQL the existence of all databases of the same server is
+    checked using a single query.
+
+    .. versionadded: 0.33.0
+    """
+    urls = [make_url(url) for url in urls]
+    urls = [
+        url for url, exists in zip(urls, _databases_exist(urls))
+        if not exists
+    ]
+    _map_in_thread_pool(
+        lambda url: create_database(url, **kwargs),
+        urls,
+        max_workers
+    )
+    return urls
+
+
+def drop_databases(urls, max_workers=10):
+    """Drop the databases of given URLs that exist. The databases are dropped
+    concurrently using a pool of at most `max_workers` threads. Returns the
+    URLs of the dropped databases.
+
+    :param urls: SQLAlchemy engine URLs.
+    :param max_workers: The maximum number of concurrent connections.
+
+    .. versionadded: 0.33.0
+    """
+    urls = [make_url(url) for url in urls]
+    urls = [
+        url for url, exists in zip(urls, _databases_exist(urls))
+        if exists
+    ]
+    _map_in_thread_pool(drop_database, urls, max_workers)
+    return urls
@@ -7,7 +7,7 @@ from sqlalchemy.orm import object_session
 from sqlalchemy.schema import ForeignKeyConstraint, MetaData, Table
 
 from ..query_chain import QueryChain
-from .database import has_index
+from ..utils import starts_with
 from .orm import get_column_key, get_mapper, get_tables
 
 
@@ -313,40 +313,213 @@ def _get_criteria(keys, class_, obj):
     return criteria
 
 
-def non_indexed_foreign_keys(metadata, engine=None):
+_POSTGRESQL_NON_INDEXED_FOREIGN_KEYS = sa.text('''
+SELECT
+    ns.nspname AS table_schema,
+    cl.relname AS table_name,
+    con.conname AS name,
+    ARRAY(
+        SELECT a.attname::text
+        FROM generate_subscripts(con.conkey, 1) AS s(i)
+        JOIN pg_attribute a
+            ON a.attrelid = con.conrelid AND a.attnum = con.conkey[s.i]
+        ORDER BY s.i
+    ) AS constrained_columns,
+    ref_ns.nspname AS referred_schema,
+    ref.relname AS referred_table,
+    ARRAY(
+        SELECT a.attname::text
+        FROM generate_subscripts(con.confkey, 1) AS s(i)
+        JOIN pg_attribute a
+            ON a.attrelid = con.confrelid AND a.attnum = con.confkey[s.i]
+        ORDER BY s.i
+    ) AS referred_columns
+FROM pg_constraint con
+JOIN pg_class cl ON cl.oid = con.conrelid
+JOIN pg_namespace ns ON ns.oid = cl.relnamespace
+JOIN pg_class ref ON ref.oid = con.confrelid
+JOIN pg_namespace ref_ns ON ref_ns.oid = ref.relnamespace
+WHERE
+    con.contype = 'f' AND
+    (
+        (pg_table_is_visible(cl.oid) AND cl.relname = ANY(:table_names)) OR
+        ns.nspname || '.' || cl.relname = ANY(:qualified_names)
+    ) AND
+    NOT EXISTS (
+        SELECT 1
+        FROM pg_index i
+        WHERE
+            i.indrelid = con.conrelid AND
+            i.indpred IS NULL AND
+            (i.indkey::int2[])[0:array_length(con.conkey, 1) - 1] =
+            con.conkey
+    )
+ORDER BY ns.nspname, cl.relname, con.conname
+''')
+
+
+def _get_postgresql_non_indexed_foreign_keys(bind, tables):
+    tables_by_name = dict(
+        ((table.schema, table.name), table) for table in tables
+    )
+    result = bind.execute(
+        _POSTGRESQL_NON_INDEXED_FOREIGN_KEYS,
+        table_names=[table.name for table in tables if table.schema is None],
+        qualified_names=[
+            '%s.%s' % (table.schema, table.name)
+            for table in tables if table.schema is not None
+        ]
+    )
+    for row in result:
+        table = tables_by_name.get(
+            (row['table_schema'], row['table_name']),
+            tables_by_name.get((None, row['table_name']))
+        )
+        referred_schema = row['referred_schema']
+        if referred_schema == bind.dialect.default_schema_name:
+            referred_schema = None
+        yield table, {
+            'name': row['name'],
+            'constrained_columns': row['constrained_columns'],
+            'referred_schema': referred_schema,
+            'referred_table': row['referred_table'],
+            'referred_columns': row['referred_columns']
+        }
+
+
+def _get_inspected_non_indexed_foreign_keys(bind, tables):
+    inspector = sa.inspect(bind)
+    for table in tables:
+        indexed_columns = [
+            index['column_names']
+            for index in inspector.get_indexes(table.name, table.schema)
+        ]
+        indexed_columns.append(
+            inspector.get_pk_constraint(
+                table.name,
+                table.schema
+            )['constrained_columns']
+        )
+        for foreign_key in inspector.get_foreign_keys(
+            table.name,
+            table.schema
+        ):
+            if not any(
+                starts_with(index_columns, foreign_key['constrained_columns'])
+                for index_columns in indexed_columns
+            ):
+                yield table, foreign_key
+
+
+def _build_foreign_key_constraint(metadata, table, foreign_key):
+    try:
+        table = metadata.tables[table.key]
+    except KeyError:
+        table = Table(table.name, metadata, schema=table.schema)
+    for column in foreign_key['constrained_columns']:
+        if column not in table.c:
+            table.append_column(sa.Column(column))
+
+    referred_table = foreign_key['referred_table']
+    if foreign_key.get('referred_schema'):
+        referred_table = '%s.%s' % (
+            foreign_key['referred_schema'],
+            referred_table
+        )
+    constraint = ForeignKeyConstraint(
+        foreign_key['constrained_columns'],
+        [
+            '%s.%s' % (referred_table, column)
+            for column in foreign_key['referred_columns']
+        ],
+        name=foreign_key.get('name')
+    )
+    table.append_constraint(constraint)
+    return constraint
+
+
+def _create_index_ddl(constraint, dialect):
+    table = constraint.table
+    index = sa.Index(
+        'ix_%s_%s' % (table.name, '_'.join(constraint.columns.keys())),
+        *constraint.columns.values(),
+        postgresql_concurrently=True
+    )
+    return str(sa.schema.CreateIndex(index).compile(dialect=dialect))
+
+
+def non_indexed_foreign_keys(metadata, engine=None, ddl=False):
     """
     Finds all non indexed foreign keys from all tables of given MetaData.
 
     Very useful for optimizing postgresql database and finding out which
     foreign keys need indexes.
 
+    The foreign keys and indexes are reflected from the database. On
+    PostgreSQL this is done with a single catalog query. On other databases
+    an :class:`~sqlalchemy.engine.reflection.Inspector` is used.
+
+    ::
+
+        from sqlalchemy_utils import non_indexed_foreign_keys
+
+
+        non_indexed_foreign_keys(Base.metadata, engine)
+        # {'article': [ForeignKeyConstraint(...)]}
+
+
+    Passing ``ddl=True`` returns ready-to-run CREATE INDEX statements for the
+    non indexed foreign keys instead. On PostgreSQL the indexes are created
+    concurrently.
+
+    ::
+
+        non_indexed_foreign_keys(Base.metadata, engine, ddl=True)
+        # ['CREATE INDEX CONCURRENTLY ix_article_category_id ON article '
+        #  '(category_id)']
+
+
     :param metadata: MetaData object to inspect tables from
+    :param engine:
+        Engine or Connection to reflect the database with. This is required if
+        given metadata is not bound.
+    :param ddl:
+        Whether or not to return a list of CREATE INDEX statements instead of
+        a dictionary of foreign key constraints.
+
+    .. versionchanged: 0.33.0
+        Added ddl parameter. Foreign keys are reflected in bulk.
     """
-    reflected_metadata = MetaData()
-
     if metadata.bind is None and engine is None:
         raise Exception(
             'Either pass a metadata object with bind or '
             'pass engine as a second parameter'
         )
+    bind = metadata.bind or engine
 
-    constraints = defaultdict(list)
+    tables = list(metadata.tables.values())
+    if bind.dialect.name == 'postgresql':
+        foreign_keys = _get_postgresql_non_indexed_foreign_keys(bind, tables)
+    else:
+        foreign_keys = _get_inspected_non_indexed_foreign_keys(bind, tables)
 
-    for table_name in metadata.tables.keys():
-        table = Table(
-            table_name,
-            reflected_metadata,
-            autoload=True,
-            autoload_with=metadata.bind or engine
+    reflected_metadata = MetaData()
+    constraints = defaultdict(list)
+    for table, foreign_key in foreign_keys:
+        constraints[table.key].append(
+            _build_foreign_key_constraint(
+                reflected_metadata,
+                table,
+                foreign_key
+            )
         )
 
-        for constraint in table.constraints:
-            if not isinstance(constraint, ForeignKeyConstraint):
-                continue
-
-            if not has_index(constraint):
-                constraints[table.name].append(constraint)
-
+    if ddl:
+        return [
+            _create_index_ddl(constraint, bind.dialect)
+            for table_name in sorted(constraints)
+            for constraint in constraints[table_name]
+        ]
     return dict(constraints)
 
 
@@ -354,3 +527,242 @@ def get_fk_constraint_for_columns(table, *columns):
     for constraint in table.constraints:
         if list(constraint.columns.values()) == list(columns):
             return constraint
+
+
+class DeletePlan(object):
+    """
+    A topologically ordered sequence of set-based DELETE statements returned
+    by :func:`plan_delete`. The statements are ordered so that all dependent
+    rows are deleted before the rows they reference.
+
+    :param statements: A list of SQLAlchemy Delete objects
+    """
+    def __init__(self, statements):
+        self.statements = statements
+
+    def __iter__(self):
+        return iter(self.statements)
+
+    def __len__(self):
+        return len(self.statements)
+
+    @property
+    def tables(self):
+        """
+        Return the tables this plan deletes from in execution order.
+        """
+        return [statement.table for statement in self.statements]
+
+    def explain(self, bind, **kwargs):
+        """
+        Run EXPLAIN for each statement of this plan and return a list of the
+        results. Currently only PostgreSQL is supported.
+
+        :param bind: SQLAlchemy Session / Connection object
+        :param kwargs: Additional parameters passed to the explain construct
+        """
+        from ..expressions import explain
+
+        return [
+            bind.execute(explain(statement, **kwargs)).fetchall()
+            for statement in self.statements
+        ]
+
+    def execute(self, bind):
+        """
+        Execute the statements of this plan in order and return a list of
+        deleted row counts. The statements are executed within the
+        transaction of the given Session / Connection.
+
+        :param bind: SQLAlchemy Session / Connection object
+        """
+        return [
+            bind.execute(statement).rowcount
+            for statement in self.statements
+        ]
+
+    def __repr__(self):
+        return '<DeletePlan tables=%r>' % [
+            table.name for table in self.tables
+        ]
+
+
+def _in_(columns, selection):
+    if len(columns) == 1:
+        return columns[0].in_(selection)
+    return sa.tuple_(*columns).in_(selection)
+
+
+def _get_referencing_constraints(table):
+    constraints = set(
+        fk.constraint for fk in get_referencing_foreign_keys(table)
+    )
+    constraints.update(
+        constraint for constraint in table.constraints
+        if isinstance(constraint, ForeignKeyConstraint) and
+        constraint.referred_table is table
+    )
+    return sorted(
+        constraints,
+        key=lambda constraint: (
+            constraint.table.name,
+            list(constraint.columns.keys())
+        )
+    )
+
+
+def _collect_dependents(table, path, order, incoming):
+    """
+    Walk through the foreign keys referencing given table depth first.
+    Each table is appended to `order` after all its dependents and the
+    referencing foreign keys of each table are collected into `incoming`.
+    """
+    for constraint in _get_referencing_constraints(table):
+        ondelete = (constraint.ondelete or '').upper()
+        if ondelete in ('SET NULL', 'SET DEFAULT'):
+            # The database updates the referencing rows and they survive.
+            continue
+
+        if constraint.table in path + [table]:
+            raise ValueError(
+                "Could not plan deletion of '%s' because of circular foreign "
+                "key dependency %s." % (
+                    table.name,
+                    ' -> '.join(
+                        t.name for t in path + [table, constraint.table]
+                    )
+                )
+            )
+
+        visited = constraint.table in incoming
+        incoming.setdefault(constraint.table, []).append((table, constraint))
+        if not visited:
+            _collect_dependents(
+                constraint.table,
+                path + [table],
+                order,
+                incoming
+            )
+    order.append(table)
+
+
+def _plan_delete(table, whereclause):
+    order = []
+    incoming = {table: []}
+    _collect_dependents(table, [], order, incoming)
+
+    whereclauses = {table: whereclause}
+    deletes = {table: whereclause}
+    # Tables are visited in topological order, so the rows of all
+    # referenced tables are known before the rows referencing them.
+    for dependent in reversed(order[:-1]):
+        conditions = []
+        delete_conditions = []
+        for referred_table, constraint in incoming[dependent]:
+            condition = _in_(
+                list(constraint.columns.values()),
+                sa.select([
+                    element.column for element in constraint.elements
+                ])
+                .select_from(referred_table)
+                .where(whereclauses[referred_table])
+                .correlate(None)
+            )
+            conditions.append(condition)
+            if (constraint.ondelete or '').upper() != 'CASCADE':
+                # Cascading deletes are left for the database to handle.
+                delete_conditions.append(condition)
+        whereclauses[dependent] = sa.or_(*conditions)
+        if delete_conditions:
+            deletes[dependent] = sa.or_(*delete_conditions)
+
+    return [
+        dependent.delete().where(deletes[dependent])
+        for dependent in order
+        if dependent in deletes
+    ]
+
+
+def plan_delete(obj_or_query):
+    """
+    Return a :class:`DeletePlan` for deleting given object or the objects of
+    given query along with all their dependent rows using set-based DELETE
+    statements. Unlike deleting objects through the ORM no dependent objects
+    are loaded into the session.
+
+    The plan is built by walking through all foreign keys that reference the
+    deleted table. Each table gets at most one DELETE statement, even if it
+    references the deleted rows through several foreign key paths. The
+    ondelete options of the foreign keys are respected:
+
+    * ``CASCADE`` foreign keys are left for the database to handle, but the
+      dependents of the cascaded rows are still planned for deletion.
+    * ``SET NULL`` and ``SET DEFAULT`` foreign keys are left for the database
+      to handle.
+    * All other foreign keys get an explicit DELETE statement.
+
+    ::
+
+        from sqlalchemy_utils import plan_delete
+
+
+        plan = plan_delete(user)
+        plan.tables  # [Table('comment', ...), Table('article', ...), ...]
+
+        plan.execute(session)
+
+
+    Queries are supported as well. In the following example all articles of
+    given category and their comments are deleted with two statements::
+
+
+        plan = plan_delete(
+            session.query(Article).filter(Article.category_id == 3)
+        )
+        for statement in plan:
+            print(statement)
+            # DELETE FROM comment WHERE comment.article_id IN (
+            #   SELECT article.id FROM article WHERE article.id IN (
+            #       SELECT article.id FROM article
+            #       WHERE article.category_id = :category_id_1
+            #   )
+            # )
+            # DELETE FROM article WHERE article.id IN (...)
+
+        plan.execute(session)
+
+
+    .. note::
+        This function does not support exotic mappers that use multiple tables
+
+    .. note::
+        MySQL does not allow selecting from the table being deleted in a
+        subquery, hence query arguments are not supported on MySQL.
+
+    :param obj_or_query: SQLAlchemy declarative model object or Query object
+    :raises ValueError:
+        if the foreign key graph contains a cycle (for example a self
+        referential foreign key)
+
+    .. seealso:: :func:`dependent_objects`
+    .. seealso:: :func:`get_referencing_foreign_keys`
+    """
+    if isinstance(obj_or_query, sa.orm.query.Query):
+        table = get_tables(obj_or_query._entities[0])[0]
+        primary_keys = list(table.primary_key.columns.values())
+        whereclause = _in_(
+            primary_keys,
+            obj_or_query.with_entities(*primary_keys)
+            .statement.correlate(None)
+        )
+    else:
+        table = get_tables(obj_or_query)[0]
+        whereclause = sa.and_(*(
+            column == getattr(
+                obj_or_query,
+                get_column_key(type(obj_or_query), column)
+            )
+            for column in table.primary_key.columns.values()
+        ))
+
+    return DeletePlan(_plan_delete(table, whereclause))
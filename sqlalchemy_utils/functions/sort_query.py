@@ -1,23 +1,115 @@
+import base64
+import datetime
+import json
+import logging
+import uuid
+import warnings
+from collections import OrderedDict
+from decimal import Decimal
+
+import six
 import sqlalchemy as sa
 from sqlalchemy.sql.expression import asc, desc
 
-from .database import has_unique_index
+from ..utils import LRUCache
+from .database import has_index, has_unique_index
 from .orm import get_query_descriptor, get_tables
 
+logger = logging.getLogger(__name__)
+
 
 class QuerySorterException(Exception):
     pass
 
 
+class UnindexedSortWarning(UserWarning):
+    pass
+
+
+def get_sort_column(expr):
+    """
+    Return the table column given sort expression sorts by or `None` if the
+    expression does not resolve to a single table column.
+    """
+    if hasattr(expr, '__clause_element__'):
+        expr = expr.__clause_element__()
+    if not isinstance(expr, sa.sql.expression.ColumnElement):
+        return None
+    columns = [
+        column for column in expr.base_columns
+        if isinstance(column, sa.Column) and isinstance(column.table, sa.Table)
+    ]
+    if len(columns) == 1:
+        return columns[0]
+
+
+def is_indexed_sort(expr):
+    """
+    Return whether or not sorting by given expression can use an index. If
+    the expression does not resolve to a table column `None` is returned.
+    """
+    column = get_sort_column(expr)
+    if column is None:
+        return None
+    return has_index(column) or has_unique_index(column)
+
+
+def suggest_sort_index(query, expr):
+    """
+    Return CREATE INDEX statement for a composite index that would support
+    sorting given query by given expression. The index consists of the
+    columns the query filters by with equality comparisons followed by the
+    sort column.
+    """
+    column = get_sort_column(expr)
+    table = column.table
+    columns = OrderedDict()
+    if query.whereclause is not None:
+        for element in sa.sql.visitors.iterate(query.whereclause, {}):
+            if (
+                isinstance(element, sa.sql.expression.BinaryExpression) and
+                element.operator in (
+                    sa.sql.operators.eq,
+                    sa.sql.operators.in_op
+                )
+            ):
+                for side in (element.left, element.right):
+                    if isinstance(side, sa.Column) and side.table is table:
+                        columns[side.name] = side
+    columns.pop(column.name, None)
+    columns[column.name] = column
+    return 'CREATE INDEX ix_%s_%s ON %s (%s)' % (
+        table.name,
+        '_'.join(columns),
+        table.name,
+        ', '.join(columns)
+    )
+
+
 class QuerySorter(object):
-    def __init__(self, silent=True, separator='-'):
+    def __init__(
+        self,
+        silent=True,
+        separator='-',
+        unindexed=None,
+        fallback=None
+    ):
+        if unindexed not in (None, 'warn', 'raise', 'fallback'):
+            raise ValueError(
+                "Unknown unindexed option '%s'. Valid options are 'warn', "
+                "'raise' and 'fallback'." % unindexed
+            )
         self.separator = separator
         self.silent = silent
+        self.unindexed = unindexed
+        self.fallback = fallback
 
     def assign_order_by(self, entity, attr, func):
         expr = get_query_descriptor(self.query, entity, attr)
 
         if expr is not None:
+            if self.unindexed and is_indexed_sort(expr) is False:
+                return self.handle_unindexed(self.query, attr, expr, func)
             return self.query.order_by(func(expr))
         if not self.silent:
             raise QuerySorterException(
@@ -25,6 +117,31 @@ class QuerySorter(object):
             )
         return self.query
 
+    def handle_unindexed(self, query, attr, expr, func):
+        suggestion = suggest_sort_index(query, expr)
+        logger.info(
+            "Suggested index for sorting by '%s': %s", attr, suggestion
+        )
+        message = (
+            "Sorting by '%s' can not use an index. Consider adding an "
+            "index: %s" % (attr, suggestion)
+        )
+        if self.unindexed == 'raise':
+            raise QuerySorterException(message)
+        if self.unindexed == 'warn':
+            warnings.warn(message, UnindexedSortWarning)
+            return query.order_by(func(expr))
+        if self.fallback:
+            fallback = self.parse_sort_arg(self.fallback)
+            expr = get_query_descriptor(
+                query,
+                fallback['entity'],
+                fallback['attr']
+            )
+            if expr is not None:
+                return query.order_by(fallback['func'](expr))
+        return query
+
     def parse_sort_arg(self, arg):
         if arg[0] == self.separator:
             func = desc
@@ -123,6 +240,19 @@ def sort_query(query, *args, **kwargs):
         query = sort_query(query, 'category-name')
 
 
+    5. Checking that the sorts can use an index
+    ::
+
+
+        query = sort_query(query, 'name', unindexed='warn')
+        # UnindexedSortWarning: Sorting by 'name' can not use an index.
+        # Consider adding an index:
+        # CREATE INDEX ix_article_name ON article (name)
+
+        query = sort_query(query, 'name', unindexed='fallback', fallback='id')
+        # Sorts by article.id instead
+
+
     :param query:
         query to be modified
     :param sort:
@@ -131,10 +261,146 @@ def sort_query(query, *args, **kwargs):
         Whether or not to raise exceptions if unknown sort column
         is passed. By default this is `True` indicating that no errors should
         be raised for unknown columns.
+    :param unindexed:
+        What to do when a sort column is not backed by an index. By default
+        this is `None`, indicating no checks are made. With `'warn'` an
+        :class:`UnindexedSortWarning` is emitted, with `'raise'` a
+        :class:`QuerySorterException` is raised and with `'fallback'` the sort
+        is replaced by the `fallback` sort (or skipped if no fallback is
+        given). A composite index covering the equality filters of the query
+        and the sort column is suggested in the message and logged to the
+        `sqlalchemy_utils.functions.sort_query` logger.
+    :param fallback:
+        sort argument to use in place of unindexed sorts in `'fallback'` mode
+
+    .. seealso:: :func:`compile_sorter`
+
+    .. versionchanged: 0.33.0
+        Added unindexed and fallback parameters.
     """
     return QuerySorter(**kwargs)(query, *args)
 
 
+class CompiledSorter(object):
+    """
+    Precomputed sorter returned by :func:`compile_sorter`.
+    """
+    def __init__(self, query, allowed=None, max_size=1000, **kwargs):
+        self.sorter = QuerySorter(**kwargs)
+        self.sorter.query = query
+        self.whitelist = allowed is not None
+        # Without a whitelist the sort keys come from the callers, hence the
+        # cache is bounded and unresolvable keys are never cached.
+        self.expressions = {} if self.whitelist else LRUCache(max_size)
+        for key in allowed or ():
+            if self.resolve(key) is None:
+                raise QuerySorterException(
+                    "Could not sort query with expression '%s'" % key
+                )
+
+    @property
+    def unindexed(self):
+        return set(
+            key for key, (expr, unindexed) in self.expressions.items()
+            if unindexed
+        )
+
+    def resolve(self, key):
+        parsed = self.sorter.parse_sort_arg(key)
+        expr = get_query_descriptor(
+            self.sorter.query,
+            parsed['entity'],
+            parsed['attr']
+        )
+        if expr is None:
+            return None
+        unindexed = bool(
+            self.sorter.unindexed and
+            is_indexed_sort(expr) is False
+        )
+        self.expressions[key] = (expr, unindexed)
+        return self.expressions[key]
+
+    def __call__(self, query, *args):
+        separator = self.sorter.separator
+        for sort in args:
+            if not sort:
+                continue
+            if sort[0] == separator:
+                func = desc
+                key = sort[1:]
+            else:
+                func = asc
+                key = sort
+            resolved = self.expressions.get(key)
+            if resolved is None and not self.whitelist:
+                resolved = self.resolve(key)
+            if resolved is None:
+                if not self.sorter.silent:
+                    raise QuerySorterException(
+                        "Could not sort query with expression '%s'" % key
+                    )
+                continue
+            expr, unindexed = resolved
+            if unindexed:
+                query = self.sorter.handle_unindexed(query, key, expr, func)
+            else:
+                query = query.order_by(func(expr))
+        return query
+
+
+def compile_sorter(query, allowed=None, max_size=1000, **kwargs):
+    """
+    Return a precomputed sorter for queries shaped like given query. The
+    sort keys are resolved into SQL expressions only once, after which
+    applying the sorter takes time proportional to the number of sort keys.
+    The returned sorter takes the same arguments as :func:`sort_query`.
+
+    ::
+
+        from sqlalchemy_utils import compile_sorter
+
+
+        query = session.query(Article).join(Article.category)
+
+        sorter = compile_sorter(query, allowed=['name', 'category-name'])
+
+        query = sorter(query, '-category-name', 'name')
+
+
+    The allowed sort keys also act as a whitelist. Sort keys not in the
+    whitelist are ignored (or raise :class:`QuerySorterException` in non
+    silent mode), hence user given sort keys can't trigger sorts on
+    arbitrary columns. If `allowed` is not given all sort keys are allowed
+    and resolved expressions are cached as they are encountered, keeping at
+    most `max_size` of the most recently used sort keys.
+
+    .. note::
+        The sorter can only be applied to queries that have the same
+        entities, joins and aliases as the query it was compiled with.
+
+    :param query: template query to resolve the sort keys with
+    :param allowed:
+        A sequence of allowed sort keys (without the descending prefix)
+    :param max_size:
+        Maximum number of cached sort keys when `allowed` is not given
+    :param silent:
+        Whether or not to raise exceptions if unknown sort key is passed.
+    :param unindexed:
+        What to do when a sort column is not backed by an index. See
+        :func:`sort_query`. The index checks are made only once per sort key.
+    :param fallback:
+        sort argument to use in place of unindexed sorts in `'fallback'` mode
+    :raises QuerySorterException:
+        if any of the allowed sort keys can not be resolved
+
+    .. seealso:: :func:`sort_query`
+
+    .. versionadded: 0.33.0
+    """
+    return CompiledSorter(query, allowed, max_size, **kwargs)
+
+
 def make_order_by_deterministic(query):
     """
     Make query order by deterministic (if it isn't already). Order by is
@@ -197,3 +463,235 @@ def make_order_by_deterministic(query):
         *(order_by_func(c) for c in base_table.c if c.primary_key)
     )
     return query
+
+
+class KeysetPage(object):
+    """
+    A page of results returned by :func:`paginate_keyset`.
+
+    :param items: The items of this page
+    :param next_cursor:
+        An opaque cursor pointing to the next page or `None` if this is the
+        last page
+    """
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        return '<KeysetPage items=%d has_next=%r>' % (
+            len(self.items),
+            self.has_next
+        )
+
+
+class _FixedOffset(datetime.tzinfo):
+    def __init__(self, minutes):
+        self.minutes = minutes
+
+    def utcoffset(self, dt):
+        return datetime.timedelta(minutes=self.minutes)
+
+    def tzname(self, dt):
+        return None
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
+
+
+def _encode_value(value):
+    if isinstance(value, datetime.datetime):
+        offset = value.utcoffset()
+        return {
+            'datetime': [
+                value.year, value.month, value.day,
+                value.hour, value.minute, value.second, value.microsecond
+            ],
+            'offset': (
+                None if offset is None else
+                offset.days * 24 * 60 + offset.seconds // 60
+            )
+        }
+    if isinstance(value, datetime.date):
+        return {'date': [value.year, value.month, value.day]}
+    if isinstance(value, datetime.time):
+        return {'time': [
+            value.hour, value.minute, value.second, value.microsecond
+        ]}
+    if isinstance(value, Decimal):
+        return {'decimal': str(value)}
+    if isinstance(value, uuid.UUID):
+        return {'uuid': value.hex}
+    if value is None or isinstance(
+        value,
+        six.string_types + six.integer_types + (float, )
+    ):
+        return value
+    raise TypeError('Could not encode value %r into a cursor.' % value)
+
+
+def _decode_value(value):
+    if not isinstance(value, dict):
+        return value
+    if 'datetime' in value:
+        tzinfo = None
+        if value['offset'] is not None:
+            tzinfo = _FixedOffset(value['offset'])
+        return datetime.datetime(*value['datetime'], tzinfo=tzinfo)
+    if 'date' in value:
+        return datetime.date(*value['date'])
+    if 'time' in value:
+        return datetime.time(*value['time'])
+    if 'decimal' in value:
+        return Decimal(value['decimal'])
+    if 'uuid' in value:
+        return uuid.UUID(value['uuid'])
+    raise ValueError('Invalid cursor value %r.' % value)
+
+
+def _encode_cursor(values):
+    data = json.dumps([_encode_value(value) for value in values])
+    return base64.urlsafe_b64encode(data.encode('utf8')).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    try:
+        data = base64.urlsafe_b64decode(cursor.encode('ascii'))
+        values = json.loads(data.decode('utf8'))
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('Invalid cursor %r.' % cursor)
+    if not isinstance(values, list):
+        raise ValueError('Invalid cursor %r.' % cursor)
+    return [_decode_value(value) for value in values]
+
+
+def _get_order_by_columns(query):
+    columns = []
+    for order_by in query._order_by:
+        is_desc = False
+        while isinstance(order_by, sa.sql.expression.UnaryExpression):
+            if order_by.modifier == sa.sql.operators.desc_op:
+                is_desc = True
+            order_by = order_by.element
+        if isinstance(order_by, sa.sql.elements._textual_label_reference):
+            raise TypeError(
+                'Textual ORDER BY expressions are not supported by keyset '
+                'pagination. Use column objects instead.'
+            )
+        columns.append((order_by, is_desc))
+    return columns
+
+
+def _keyset_criteria(columns, values, row_values=False):
+    values = [
+        sa.literal(value, type_=expr.type)
+        for (expr, is_desc), value in zip(columns, values)
+    ]
+    descs = set(is_desc for expr, is_desc in columns)
+    if row_values and len(descs) == 1:
+        left = sa.tuple_(*(expr for expr, is_desc in columns))
+        right = sa.tuple_(*values)
+        return left < right if descs.pop() else left > right
+
+    criteria = []
+    for index, (expr, is_desc) in enumerate(columns):
+        criteria.append(sa.and_(*(
+            [
+                columns[i][0] == values[i]
+                for i in range(index)
+            ] +
+            [expr < values[index] if is_desc else expr > values[index]]
+        )))
+    return sa.or_(*criteria)
+
+
+def _supports_row_values(query):
+    if query.session is None:
+        return False
+    dialect = query.session.get_bind(query._bind_mapper()).dialect
+    return dialect.name == 'postgresql'
+
+
+def paginate_keyset(query, cursor=None, per_page=20):
+    """
+    Return a :class:`KeysetPage` of given query using keyset (seek)
+    pagination. Unlike OFFSET based pagination the cost of fetching a page
+    does not depend on how deep the page is.
+
+    The order by of the query is first made deterministic using
+    :func:`make_order_by_deterministic`. The page after given cursor is then
+    fetched with a ``WHERE (a, b) > (:a, :b)`` row value predicate on
+    PostgreSQL. Other databases and mixed sort directions use an equivalent
+    ``a > :a OR (a = :a AND b > :b)`` expression.
+
+    ::
+
+        from sqlalchemy_utils import paginate_keyset
+
+
+        query = session.query(Article).order_by(Article.created_at.desc())
+
+        page = paginate_keyset(query, per_page=20)
+        page.items  # First 20 articles
+
+        page = paginate_keyset(query, cursor=page.next_cursor, per_page=20)
+        page.items  # Next 20 articles
+
+
+    The cursors are opaque URL-safe strings, hence they can be passed to the
+    client as they are.
+
+    .. note::
+        The columns used for ordering should not be nullable.
+
+    :param query: SQLAlchemy Query object
+    :param cursor:
+        Cursor of the previous page (`KeysetPage.next_cursor`). By default
+        this is `None`, indicating the first page should be returned.
+    :param per_page: Number of items per page
+    :raises ValueError: if given cursor is invalid
+
+    .. seealso:: :func:`make_order_by_deterministic`
+
+    .. versionadded: 0.33.0
+    """
+    query = make_order_by_deterministic(query)
+    columns = _get_order_by_columns(query)
+
+    if cursor is not None:
+        values = _decode_cursor(cursor)
+        if len(values) != len(columns):
+            raise ValueError('Invalid cursor %r.' % cursor)
+        query = query.filter(
+            _keyset_criteria(columns, values, _supports_row_values(query))
+        )
+
+    descriptions = query.column_descriptions
+    single_entity = (
+        len(descriptions) == 1 and
+        descriptions[0]['expr'] is descriptions[0]['entity']
+    )
+    rows = query.add_columns(*(
+        expr.label('_keyset_%d' % index)
+        for index, (expr, is_desc) in enumerate(columns)
+    )).limit(per_page + 1).all()
+
+    items = [
+        row[0] if single_entity else
+        sa.util.KeyedTuple(row[:-len(columns)], row.keys()[:-len(columns)])
+        for row in rows[:per_page]
+    ]
+    next_cursor = None
+    if len(rows) > per_page:
+        next_cursor = _encode_cursor(rows[per_page - 1][-len(columns):])
+    return KeysetPage(items, next_cursor)
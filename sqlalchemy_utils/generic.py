@@ -1,16 +1,51 @@
-from collections import Iterable
+import weakref
+from collections import Iterable, namedtuple
 
 import six
 import sqlalchemy as sa
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import attributes, class_mapper, ColumnProperty
-from sqlalchemy.orm.interfaces import MapperProperty, PropComparator
+from sqlalchemy.orm import attributes, ColumnProperty
+from sqlalchemy.orm.interfaces import (
+    MapperOption,
+    MapperProperty,
+    PropComparator
+)
 from sqlalchemy.orm.session import _state_session
 from sqlalchemy.util import set_creation_order
 
 from .exceptions import ImproperlyConfigured
 from .functions import identity
 
+GenericTarget = namedtuple(
+    'GenericTarget',
+    ['class_', 'mapper', 'get_identity']
+)
+
+
+_generic_properties = weakref.WeakSet()
+
+
+@sa.event.listens_for(sa.orm.mapper, 'after_configured')
+def _expire_generic_targets():
+    # New mappers may have been configured, rebuild the lookups of the
+    # generic relationships on next use.
+    for prop in list(_generic_properties):
+        prop._lookups = None
+
+
+def _get_from_identity_map(session, target, id):
+    """
+    Return the object of given target class and id from the identity map of
+    given session or None if it is not present or has expired attributes.
+    """
+    key = target.mapper.identity_key_from_primary_key(id)
+    obj = session.identity_map.get(key)
+    if obj is None or not isinstance(obj, target.class_):
+        return None
+    if sa.inspect(obj).expired:
+        return None
+    return obj
+
 
 class GenericAttributeImpl(attributes.ScalarAttributeImpl):
     def get(self, state, dict_, passive=attributes.PASSIVE_OFF):
@@ -25,20 +60,21 @@ class GenericAttributeImpl(attributes.ScalarAttributeImpl):
             return None
 
         # Find class for discriminator.
-        # TODO: Perhaps optimize with some sort of lookup?
         discriminator = self.get_state_discriminator(state)
-        target_class = state.class_._decl_class_registry.get(discriminator)
+        target = self.parent_token.get_target(discriminator)
 
-        if target_class is None:
+        if target is None:
             # Unknown discriminator; return nothing.
             return None
 
         id = self.get_state_id(state)
 
-        target = session.query(target_class).get(id)
+        obj = _get_from_identity_map(session, target, id)
+        if obj is None:
+            obj = session.query(target.class_).get(id)
 
         # Return found (or not found) target.
-        return target
+        return obj
 
     def get_state_discriminator(self, state):
         discriminator = self.parent_token.discriminator
@@ -67,14 +103,13 @@ class GenericAttributeImpl(attributes.ScalarAttributeImpl):
         else:
             # Get the primary key of the initiator and ensure we
             # can support this assignment.
-            class_ = type(initiator)
-            mapper = class_mapper(class_)
+            discriminator, target = self.parent_token.get_discriminator(
+                type(initiator)
+            )
 
-            pk = mapper.identity_key_from_instance(initiator)[1]
+            pk = target.get_identity(initiator)
 
             # Set the identifier and the discriminator.
-            discriminator = six.text_type(class_.__name__)
-
             for index, id in enumerate(self.parent_token.id):
                 dict_[id.key] = pk[index]
             dict_[self.parent_token.discriminator.key] = discriminator
@@ -90,17 +125,23 @@ class GenericRelationshipProperty(MapperProperty):
         Field to discriminate which model we are referring to.
     :param id:
         Field to point to the model we are referring to.
+    :param discriminators:
+        Optional mapping of classes (or class names) to discriminator values.
+        By default the class names are used as discriminator values.
     """
 
-    def __init__(self, discriminator, id, doc=None):
+    def __init__(self, discriminator, id, doc=None, discriminators=None):
         super(GenericRelationshipProperty, self).__init__()
         self._discriminator_col = discriminator
         self._id_cols = id
         self._id = None
         self._discriminator = None
+        self._discriminator_map = discriminators
+        self._lookups = None
         self.doc = doc
 
         set_creation_order(self)
+        _generic_properties.add(self)
 
     def _column_to_property(self, column):
         if isinstance(column, hybrid_property):
@@ -137,13 +178,183 @@ class GenericRelationshipProperty(MapperProperty):
 
         self.id = list(map(self._column_to_property, self._id_cols))
 
+    @property
+    def _class_registry(self):
+        return self.parent.class_._decl_class_registry
+
+    def _resolve_class(self, class_or_name):
+        if isinstance(class_or_name, six.string_types):
+            class_ = self._class_registry.get(class_or_name)
+            if not isinstance(class_, type):
+                raise ImproperlyConfigured(
+                    "Could not find class '%s' for generic relationship "
+                    "discriminator." % class_or_name
+                )
+            return class_
+        return class_or_name
+
+    def _build_targets(self):
+        """
+        Build and return the discriminator -> target and class ->
+        discriminator lookups of this relationship. Both lookups are published
+        with a single assignment, so concurrent readers never see them half
+        built or out of sync.
+        """
+        if self._discriminator_map is None:
+            classes = dict(
+                (six.text_type(class_.__name__), class_)
+                for class_ in self._class_registry.values()
+                if isinstance(class_, type)
+            )
+        else:
+            classes = dict(
+                (value, self._resolve_class(class_))
+                for class_, value in self._discriminator_map.items()
+            )
+        targets = {}
+        discriminators = {}
+        for discriminator, class_ in classes.items():
+            mapper = sa.inspect(class_, raiseerr=False)
+            if mapper is None:
+                continue
+            target = GenericTarget(
+                class_,
+                mapper,
+                mapper.primary_key_from_instance
+            )
+            targets[discriminator] = target
+            discriminators[class_] = discriminator
+        self._lookups = (targets, discriminators)
+        return self._lookups
+
+    def get_target(self, discriminator):
+        """
+        Return :class:`GenericTarget` for given discriminator value or None
+        if there is no class for the discriminator.
+        """
+        targets, discriminators = self._lookups or self._build_targets()
+        try:
+            return targets[discriminator]
+        except KeyError:
+            if self._discriminator_map is not None:
+                return None
+            # The class may have been declared after the lookup was built.
+            class_ = self._class_registry.get(discriminator)
+            if not isinstance(class_, type):
+                return None
+            targets, discriminators = self._build_targets()
+            return targets.get(discriminator)
+
+    def get_discriminator(self, class_):
+        """
+        Return a tuple of discriminator value and :class:`GenericTarget` for
+        given class.
+        """
+        targets, discriminators = self._lookups or self._build_targets()
+        try:
+            discriminator = discriminators[class_]
+        except KeyError:
+            if self._discriminator_map is not None:
+                raise ValueError(
+                    "No discriminator value defined for class '%s'." %
+                    class_.__name__
+                )
+            discriminator = six.text_type(class_.__name__)
+            mapper = sa.inspect(class_)
+            return discriminator, GenericTarget(
+                class_,
+                mapper,
+                mapper.primary_key_from_instance
+            )
+        return discriminator, targets[discriminator]
+
+    def _column_expression(self, column):
+        if isinstance(column, hybrid_property):
+            return getattr(self.parent.class_, column.__name__)
+        return column
+
+    def _load_targets(self, context):
+        query = context.query.with_entities(
+            self._column_expression(self._discriminator_col),
+            *map(self._column_expression, self._id_cols)
+        )
+        ids = {}
+        for row in query:
+            discriminator, id = row[0], tuple(row[1:])
+            if discriminator is not None and None not in id:
+                ids.setdefault(discriminator, set()).add(id)
+
+        return self.fetch_targets(context.session, ids)
+
+    def fetch_targets(self, session, ids):
+        """
+        Return a dict of (discriminator, id) -> target object for given dict
+        of discriminator -> ids. Targets found in the identity map of the
+        session are used as is and the rest are loaded using one query per
+        target class.
+        """
+        targets = {}
+        for discriminator, id_set in ids.items():
+            target = self.get_target(discriminator)
+            if target is None:
+                continue
+            missing = []
+            for id in id_set:
+                obj = _get_from_identity_map(session, target, id)
+                if obj is None:
+                    missing.append(id)
+                else:
+                    targets[(discriminator, id)] = obj
+            if not missing:
+                continue
+            primary_key = target.mapper.primary_key
+            if len(primary_key) == 1:
+                criterion = primary_key[0].in_([id[0] for id in missing])
+            else:
+                criterion = sa.tuple_(*primary_key).in_(missing)
+            query = session.query(target.class_).filter(criterion)
+            for obj in query:
+                targets[(discriminator, identity(obj))] = obj
+        return targets
+
+    def create_row_processor(
+        self,
+        context,
+        path,
+        mapper,
+        result,
+        adapter,
+        populators
+    ):
+        if (
+            ('generic_selectinload', self) not in context.attributes or
+            len(path) != 1
+        ):
+            return
+
+        key = ('generic_selectinload_targets', self)
+        if key not in context.attributes:
+            context.attributes[key] = self._load_targets(context)
+        targets = context.attributes[key]
+        impl = mapper.class_manager[self.key].impl
+
+        def load_target(state, dict_, row):
+            dict_[self.key] = targets.get(
+                (
+                    impl.get_state_discriminator(state),
+                    impl.get_state_id(state)
+                )
+            )
+
+        populators['new'].append((self.key, load_target))
+
     class Comparator(PropComparator):
         def __init__(self, prop, parentmapper):
             self.property = prop
             self._parententity = parentmapper
 
         def __eq__(self, other):
-            discriminator = six.text_type(type(other).__name__)
+            discriminator = self.property.get_discriminator(type(other))[0]
             q = self.property._discriminator_col == discriminator
             other_id = identity(other)
             for index, id in enumerate(self.property._id_cols):
@@ -157,13 +368,21 @@ class GenericRelationshipProperty(MapperProperty):
             mapper = sa.inspect(other)
             # Iterate through the weak sequence in order to get the actual
             # mappers
-            class_names = [six.text_type(other.__name__)]
-            class_names.extend([
-                six.text_type(submapper.class_.__name__)
+            classes = [other]
+            classes.extend([
+                submapper.class_
                 for submapper in mapper._inheriting_mappers
             ])
+            discriminators = []
+            for class_ in classes:
+                try:
+                    discriminators.append(
+                        self.property.get_discriminator(class_)[0]
+                    )
+                except ValueError:
+                    pass
 
-            return self.property._discriminator_col.in_(class_names)
+            return self.property._discriminator_col.in_(discriminators)
 
     def instrument_class(self, mapper):
         attributes.register_attribute(
@@ -178,4 +397,112 @@ class GenericRelationshipProperty(MapperProperty):
 
 
 def generic_relationship(*args, **kwargs):
+    """
+    Create a generic relationship. See :class:`GenericRelationshipProperty`
+    for the arguments.
+    """
     return GenericRelationshipProperty(*args, **kwargs)
+
+
+class GenericSelectInLoad(MapperOption):
+    def __init__(self, prop):
+        self.prop = prop
+
+    def process_query(self, query):
+        query._attributes[('generic_selectinload', self.prop)] = True
+
+
+def generic_selectinload(attr):
+    """
+    Return a query option that eager loads given generic relationship for
+    all the objects returned by the query. The targets are loaded with one
+    query per target class, instead of one query per object. ::
+
+
+        from sqlalchemy_utils import generic_selectinload
+
+
+        events = (
+            session.query(Event)
+            .options(generic_selectinload(Event.object))
+            .all()
+        )
+
+
+    Similar to SQLAlchemy's subqueryload, the discriminator and identifier
+    columns are first selected using the original query.
+
+    .. versionadded: 0.33.0
+
+    :param attr: generic relationship attribute
+    """
+    prop = attr.property
+    if not isinstance(prop, GenericRelationshipProperty):
+        raise TypeError(
+            "'%s' is not a generic relationship attribute." % attr
+        )
+    return GenericSelectInLoad(prop)
+
+
+def prefetch_generic(objects, attr):
+    """
+    Load the targets of given generic relationship for given objects with
+    one query per target class. Targets that are already present in the
+    identity map of the session are not queried again. After prefetching,
+    accessing the relationship of these objects does not issue any queries.
+    ::
+
+
+        from sqlalchemy_utils import prefetch_generic
+
+
+        events = session.query(Event).all()
+        prefetch_generic(events, Event.object)
+
+        for event in events:
+            event.object  # No SQL
+
+
+    Returns the list of targets in the same order as the given objects. If
+    the target of an object can not be found None is used in its place.
+
+    .. versionadded: 0.33.0
+
+    .. seealso:: :func:`generic_selectinload`
+
+    :param objects: list of objects with the generic relationship
+    :param attr: generic relationship attribute
+    """
+    prop = attr.property
+    if not isinstance(prop, GenericRelationshipProperty):
+        raise TypeError(
+            "'%s' is not a generic relationship attribute." % attr
+        )
+    states = [sa.inspect(obj) for obj in objects]
+    keys = []
+    ids = {}
+    for state in states:
+        impl = state.manager[prop.key].impl
+        key = (impl.get_state_discriminator(state), impl.get_state_id(state))
+        keys.append(key)
+        if prop.key not in state.dict and key[0] is not None:
+            ids.setdefault(key[0], set()).add(key[1])
+
+    session = next(
+        (state.session for state in states if state.session is not None),
+        None
+    )
+    targets = {}
+    if session is not None and ids:
+        targets = prop.fetch_targets(session, ids)
+
+    result = []
+    for state, key in zip(states, keys):
+        if prop.key in state.dict:
+            result.append(state.dict[prop.key])
+            continue
+        target = targets.get(key)
+        if state.session is not None:
+            state.dict[prop.key] = target
+        result.append(target)
+    return result
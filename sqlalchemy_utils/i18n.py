@@ -1,7 +1,13 @@
+import threading
+from contextlib import contextmanager
+
 import six
 import sqlalchemy as sa
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm.interfaces import LoaderStrategy
+from sqlalchemy.orm.strategies import LoadDeferredColumns
 from sqlalchemy.sql.expression import ColumnElement
 
 from .exceptions import ImproperlyConfigured
@@ -23,6 +29,43 @@ except ImportError:
         )
 
 
+_PER_OBJECT = object()
+_locale_cache = threading.local()
+
+
+@contextmanager
+def locale_cache():
+    """
+    Cache resolved locales for the duration of the with block. Inside the
+    block each locale callable of a :class:`TranslationHybrid` that takes no
+    arguments (for example ``get_locale``) is called only once, no matter how
+    many translated attributes are read. Callables that take the object as an
+    argument are still called for every object.
+
+    The cache is thread local. Nested blocks share the cache of the outermost
+    block.
+
+    ::
+
+        from sqlalchemy_utils import locale_cache
+
+
+        with locale_cache():
+            names = [article.name for article in articles]
+
+
+    .. versionadded: 0.33.0
+    """
+    if getattr(_locale_cache, 'locales', None) is not None:
+        yield
+        return
+    _locale_cache.locales = {}
+    try:
+        yield
+    finally:
+        _locale_cache.locales = None
+
+
 def cast_locale(obj, locale):
     """
     Cast given locale to string. Supports also callbacks that return locales.
@@ -42,15 +85,49 @@ def cast_locale(obj, locale):
     return locale
 
 
+def _cast_locale(obj, locale):
+    """
+    Cast given locale to string using the cache of the current
+    :func:`locale_cache` block, if any.
+    """
+    cache = getattr(_locale_cache, 'locales', None)
+    if cache is None or not callable(locale):
+        return cast_locale(obj, locale)
+    value = cache.get(locale)
+    if value is _PER_OBJECT:
+        return cast_locale(obj, locale(obj))
+    if value is None:
+        try:
+            value = locale()
+        except TypeError:
+            cache[locale] = _PER_OBJECT
+            return cast_locale(obj, locale(obj))
+        value = cache[locale] = cast_locale(obj, value)
+    return value
+
+
 class cast_locale_expr(ColumnElement):
     def __init__(self, cls, locale):
         self.cls = cls
         self.locale = locale
 
 
+def _get_projection(obj, key):
+    """
+    Return the translations of given object projected by
+    :func:`translation_only` or None if the object has no projected
+    translations or if the full translations are loaded.
+    """
+    if key in obj.__dict__:
+        return None
+    loader = sa.inspect(obj).callables
+    loader = loader.get(key) if loader else None
+    return getattr(loader, 'projection', None)
+
+
 @compiles(cast_locale_expr)
 def compile_cast_locale_expr(element, compiler, **kw):
-    locale = cast_locale(element.cls, element.locale)
+    locale = _cast_locale(element.cls, element.locale)
     if isinstance(locale, six.string_types):
         return "'{0}'".format(locale)
     return compiler.process(locale)
@@ -74,11 +151,22 @@ class TranslationHybrid(object):
         is no translation found for default locale it returns None.
         """
         def getter(obj):
-            current_locale = cast_locale(obj, self.current_locale)
+            current_locale = _cast_locale(obj, self.current_locale)
+            projection = _get_projection(obj, attr.key)
+            if projection is not None:
+                default_locale = _cast_locale(obj, self.default_locale)
+                if (
+                    current_locale in projection and
+                    default_locale in projection
+                ):
+                    value = projection[current_locale]
+                    if value is None:
+                        value = projection[default_locale]
+                    return self.default_value if value is None else value
             try:
                 return getattr(obj, attr.key)[current_locale]
             except (TypeError, KeyError):
-                default_locale = cast_locale(
+                default_locale = _cast_locale(
                     obj, self.default_locale
                 )
                 try:
@@ -91,7 +179,7 @@ class TranslationHybrid(object):
         def setter(obj, value):
             if getattr(obj, attr.key) is None:
                 setattr(obj, attr.key, {})
-            locale = cast_locale(obj, self.current_locale)
+            locale = _cast_locale(obj, self.current_locale)
             getattr(obj, attr.key)[locale] = value
         return setter
 
@@ -100,15 +188,259 @@ class TranslationHybrid(object):
             cls_attr = getattr(cls, attr.key)
             current_locale = cast_locale_expr(cls, self.current_locale)
             default_locale = cast_locale_expr(cls, self.default_locale)
-            return sa.func.coalesce(
+            expr = sa.func.coalesce(
                 cls_attr[current_locale],
                 cls_attr[default_locale]
             )
+            expr._translation_hybrid = (self, cls, attr)
+            return expr
         return expr
 
+    def index(self, attr, locales, name=None, **kwargs):
+        """
+        Create an expression index for each of the given locales. Each index
+        is built on the same expression the hybrid compiles to when the
+        current locale is the given locale, so that PostgreSQL can use it
+        for filtering and sorting by the translated attribute.
+
+        The indexes are attached to the table of the translation column and
+        are created along with it. ::
+
+            class Article(Base):
+                __tablename__ = 'article'
+                id = sa.Column(sa.Integer, primary_key=True)
+                name_translations = sa.Column(HSTORE)
+                name = translation_hybrid(name_translations)
+
+
+            translation_hybrid.index(Article.name_translations, ['fi', 'en'])
+
+            session.query(Article).order_by(Article.name)
+            # uses ix_article_name_translations_fi when current locale is 'fi'
+
+        :param attr:
+            Translation column or class attribute of the translation column.
+            Class attribute is needed if the default locale is a callable
+            taking the object as an argument.
+        :param locales: Locales to create the indexes for.
+        :param name:
+            Index name format string. Defaults to
+            ``'ix_%(table)s_%(column)s_%(locale)s'``.
+        :param kwargs: Additional keyword arguments passed to Index.
+        :returns: List of created Index objects.
+
+        .. versionadded: 0.33.0
+        """
+        cls = getattr(attr, 'class_', None)
+        column = getattr(attr, 'property', attr)
+        column = getattr(column, 'columns', [column])[0]
+        if getattr(column, 'table', None) is None:
+            raise ValueError(
+                'Translation column {0!r} is not attached to a table.'
+                .format(column)
+            )
+        if name is None:
+            name = 'ix_%(table)s_%(column)s_%(locale)s'
+        default_locale = cast_locale_expr(cls, self.default_locale)
+        indexes = []
+        for locale in locales:
+            locale = cast_locale(cls, locale)
+            indexes.append(sa.Index(
+                name % {
+                    'table': column.table.name,
+                    'column': column.name,
+                    'locale': locale
+                },
+                sa.func.coalesce(
+                    column[cast_locale_expr(cls, locale)],
+                    column[default_locale]
+                ),
+                **kwargs
+            ))
+        return indexes
+
     def __call__(self, attr):
         return hybrid_property(
             fget=self.getter_factory(attr),
             fset=self.setter_factory(attr),
             expr=self.expr_factory(attr)
         )
+
+
+class ProjectedColumnLoader(LoadDeferredColumns):
+    """
+    Deferred loader of a translation column loaded with
+    :func:`translation_only`. Holds the projected translations until the
+    column is loaded or expired.
+    """
+    def __init__(self, key, projection):
+        LoadDeferredColumns.__init__(self, key)
+        self.projection = projection
+
+
+@ColumnProperty.strategy_for(translation_only=True)
+class TranslationOnlyLoader(LoaderStrategy):
+    """
+    Column loader strategy that selects the projected translations instead
+    of the translation column and defers the column itself. Relies on the
+    loader strategy API of SQLAlchemy 1.1 and later.
+    """
+    def __init__(self, parent, strategy_key):
+        LoaderStrategy.__init__(self, parent, strategy_key)
+        # ProjectedColumnLoader loads the column using the deferred strategy
+        self.deferred = self.parent_property._get_strategy(
+            (('deferred', True), ('instrument', True))
+        )
+        self.default = self.parent_property._get_strategy(
+            (('deferred', False), ('instrument', True))
+        )
+
+    def _get_columns(self, loadopt):
+        hybrid = loadopt.local_opts['translation_hybrid']
+        locale = loadopt.local_opts['translation_locale']
+        cls = self.parent.class_
+        column = self.parent_property.columns[0]
+        columns = []
+        locales = []
+        for locale in (
+            hybrid.current_locale if locale is None else locale,
+            hybrid.default_locale
+        ):
+            locale = _cast_locale(cls, locale)
+            if hasattr(locale, '__clause_element__'):
+                locale = locale.__clause_element__()
+            if any(
+                locale is other or (
+                    isinstance(locale, six.string_types) and
+                    isinstance(other, six.string_types) and
+                    locale == other
+                )
+                for other in locales
+            ):
+                continue
+            locales.append(locale)
+            value_col = column[locale].label(None)
+            if isinstance(locale, six.string_types):
+                columns.append((locale, None, value_col))
+            else:
+                columns.append((None, locale.label(None), value_col))
+        return columns
+
+    def setup_query(
+        self,
+        context,
+        entity,
+        path,
+        loadopt,
+        adapter,
+        column_collection,
+        memoized_populators,
+        only_load_props=None,
+        **kwargs
+    ):
+        if only_load_props and self.key in only_load_props:
+            return self.default.setup_query(
+                context, entity, path, loadopt, adapter,
+                column_collection, memoized_populators, **kwargs
+            )
+        columns = self._get_columns(loadopt)
+        if adapter:
+            columns = [
+                (
+                    locale,
+                    None if locale_col is None else
+                    adapter.columns[locale_col],
+                    adapter.columns[value_col]
+                )
+                for locale, locale_col, value_col in columns
+            ]
+        for locale, locale_col, value_col in columns:
+            if locale_col is not None:
+                column_collection.append(locale_col)
+            column_collection.append(value_col)
+        path.set(context.attributes, ('translation_only', self.key), columns)
+
+    def create_row_processor(
+        self,
+        context,
+        path,
+        loadopt,
+        mapper,
+        result,
+        adapter,
+        populators
+    ):
+        columns = path.get(context.attributes, ('translation_only', self.key))
+        if columns is None:
+            return self.default.create_row_processor(
+                context, path, loadopt, mapper, result, adapter, populators
+            )
+        getters = []
+        for locale, locale_col, value_col in columns:
+            value_getter = result._getter(value_col, False)
+            if value_getter is None:
+                return
+            if locale_col is not None:
+                locale = result._getter(locale_col, False)
+                if locale is None:
+                    return
+            getters.append((locale_col is not None, locale, value_getter))
+        key = self.key
+
+        def load_projection(state, dict_, row):
+            projection = {}
+            for dynamic, locale, value_getter in getters:
+                if dynamic:
+                    projection[locale(row)] = value_getter(row)
+                else:
+                    projection[locale] = value_getter(row)
+            if 'callables' not in state.__dict__:
+                state.callables = {}
+            state.callables[key] = ProjectedColumnLoader(key, projection)
+
+        populators['new'].append((key, load_projection))
+
+
+def translation_only(attr, locale=None):
+    """
+    Return a query option that loads only the current and the default
+    translation of given translation hybrid instead of the whole translation
+    column. The projected translations are used by the hybrid when reading
+    the translated attribute. ::
+
+
+        from sqlalchemy_utils import translation_only
+
+
+        articles = (
+            session.query(Article)
+            .options(translation_only(Article.name))
+            .all()
+        )
+
+        for article in articles:
+            article.name  # No SQL
+
+
+    If the current locale at the time of reading differs from the projected
+    one, or if the translations are modified, the whole translation column
+    is loaded as usual.
+
+    .. versionadded: 0.33.0
+
+    :param attr: translation hybrid attribute
+    :param locale:
+        Locale to load instead of the current locale of the translation
+        hybrid. Can be a locale string, Locale object or a callable.
+    """
+    try:
+        hybrid, cls, column = attr._translation_hybrid
+    except AttributeError:
+        raise TypeError(
+            "'%s' is not a translation hybrid attribute." % attr
+        )
+    return sa.orm.Load(cls).set_column_strategy(
+        [column.key],
+        {'translation_only': True},
+        opts={'translation_hybrid': hybrid, 'translation_locale': locale}
+    )
@@ -1,3 +1,6 @@
+import itertools
+import weakref
+
 import sqlalchemy as sa
 
 from .exceptions import ImproperlyConfigured
@@ -21,13 +24,72 @@ def coercion_listener(mapper, class_):
         )
 
 
+_instant_defaults = weakref.WeakKeyDictionary()
+
+
+def instant_defaults_configured_listener(mapper, class_):
+    """
+    Precomputes the instant defaults of given class as a tuple of (key,
+    value, is_callable) triples.
+    """
+    defaults = []
+    for key, column in mapper.columns.items():
+        default = getattr(column, 'default', None)
+        if default is not None and hasattr(default, 'arg'):
+            defaults.append((key, default.arg, callable(default.arg)))
+    _instant_defaults[class_] = tuple(defaults)
+    return _instant_defaults[class_]
+
+
+def _get_instant_defaults(class_):
+    try:
+        return _instant_defaults[class_]
+    except KeyError:
+        return instant_defaults_configured_listener(
+            sa.inspect(class_),
+            class_
+        )
+
+
 def instant_defaults_listener(target, args, kwargs):
-    for key, column in sa.inspect(target.__class__).columns.items():
-        if hasattr(column, 'default') and column.default is not None:
-            if callable(column.default.arg):
-                setattr(target, key, column.default.arg(target))
-            else:
-                setattr(target, key, column.default.arg)
+    for key, value, is_callable in _get_instant_defaults(target.__class__):
+        if is_callable:
+            setattr(target, key, value(target))
+        else:
+            setattr(target, key, value)
+
+
+def apply_instant_defaults(objects):
+    """
+    Assign column defaults to given objects for the attributes that have not
+    been set. This is useful for objects constructed in bulk without the
+    :func:`force_instant_defaults` listener. ::
+
+
+        from sqlalchemy_utils import apply_instant_defaults
+
+
+        documents = apply_instant_defaults(
+            [Document(name=name) for name in names]
+        )
+        documents[0].created_at  # datetime object
+
+
+    .. versionadded: 0.33.0
+
+    :param objects: iterable of model objects
+    :return: list of given objects
+    """
+    objects = list(objects)
+    for obj in objects:
+        dict_ = sa.inspect(obj).dict
+        for key, value, is_callable in _get_instant_defaults(obj.__class__):
+            if key not in dict_:
+                if is_callable:
+                    setattr(obj, key, value(obj))
+                else:
+                    setattr(obj, key, value)
+    return objects
 
 
 def force_auto_coercion(mapper=None):
@@ -115,6 +177,11 @@ def force_instant_defaults(mapper=None):
     """
     if mapper is None:
         mapper = sa.orm.mapper
+    sa.event.listen(
+        mapper,
+        'mapper_configured',
+        instant_defaults_configured_listener
+    )
     sa.event.listen(mapper, 'init', instant_defaults_listener)
 
 
@@ -221,6 +288,11 @@ def auto_delete_orphans(attr):
 
         assert s.query(Tag).count() == 2
 
+    Only the tags removed in the flush, from either side of the relationship,
+    are checked for being orphans. If a deleted Entry's tags have not been
+    loaded (for example when using passive_deletes), all the tags are
+    checked.
+
     .. versionadded: 0.26.4
 
     :param attr: Association relationship attribute to auto delete orphans from
@@ -238,28 +310,199 @@ def auto_delete_orphans(attr):
     if isinstance(backref, tuple):
         backref = backref[0]
 
+    primary_key = sa.inspect(target_class).primary_key
+
+    def removed_targets(session):
+        """
+        Return the identities of the target objects that were removed from
+        the collections of the parent objects, or whose parents were removed
+        through the backref, in this flush. Return None if they can not be
+        determined without loading the collections.
+        """
+        identities = set()
+        for obj in session.dirty:
+            if isinstance(obj, parent_class):
+                history = sa.orm.attributes.get_history(
+                    obj,
+                    attr.key,
+                    passive=sa.orm.attributes.PASSIVE_NO_INITIALIZE
+                )
+                identities.update(
+                    sa.inspect(target).identity
+                    for target in history.deleted or ()
+                )
+            elif isinstance(obj, target_class):
+                # Removals made through the backref side do not show up in
+                # the history of unloaded parent collections.
+                history = sa.orm.attributes.get_history(
+                    obj,
+                    backref,
+                    passive=sa.orm.attributes.PASSIVE_NO_INITIALIZE
+                )
+                if history.deleted:
+                    identities.add(sa.inspect(obj).identity)
+        for obj in session.deleted:
+            if isinstance(obj, parent_class):
+                if attr.key not in sa.inspect(obj).dict:
+                    return None
+                history = sa.orm.attributes.get_history(
+                    obj,
+                    attr.key,
+                    passive=sa.orm.attributes.PASSIVE_NO_INITIALIZE
+                )
+                identities.update(
+                    sa.inspect(target).identity
+                    for target in history.sum() or ()
+                )
+        identities.discard(None)
+        return identities
+
     @sa.event.listens_for(sa.orm.Session, 'after_flush')
     def delete_orphan_listener(session, ctx):
-        # Look through Session state to see if we want to emit a DELETE for
+        # Look through Session state to see which targets may have become
         # orphans
-        orphans_found = (
-            any(
-                isinstance(obj, parent_class) and
-                sa.orm.attributes.get_history(obj, attr.key).deleted
-                for obj in session.dirty
-            ) or
-            any(
-                isinstance(obj, parent_class)
-                for obj in session.deleted
-            )
+        identities = removed_targets(session)
+        if identities is not None and not identities:
+            return
+
+        query = session.query(target_class).filter(
+            ~getattr(target_class, backref).any()
+        )
+        if identities is not None:
+            # Only check the targets removed in this flush
+            if len(primary_key) == 1:
+                query = query.filter(
+                    primary_key[0].in_(
+                        [identity[0] for identity in identities]
+                    )
+                )
+            else:
+                query = query.filter(
+                    sa.tuple_(*primary_key).in_(list(identities))
+                )
+        query.delete(synchronize_session=False)
+
+
+def _get_table_columns(mapper):
+    """
+    Return (key, column) pairs of the column properties of given mapper that
+    map to table columns. Column properties of SQL expressions are left out.
+    """
+    return [
+        (prop.key, prop.columns[0])
+        for prop in mapper.column_attrs
+        if isinstance(prop.columns[0], sa.Column) and
+        prop.columns[0].table in mapper.tables
+    ]
+
+
+def _get_coercers(mapper):
+    coercers = []
+    for key, column in _get_table_columns(mapper):
+        if hasattr(column.type, 'coercion_listener'):
+            coercers.append((key, column.type._coerce))
+    return coercers
+
+
+def bulk_insert(session, model, rows, chunk_size=1000, defaults=True):
+    """
+    Insert given rows of given model in chunks using executemany. Before
+    inserting, the values of coercion capable data types are coerced the
+    same way :func:`force_auto_coercion` coerces attribute values and the
+    missing values are filled with the column defaults the same way as
+    :func:`force_instant_defaults` does. This gives the same values as
+    constructing and adding model objects without the overhead of the unit
+    of work. ::
+
+
+        from sqlalchemy_utils import bulk_insert
+
+
+        bulk_insert(
+            session,
+            Document,
+            [
+                {'name': u'Some document', 'background_color': 'F5F5F5'},
+                {'name': u'Other document', 'background_color': 'FFFFFF'}
+            ]
         )
 
-        if orphans_found:
-            # Emit a DELETE for all orphans
-            (
-                session.query(target_class)
-                .filter(
-                    ~getattr(target_class, backref).any()
+
+    The keys of the rows are attribute names. Models that use inheritance
+    are inserted using `Session.bulk_insert_mappings`, other models using
+    Core insert. Given row dicts are not modified.
+
+    .. versionadded: 0.33.0
+
+    :param session: SQLAlchemy Session object
+    :param model: declarative model class
+    :param rows: iterable of dicts
+    :param chunk_size: number of rows inserted using one executemany
+    :param defaults: whether or not to fill the missing column defaults
+    :return: number of inserted rows
+    """
+    mapper = sa.inspect(model)
+    columns = _get_table_columns(mapper)
+    coercers = _get_coercers(mapper)
+    # SQL expression defaults are left for Core to render.
+    instant_defaults = [
+        (key, value, is_callable)
+        for key, value, is_callable in (
+            _get_instant_defaults(model) if defaults else ()
+        )
+        if not isinstance(value, sa.sql.ClauseElement)
+    ]
+    # Keys that can be set to NULL explicitly when missing so that the rows
+    # of a chunk have the same keys and can be sent using one executemany.
+    nullable_keys = set(
+        key for key, column in columns
+        if not column.primary_key and
+        column.default is None and
+        column.server_default is None
+    )
+    column_keys = dict((key, column.key) for key, column in columns)
+    # Session.bulk_insert_mappings leaves out the keys with None values, so
+    # plain single table models are inserted using Core.
+    use_core = len(mapper.tables) == 1 and mapper.polymorphic_on is None
+    rows = iter(rows)
+    count = 0
+    while True:
+        chunk = [dict(row) for row in itertools.islice(rows, chunk_size)]
+        if not chunk:
+            break
+        for key, coerce in coercers:
+            for row in chunk:
+                if key in row:
+                    row[key] = coerce(row[key])
+        for key, value, is_callable in instant_defaults:
+            for row in chunk:
+                if key not in row:
+                    row[key] = value(None) if is_callable else value
+        keys = set()
+        for row in chunk:
+            keys.update(nullable_keys.intersection(row))
+        for row in chunk:
+            for key in keys:
+                row.setdefault(key, None)
+        if use_core:
+            # Rows that still have different keys, for example because of
+            # missing server defaults, are sent in separate executemany
+            # calls. Consecutive rows are grouped to keep the row order.
+            for _, group in itertools.groupby(
+                chunk,
+                lambda row: frozenset(row)
+            ):
+                session.execute(
+                    mapper.local_table.insert(),
+                    [
+                        dict(
+                            (column_keys.get(key, key), value)
+                            for key, value in row.items()
+                        )
+                        for row in group
+                    ]
                 )
-                .delete(synchronize_session=False)
-            )
+        else:
+            session.bulk_insert_mappings(model, chunk)
+        count += len(chunk)
+    return count
@@ -1,13 +1,18 @@
+import weakref
+
 import sqlalchemy as sa
 
+from .utils import LRUCache
+
 
 class ProxyDict(object):
-    def __init__(self, parent, collection_name, mapping_attr):
+    def __init__(self, parent, collection_name, mapping_attr, max_size=None):
         self.parent = parent
         self.collection_name = collection_name
         self.child_class = mapping_attr.class_
         self.key_name = mapping_attr.key
-        self.cache = {}
+        self.cache = {} if max_size is None else LRUCache(max_size)
+        self.loaded = False
 
     @property
     def collection(self):
@@ -25,13 +30,71 @@ class ProxyDict(object):
     def has_key(self, key):
         return self.__contains__(key)
 
+    @property
+    def _can_fetch(self):
+        return (
+            sa.orm.object_session(self.parent) is not None and
+            sa.orm.util.has_identity(self.parent)
+        )
+
+    @property
+    def _complete(self):
+        """
+        Whether or not the whole collection is in the cache.
+        """
+        return self.loaded and not getattr(self.cache, 'evicted', False)
+
     def fetch(self, key):
-        session = sa.orm.object_session(self.parent)
-        if session and sa.orm.util.has_identity(self.parent):
+        if self._complete:
+            # The whole collection is in the cache, hence the key is absent.
+            return self.cache.setdefault(key, None)
+        if self._can_fetch:
             obj = self.collection.filter_by(**{self.key_name: key}).first()
             self.cache[key] = obj
             return obj
 
+    def preload(self):
+        """
+        Load the whole collection into the cache using one query. After
+        preloading, absent keys are not queried until the parent object is
+        expired.
+        """
+        if self._can_fetch:
+            self.cache.clear()
+            if isinstance(self.cache, LRUCache):
+                self.cache.evicted = False
+            for obj in self.collection:
+                self.cache[getattr(obj, self.key_name)] = obj
+            self.loaded = True
+        return self
+
+    def get_many(self, keys):
+        """
+        Return a dict of the objects for given keys. Keys that are not in the
+        cache are fetched using one query. Keys without objects are not
+        included in the returned dict and they are cached as absent, so
+        that they are not queried again until the parent object is expired.
+
+        :param keys: keys to fetch
+        """
+        result = {}
+        missing = []
+        for key in keys:
+            if key in self.cache:
+                if self.cache[key] is not None:
+                    result[key] = self.cache[key]
+            else:
+                missing.append(key)
+        if missing and not self._complete and self._can_fetch:
+            descriptor = getattr(self.child_class, self.key_name)
+            for obj in self.collection.filter(descriptor.in_(missing)):
+                key = getattr(obj, self.key_name)
+                self.cache[key] = result[key] = obj
+            for key in missing:
+                if key not in result:
+                    self.cache[key] = None
+        return result
+
     def create_new_instance(self, key):
         value = self.child_class(**{self.key_name: key})
         self.collection.append(value)
@@ -59,7 +122,27 @@ class ProxyDict(object):
         self.cache[key] = value
 
 
-def proxy_dict(parent, collection_name, mapping_attr):
+_proxy_dict_classes = weakref.WeakSet()
+
+
+def proxy_dict(parent, collection_name, mapping_attr, max_size=None):
+    """
+    Return :class:`ProxyDict` for given collection of given parent object.
+    The proxy dicts are cached per parent object and collection and they are
+    cleared when the collection or the whole parent object is expired.
+
+    :param parent: parent object
+    :param collection_name: name of the dynamic relationship of parent
+    :param mapping_attr: attribute of the child class used as the key
+    :param max_size:
+        Maximum number of keys to cache. If given, the least recently used
+        keys are evicted from the cache when it grows full.
+    """
+    class_ = type(parent)
+    if class_ not in _proxy_dict_classes:
+        sa.event.listen(class_, 'expire', expire_proxy_dicts)
+        _proxy_dict_classes.add(class_)
+
     try:
         parent._proxy_dicts
     except AttributeError:
@@ -71,14 +154,17 @@ def proxy_dict(parent, collection_name, mapping_attr):
         parent._proxy_dicts[collection_name] = ProxyDict(
             parent,
             collection_name,
-            mapping_attr
+            mapping_attr,
+            max_size=max_size
         )
     return parent._proxy_dicts[collection_name]
 
 
-def expire_proxy_dicts(target, context):
-    if hasattr(target, '_proxy_dicts'):
+def expire_proxy_dicts(target, attrs):
+    if not hasattr(target, '_proxy_dicts'):
+        return
+    if attrs is None:
         target._proxy_dicts = {}
-
-
-sa.event.listen(sa.orm.mapper, 'expire', expire_proxy_dicts)
+    else:
+        for attr in attrs:
+            target._proxy_dicts.pop(attr, None)
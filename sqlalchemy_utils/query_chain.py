@@ -104,8 +104,218 @@ with :meth:`~QueryChain.count`::
     15
 
 
+UNION ALL mode
+^^^^^^^^^^^^^^
+
+By default the queries of the chain are executed one after another. If the
+queries select the same entities (or columns) the chain can be compiled into
+a single UNION ALL statement by passing ``union_all=True``. The limit and
+offset are then applied to the whole statement on the server, hence deep
+paging takes only one round trip.
+
+::
+
+    chain = QueryChain(
+        [
+            session.query(Article).filter(Article.is_featured),
+            session.query(Article).filter(~Article.is_featured)
+        ],
+        union_all=True
+    )
+
+    list(chain[1000:1010])  # Executes a single query
+
+    chain.count()  # Executes a single COUNT query
+
+
+The order of the chain is preserved by numbering the rows of each query
+with a ``row_number()`` window function, which needs to be supported by the
+database (PostgreSQL, SQLite >= 3.25, MySQL >= 8.0).
+
+
+Streaming
+^^^^^^^^^
+
+Iterating a chain loads the full result of each query at once. Chains over
+large results can be streamed with :meth:`~QueryChain.stream`, which fetches
+the rows of each query in batches using ``yield_per`` and server side
+cursors (where supported by the driver).
+
+::
+
+    for article in chain.stream(batch_size=1000):
+        export(article)
+
+
+    def report(batch):
+        print('Exported %d rows' % len(batch))
+
+
+    for batch in chain.stream(batch_size=1000, batches=True, callback=report):
+        export_many(batch)
+
+
+Concurrent execution
+^^^^^^^^^^^^^^^^^^^^
+
+The queries of a chain are often independent of each other. By passing an
+executor (for example :class:`concurrent.futures.ThreadPoolExecutor`) the
+queries are executed concurrently, each on its own session and connection.
+The results are merged into the session of the original query in the order of
+the chain, hence the latency of the chain becomes the latency of its slowest
+query.
+
+::
+
+    from concurrent.futures import ThreadPoolExecutor
+
+
+    chain = QueryChain(
+        [
+            session.query(BlogPost),
+            session.query(Article),
+            session.query(NewsItem)
+        ],
+        executor=ThreadPoolExecutor(max_workers=3)
+    )
+
+    list(chain[5:10])
+
+
+When a limit is given each query fetches at most ``offset + limit`` rows.
+
+.. note::
+    As the queries are executed on separate connections they do not see the
+    uncommitted changes of the original session.
+
+
+Ordered merge
+^^^^^^^^^^^^^
+
+Normally the results of the queries are simply concatenated. With
+:meth:`~QueryChain.merge_by` the chain presents a globally ordered feed, for
+example the latest activity across several tables. Only about ``offset +
+limit`` rows are read from each query.
+
+::
+
+    chain = QueryChain(
+        [
+            session.query(BlogPost),
+            session.query(Article),
+            session.query(NewsItem)
+        ]
+    ).merge_by('created_at', desc=True)
+
+    list(chain[0:20])
 """
+import heapq
 from copy import copy
+from itertools import islice
+
+import six
+import sqlalchemy as sa
+
+from .functions.orm import get_query_descriptor
+
+
+def _fetch(query, bind, limit):
+    session = sa.orm.Session(bind=bind)
+    try:
+        if limit:
+            query = query.limit(limit)
+        return query.with_session(session).all()
+    finally:
+        session.close()
+
+
+def _count(query, bind):
+    session = sa.orm.Session(bind=bind)
+    try:
+        return query.with_session(session).count()
+    finally:
+        session.close()
+
+
+class _Reversed(object):
+    __slots__ = ('value', )
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def _heap_merge(iterables, key, reverse=False):
+    heap = []
+    iterators = [iter(iterable) for iterable in iterables]
+
+    def push(index):
+        for row in iterators[index]:
+            value = key(row)
+            # NULL values are ordered last in both directions, the same way
+            # as the queries built by QueryChain.merge_by order them.
+            if reverse:
+                value = (value is None, _Reversed(value))
+            else:
+                value = (value is None, value)
+            heapq.heappush(heap, (value, index, row))
+            return
+
+    for index in range(len(iterators)):
+        push(index)
+    while heap:
+        value, index, row = heapq.heappop(heap)
+        yield row
+        push(index)
+
+
+def _merge_row(session, row):
+    if isinstance(row, tuple) and hasattr(row, 'keys'):
+        return sa.util.KeyedTuple(
+            [_merge_row(session, value) for value in row],
+            row.keys()
+        )
+    if hasattr(row, '_sa_instance_state'):
+        # Objects already in the session may have unflushed changes, hence
+        # they are returned as is instead of merging the fetched state.
+        obj = session.identity_map.get(sa.inspect(row).key)
+        if obj is not None:
+            return obj
+        return session.merge(row, load=False)
+    return row
+
+
+def _merge_rows(session, rows):
+    for row in rows:
+        yield _merge_row(session, row)
+
+
+def _get_merge_expression(query, key):
+    expr = get_query_descriptor(query, None, key)
+    if isinstance(expr, six.string_types):
+        # Labels are ordered by the labeled expression, since output column
+        # names can not be used inside ORDER BY expressions on all databases.
+        for description in query.column_descriptions:
+            if description['name'] == key:
+                expr = description['expr']
+        if isinstance(expr, sa.sql.elements.Label):
+            expr = expr.element
+    return expr
+
+
+def _unordered(query):
+    """
+    Return given query without ORDER BY. Queries with LIMIT or OFFSET are
+    wrapped in a subquery, which keeps their ordering inside the subquery.
+    """
+    if query._limit is not None or query._offset is not None:
+        return query.from_self()
+    return query.order_by(None)
 
 
 class QueryChain(object):
@@ -117,15 +327,112 @@ class QueryChain(object):
         limiting the number of results for the whole query chain.
     :param offset: Similar to normal query offset this parameter can be used
         for offsetting the query chain as a whole.
+    :param union_all:
+        Whether or not to execute the queries as a single UNION ALL statement.
+        All queries need to select the same entities or columns.
+    :param executor:
+        An executor object (for example
+        :class:`concurrent.futures.ThreadPoolExecutor`) for executing the
+        queries concurrently.
 
     .. versionadded: 0.26.0
+
+    .. versionchanged: 0.33.0
+        Added union_all and executor parameters.
     """
-    def __init__(self, queries, limit=None, offset=None):
+    def __init__(
+        self,
+        queries,
+        limit=None,
+        offset=None,
+        union_all=False,
+        executor=None
+    ):
         self.queries = queries
         self._limit = limit
         self._offset = offset
+        self._union_all = union_all
+        self._executor = executor
+        self._merge_key = None
+        self._merge_desc = False
+
+    def _union_all_query(self):
+        queries = [
+            _unordered(query).add_columns(
+                sa.literal(index).label('_chain_index'),
+                sa.func.row_number().over(
+                    order_by=query._order_by or None
+                ).label('_chain_position')
+            )
+            for index, query in enumerate(self.queries)
+        ]
+        query = queries[0].union_all(*queries[1:]).order_by(
+            sa.literal_column('_chain_index'),
+            sa.literal_column('_chain_position')
+        )
+        if self._limit:
+            query = query.limit(self._limit)
+        if self._offset:
+            query = query.offset(self._offset)
+        return query
+
+    def _iter_union_all(self):
+        descriptions = self.queries[0].column_descriptions
+        single_entity = (
+            len(descriptions) == 1 and
+            descriptions[0]['expr'] is descriptions[0]['entity']
+        )
+        for row in self._union_all_query():
+            if single_entity:
+                yield row[0]
+            else:
+                yield sa.util.KeyedTuple(row[:-2], row.keys()[:-2])
+
+    def _submit(self, queries, func, *args):
+        futures = []
+        for query in queries:
+            bind = query.session.get_bind(query._bind_mapper())
+            if isinstance(bind, sa.engine.Connection):
+                bind = bind.engine
+            futures.append(self._executor.submit(func, query, bind, *args))
+        return futures
+
+    def _iter_concurrently(self):
+        limit = None
+        if self._limit:
+            limit = self._limit + (self._offset or 0)
+        futures = self._submit(self.queries, _fetch, limit)
+
+        consumed = 0
+        skipped = 0
+        try:
+            for query, future in zip(self.queries, futures):
+                for row in future.result():
+                    if self._offset and skipped < self._offset:
+                        skipped += 1
+                        continue
+                    if self._limit and consumed >= self._limit:
+                        return
+                    consumed += 1
+                    yield _merge_row(query.session, row)
+        finally:
+            for future in futures:
+                future.cancel()
 
     def __iter__(self):
+        if self._merge_key is not None:
+            for obj in self._iter_merged():
+                yield obj
+            return
+        if self._union_all:
+            for obj in self._iter_union_all():
+                yield obj
+            return
+        if self._executor is not None:
+            for obj in self._iter_concurrently():
+                yield obj
+            return
+
         consumed = 0
         skipped = 0
         for query in self.queries:
@@ -146,6 +453,127 @@ class QueryChain(object):
             else:
                 skipped += obj_count
 
+    def merge_by(self, key, desc=False):
+        """
+        Return a new QueryChain that presents the results of its queries in
+        a global order. Each query is ordered by given key and limited to
+        ``offset + limit`` rows, after which the results are merged with a
+        streaming heap merge.
+
+        ::
+
+            chain = QueryChain(
+                [session.query(Article), session.query(BlogPost)]
+            ).merge_by('created_at', desc=True)
+
+            list(chain[0:10])  # The ten latest articles and blog posts
+
+
+        :param key:
+            Name of the attribute or label to order the results by. Each
+            query needs to have an attribute or label with this name.
+        :param desc: Whether or not to order the results in descending order
+
+        Rows with NULL keys are ordered last regardless of the direction.
+        Queries that are already limited are wrapped in a subquery, hence
+        their own limits apply before the merge.
+
+        .. versionadded: 0.33.0
+        """
+        chain = copy(self)
+        chain._merge_key = key
+        chain._merge_desc = desc
+        return chain
+
+    def _merge_queries(self):
+        func = sa.desc if self._merge_desc else sa.asc
+        queries = []
+        for query in self.queries:
+            order_by = query._order_by or ()
+            if query._limit is not None or query._offset is not None:
+                # Limited queries are ordered outside of a subquery, which
+                # keeps their own ordering and limits intact.
+                query = query.from_self()
+            expr = _get_merge_expression(query, self._merge_key)
+            if expr is None:
+                raise ValueError(
+                    "Could not order query %r by '%s'." % (
+                        query, self._merge_key
+                    )
+                )
+            queries.append(
+                query.order_by(None).order_by(
+                    expr.is_(None),
+                    func(expr),
+                    *order_by
+                )
+            )
+        return queries
+
+    def _iter_merged(self):
+        queries = self._merge_queries()
+        limit = None
+        if self._limit:
+            limit = self._limit + (self._offset or 0)
+
+        if self._executor is not None:
+            futures = self._submit(queries, _fetch, limit)
+            sources = [
+                _merge_rows(query.session, future.result())
+                for query, future in zip(queries, futures)
+            ]
+        else:
+            sources = [
+                query.limit(limit) if limit else query for query in queries
+            ]
+
+        rows = _heap_merge(
+            sources,
+            key=lambda row: getattr(row, self._merge_key),
+            reverse=self._merge_desc
+        )
+        stop = None
+        if self._limit:
+            stop = (self._offset or 0) + self._limit
+        return islice(rows, self._offset or 0, stop)
+
+    def stream(self, batch_size=1000, batches=False, callback=None):
+        """
+        Iterate through the results of this QueryChain in batches of given
+        size. Each query is executed with ``yield_per`` and the
+        ``stream_results`` execution option, hence the memory usage stays
+        bounded regardless of the result size.
+
+        :param batch_size: Number of rows to fetch at a time
+        :param batches:
+            Whether or not to yield lists of rows instead of individual rows
+        :param callback:
+            Optional callable that is called with each batch of rows, for
+            example for progress reporting
+
+        .. versionadded: 0.33.0
+        """
+        chain = copy(self)
+        chain.queries = [
+            query
+            .yield_per(batch_size)
+            .execution_options(stream_results=True)
+            for query in self.queries
+        ]
+        chain._executor = None
+        rows = iter(chain)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            if callback is not None:
+                callback(batch)
+            if batches:
+                yield batch
+            else:
+                for row in batch:
+                    yield row
+
     def limit(self, value):
         return self[:value]
 
@@ -155,16 +583,24 @@ class QueryChain(object):
     def count(self):
         """
         Return the total number of rows this QueryChain's queries would return.
+        In UNION ALL mode a single COUNT query is executed.
         """
+        if self._union_all:
+            queries = [_unordered(query) for query in self.queries]
+            return queries[0].union_all(*queries[1:]).count()
+        if self._executor is not None:
+            futures = self._submit(self.queries, _count)
+            return sum(future.result() for future in futures)
         return sum(q.count() for q in self.queries)
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return self.__class__(
-                queries=self.queries,
-                limit=key.stop if key.stop is not None else self._limit,
-                offset=key.start if key.start is not None else self._offset
-            )
+            chain = copy(self)
+            if key.stop is not None:
+                chain._limit = key.stop
+            if key.start is not None:
+                chain._offset = key.start
+            return chain
         else:
             for obj in self[key:1]:
                 return obj
@@ -1,5 +1,5 @@
 import sys
-from collections import Iterable
+from collections import Iterable, OrderedDict
 
 import six
 
@@ -27,3 +27,46 @@ def starts_with(iterable, prefix):
     Returns whether or not given iterable starts with given prefix.
     """
     return list(iterable)[0:len(prefix)] == list(prefix)
+
+
+class LRUCache(OrderedDict):
+    """
+    Dict that holds at most `max_size` keys. When full, setting a new key
+    evicts the least recently used key.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.evicted = False
+        OrderedDict.__init__(self)
+
+    def _touch(self, key):
+        value = OrderedDict.__getitem__(self, key)
+        OrderedDict.__delitem__(self, key)
+        OrderedDict.__setitem__(self, key, value)
+        return value
+
+    def __getitem__(self, key):
+        return self._touch(key)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self._touch(key)
+        return default
+
+    def __setitem__(self, key, value):
+        if key in self:
+            OrderedDict.__delitem__(self, key)
+        OrderedDict.__setitem__(self, key, value)
+        while len(self) > self.max_size:
+            OrderedDict.__delitem__(self, next(iter(self)))
+            self.evicted = True
+
+    def items(self):
+        # Iterating does not count as using the keys.
+        return [(key, OrderedDict.__getitem__(self, key)) for key in self]
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self._touch(key)
+        self[key] = default
+        return default
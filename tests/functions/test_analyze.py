@@ -1,6 +1,63 @@
+import json
+
 import pytest
 
-from sqlalchemy_utils import analyze
+from sqlalchemy_utils import analyze, compare_plans
+from sqlalchemy_utils.functions import QueryAnalysis
+
+
+def make_analysis(plan, runtime=1.0):
+    return QueryAnalysis([{
+        'Plan': plan,
+        'Planning Time': 0.0,
+        'Execution Time': runtime
+    }])
+
+
+def hash_join(category_scan):
+    return {
+        'Node Type': 'Hash Join',
+        'Plan Rows': 1000,
+        'Actual Rows': 1000,
+        'Actual Loops': 1,
+        'Plans': [
+            {
+                'Node Type': 'Seq Scan',
+                'Relation Name': 'article',
+                'Plan Rows': 1000,
+                'Actual Rows': 1000,
+                'Actual Loops': 1,
+                'Shared Hit Blocks': 12,
+                'Shared Read Blocks': 3
+            },
+            {
+                'Node Type': 'Hash',
+                'Plan Rows': 10,
+                'Actual Rows': 10,
+                'Actual Loops': 1,
+                'Plans': [category_scan]
+            }
+        ]
+    }
+
+
+INDEX_SCAN = {
+    'Node Type': 'Index Scan',
+    'Relation Name': 'category',
+    'Index Name': 'category_pkey',
+    'Plan Rows': 10,
+    'Actual Rows': 10,
+    'Actual Loops': 1
+}
+
+SEQ_SCAN = {
+    'Node Type': 'Seq Scan',
+    'Relation Name': 'category',
+    'Plan Rows': 1,
+    'Actual Rows': 10,
+    'Actual Loops': 1,
+    'Rows Removed by Filter': 5000
+}
 
 
 @pytest.mark.usefixtures('postgresql_dsn')
@@ -33,3 +90,92 @@ class TestAnalyzeWithPostgres(object):
         )
         analysis = analyze(connection, query)
         assert analysis.node_types == [u'Limit', u'Index Only Scan']
+
+
+class TestQueryAnalysis(object):
+
+    @pytest.fixture
+    def analysis(self):
+        return make_analysis(hash_join(SEQ_SCAN))
+
+    def test_node_types(self, analysis):
+        assert analysis.node_types == [
+            'Hash Join', 'Seq Scan', 'Hash', 'Seq Scan'
+        ]
+
+    def test_plan_tree(self, analysis):
+        root = analysis.root
+        assert root.node_type == 'Hash Join'
+        assert [node.node_type for node in root.children] == [
+            'Seq Scan', 'Hash'
+        ]
+        assert root.children[1].children[0].path == (
+            'Hash Join', 'Hash', 'Seq Scan'
+        )
+
+    def test_node_attributes(self, analysis):
+        node = analysis.nodes[1]
+        assert node.relation_name == 'article'
+        assert node.index_name is None
+        assert node.estimated_rows == 1000
+        assert node.actual_rows == 1000
+        assert node.loops == 1
+        assert node.buffers == {
+            'Shared Hit Blocks': 12,
+            'Shared Read Blocks': 3
+        }
+        assert repr(node) == "<PlanNode 'Seq Scan' on 'article'>"
+
+    def test_seq_scans(self, analysis):
+        assert [
+            node.relation_name for node in analysis.seq_scans(min_rows=1000)
+        ] == ['article', 'category']
+        assert [
+            node.relation_name for node in analysis.seq_scans(min_rows=2000)
+        ] == ['category']
+
+    def test_misestimates(self, analysis):
+        assert [
+            node.relation_name for node in analysis.misestimates(ratio=10)
+        ] == ['category']
+        assert analysis.misestimates(ratio=11) == []
+
+    def test_json_round_trip(self, analysis):
+        analysis2 = QueryAnalysis.from_json(analysis.to_json())
+        assert analysis2.node_types == analysis.node_types
+        assert analysis2.runtime == analysis.runtime
+
+
+class TestComparePlans(object):
+
+    def test_identical_plans(self):
+        plan = make_analysis(hash_join(INDEX_SCAN))
+        assert compare_plans(plan, plan) == []
+
+    def test_index_scan_replaced_with_seq_scan(self):
+        regressions = compare_plans(
+            make_analysis(hash_join(INDEX_SCAN)),
+            make_analysis(hash_join(SEQ_SCAN))
+        )
+        assert len(regressions) == 3
+        assert regressions[0].startswith('Plan shape changed')
+        assert regressions[1] == (
+            "Relation 'category' is scanned sequentially instead of using an "
+            "index"
+        )
+        assert regressions[2] == (
+            "<PlanNode 'Seq Scan' on 'category'> estimated 1 rows but "
+            "returned 10 rows"
+        )
+
+    def test_existing_misestimates_are_ignored(self):
+        plan = json.loads(json.dumps(hash_join(SEQ_SCAN)))
+        assert compare_plans(plan, hash_join(SEQ_SCAN)) == []
+
+    def test_runtime(self):
+        baseline = make_analysis(hash_join(INDEX_SCAN), runtime=1.0)
+        plan = make_analysis(hash_join(INDEX_SCAN), runtime=3.0)
+        assert compare_plans(baseline, plan) == []
+        assert compare_plans(baseline, plan, runtime_ratio=2) == [
+            'Runtime grew from 1.0 ms to 3.0 ms'
+        ]
@@ -0,0 +1,167 @@
+import pytest
+import sqlalchemy as sa
+from flexmock import flexmock
+
+from sqlalchemy_utils import capture_slow_queries
+from sqlalchemy_utils.functions import database
+from sqlalchemy_utils.functions.database import _fingerprint
+
+
+class TestFingerprint(object):
+
+    @pytest.mark.parametrize(
+        ('statement', 'fingerprint'),
+        (
+            (
+                "SELECT * FROM article WHERE name = 'Some' AND id = 12",
+                'SELECT * FROM article WHERE name = ? AND id = ?'
+            ),
+            (
+                'SELECT * FROM article WHERE id IN (?, ?, ?)',
+                'SELECT * FROM article WHERE id IN (?)'
+            ),
+            (
+                'SELECT * FROM article\n  WHERE id = %(id_1)s',
+                'SELECT * FROM article WHERE id = ?'
+            ),
+            (
+                'SELECT id::text FROM article_1 WHERE id = :id',
+                'SELECT id::text FROM article_1 WHERE id = ?'
+            ),
+        )
+    )
+    def test_normalizes_literals_and_parameters(self, statement, fingerprint):
+        assert _fingerprint(statement) == fingerprint
+
+
+class TestExplainPostgres(object):
+
+    @pytest.fixture
+    def statements(self):
+        return []
+
+    def connection(self, statements, autocommit=False):
+        class Cursor(object):
+            def execute(self, statement, parameters=None):
+                statements.append(statement)
+
+            def fetchall(self):
+                return [([{'Plan': {'Node Type': 'Result'}}], )]
+
+            def close(self):
+                pass
+
+        return flexmock(
+            dialect=flexmock(name='postgresql'),
+            connection=flexmock(autocommit=autocommit, cursor=Cursor)
+        )
+
+    def test_analyze_is_rolled_back(self, statements):
+        plan = database._explain(
+            self.connection(statements), 'SELECT 1', {}, True
+        )
+        assert plan == [{'Plan': {'Node Type': 'Result'}}]
+        assert statements == [
+            'SAVEPOINT sqlalchemy_utils_explain',
+            'EXPLAIN (ANALYZE true, BUFFERS true, FORMAT json) SELECT 1',
+            'ROLLBACK TO SAVEPOINT sqlalchemy_utils_explain',
+            'RELEASE SAVEPOINT sqlalchemy_utils_explain',
+        ]
+
+    def test_analyze_in_autocommit_mode(self, statements):
+        database._explain(
+            self.connection(statements, autocommit=True),
+            'SELECT 1',
+            {},
+            True
+        )
+        assert statements == [
+            'BEGIN',
+            'EXPLAIN (ANALYZE true, BUFFERS true, FORMAT json) SELECT 1',
+            'ROLLBACK',
+        ]
+
+    def test_does_not_analyze_with_statements(self, statements):
+        statement = (
+            'WITH deleted AS (DELETE FROM article RETURNING id) '
+            'SELECT * FROM deleted'
+        )
+        database._explain(self.connection(statements), statement, {}, True)
+        assert statements == [
+            'SAVEPOINT sqlalchemy_utils_explain',
+            'EXPLAIN (FORMAT json) ' + statement,
+            'RELEASE SAVEPOINT sqlalchemy_utils_explain',
+        ]
+
+
+class TestCaptureSlowQueries(object):
+
+    def test_captures_statements_with_plans(
+        self,
+        session,
+        connection,
+        Article
+    ):
+        with capture_slow_queries(connection, threshold_ms=0) as queries:
+            session.query(Article).filter(Article.name == u'Some').all()
+
+        assert len(queries) == 1
+        query = queries[0]
+        assert query.parameters == (u'Some', )
+        assert query.duration >= 0
+        assert query.fingerprint.endswith('WHERE article.name = ?')
+        assert query.plan
+        assert 'article' in str(query.plan)
+
+    def test_threshold(self, session, connection, Article):
+        with capture_slow_queries(connection, threshold_ms=10000) as queries:
+            session.query(Article).all()
+        assert queries == []
+
+    def test_sink(self, session, connection, Article):
+        captured = []
+        with capture_slow_queries(
+            connection,
+            threshold_ms=0,
+            sink=captured.append
+        ) as queries:
+            session.query(Article).all()
+        assert captured == queries
+        assert len(captured) == 1
+
+    def test_does_not_explain_other_statements(self, connection):
+        with capture_slow_queries(connection, threshold_ms=0) as queries:
+            connection.execute('CREATE TABLE some_table (id INTEGER)')
+        assert queries[0].plan is None
+
+    def test_removes_listeners(self, session, connection, Article):
+        with capture_slow_queries(connection, threshold_ms=0) as queries:
+            pass
+        session.query(Article).all()
+        assert queries == []
+
+    def test_failing_statements(self, session, connection, Article):
+        with capture_slow_queries(connection, threshold_ms=0) as queries:
+            with pytest.raises(sa.exc.OperationalError):
+                connection.execute('SELECT * FROM unknown_table')
+            session.query(Article).all()
+        assert len(queries) == 1
+
+    def test_failing_explain(self, session, connection, Article):
+        (
+            flexmock(database)
+            .should_receive('_explain')
+            .and_raise(sa.exc.OperationalError('EXPLAIN', {}, None))
+        )
+        with capture_slow_queries(connection, threshold_ms=0) as queries:
+            articles = session.query(Article).all()
+        assert articles == []
+        assert len(queries) == 1
+        assert queries[0].plan is None
+
+    def test_removes_connection_info_key(self, session, connection, Article):
+        info_keys = set(connection.info)
+        with capture_slow_queries(connection, threshold_ms=0):
+            session.query(Article).all()
+            assert set(connection.info) == info_keys
+        assert set(connection.info) == info_keys
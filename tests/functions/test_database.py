@@ -1,8 +1,23 @@
+import os
+
 import pytest
 import sqlalchemy as sa
 from flexmock import flexmock
 
-from sqlalchemy_utils import create_database, database_exists, drop_database
+from sqlalchemy_utils import (
+    create_database,
+    create_databases,
+    database_exists,
+    dispose_admin_engines,
+    drop_database,
+    drop_databases,
+    snapshot_database
+)
+from sqlalchemy_utils.functions import database
+from sqlalchemy_utils.functions.database import (
+    _copy_mysql_database,
+    _get_admin_engine
+)
 
 pymysql = None
 try:
@@ -77,6 +92,20 @@ class TestDatabasePostgres(DatabaseTest):
         )
         create_database(dsn, template='my_template')
 
+    def test_failing_drop_closes_connection(self, dsn):
+        connection = flexmock(dialect=flexmock(server_version_info=(9, 6)))
+        (
+            connection
+            .should_receive('execute')
+            .and_raise(sa.exc.OperationalError('DROP DATABASE', {}, None))
+        )
+        connection.should_receive('close').once()
+        flexmock(sa.engine.Engine).should_receive('connect').and_return(
+            connection
+        )
+        with pytest.raises(sa.exc.OperationalError):
+            drop_database(dsn)
+
 
 @pytest.mark.usefixtures('postgresql_dsn')
 class TestDatabasePostgresWithQuotedName(DatabaseTest):
@@ -99,3 +128,239 @@ class TestDatabasePostgresWithQuotedName(DatabaseTest):
             postgresql_db_user
         )
         create_database(dsn, template='my-template')
+
+
+@pytest.mark.usefixtures('sqlite_file_dsn')
+class TestSnapshotDatabaseSQLite(object):
+
+    @pytest.fixture
+    def snapshot_dsn(self, dsn):
+        create_database(dsn)
+        engine = sa.create_engine(dsn)
+        engine.execute('CREATE TABLE article (id INTEGER PRIMARY KEY)')
+        engine.execute('INSERT INTO article (id) VALUES (1)')
+        engine.dispose()
+        yield dsn
+        drop_database(dsn)
+
+    def test_snapshot_name_is_derived_from_schema(self, snapshot_dsn):
+        name = snapshot_database(snapshot_dsn)
+        try:
+            database = sa.engine.url.make_url(snapshot_dsn).database
+            assert name.startswith(database[:-len('.db')] + '_')
+            assert name.endswith('.db')
+            assert snapshot_database(snapshot_dsn) == name
+        finally:
+            os.remove(name)
+
+    def test_create_database_from_snapshot(self, snapshot_dsn):
+        name = snapshot_database(snapshot_dsn, 'snapshot.db')
+        dsn = 'sqlite:///worker_1.db'
+        try:
+            create_database(dsn, from_snapshot=name)
+            engine = sa.create_engine(dsn)
+            assert engine.execute('SELECT id FROM article').fetchall() == [
+                (1, )
+            ]
+            engine.dispose()
+        finally:
+            os.remove(name)
+            drop_database(dsn)
+
+    def test_memory_database(self):
+        with pytest.raises(ValueError):
+            snapshot_database('sqlite:///:memory:')
+
+    def test_template_and_snapshot(self):
+        with pytest.raises(ValueError):
+            create_database(
+                'postgres://localhost/db',
+                template='template0',
+                from_snapshot='snapshot'
+            )
+
+
+@pytest.mark.usefixtures('postgresql_dsn')
+class TestSnapshotDatabasePostgres(object):
+
+    @pytest.fixture
+    def db_name(self):
+        return 'db_test_sqlalchemy_util'
+
+    def test_create_database_from_snapshot(self, postgresql_db_user):
+        (
+            flexmock(sa.engine.Engine)
+            .should_receive('execute')
+            .with_args(
+                "CREATE DATABASE db_test_sqlalchemy_util ENCODING 'utf8' "
+                "TEMPLATE my_snapshot"
+            )
+        )
+        dsn = 'postgres://{0}@localhost/db_test_sqlalchemy_util'.format(
+            postgresql_db_user
+        )
+        create_database(dsn, from_snapshot='my_snapshot')
+
+
+@pytest.mark.skipif('pymysql is None')
+@pytest.mark.usefixtures('mysql_dsn')
+class TestSnapshotDatabaseMySQL(object):
+
+    @pytest.fixture
+    def db_name(self):
+        return 'db_test_sqlalchemy_util'
+
+    @pytest.fixture
+    def snapshot_dsn(self, dsn):
+        create_database(dsn)
+        engine = sa.create_engine(dsn)
+        engine.execute('CREATE TABLE author (id INTEGER PRIMARY KEY)')
+        engine.execute(
+            'CREATE TABLE article (id INTEGER PRIMARY KEY, '
+            'author_id INTEGER, '
+            'FOREIGN KEY (author_id) REFERENCES author (id))'
+        )
+        engine.execute('INSERT INTO author (id) VALUES (1)')
+        engine.execute('INSERT INTO article (id, author_id) VALUES (1, 1)')
+        engine.dispose()
+        yield dsn
+        drop_database(dsn)
+
+    def test_create_database_from_snapshot(self, snapshot_dsn):
+        name = snapshot_database(snapshot_dsn, 'db_test_snapshot')
+        dsn = snapshot_dsn + '_1'
+        try:
+            create_database(dsn, from_snapshot=name)
+            engine = sa.create_engine(dsn)
+            assert engine.execute(
+                'SELECT id, author_id FROM article'
+            ).fetchall() == [(1, 1)]
+            engine.dispose()
+        finally:
+            drop_database(snapshot_dsn.rsplit('/', 1)[0] + '/' + name)
+            drop_database(dsn)
+
+    def test_failing_copy_resets_connection(self, snapshot_dsn):
+        dsn = snapshot_dsn + '_1'
+        create_database(dsn)
+        engine = sa.create_engine(dsn)
+        engine.execute('CREATE TABLE article (id INTEGER PRIMARY KEY)')
+        engine.dispose()
+        admin_engine = _get_admin_engine(dsn)
+        try:
+            with pytest.raises(sa.exc.DBAPIError):
+                _copy_mysql_database(
+                    admin_engine,
+                    'db_test_sqlalchemy_util',
+                    'db_test_sqlalchemy_util_1'
+                )
+            assert admin_engine.execute(
+                'SELECT @@FOREIGN_KEY_CHECKS, DATABASE()'
+            ).fetchone() == (1, None)
+        finally:
+            drop_database(dsn)
+
+
+class TestSnapshotDatabasePostgresScheme(object):
+
+    @pytest.fixture
+    def statements(self):
+        statements = []
+        engine = sa.create_engine(
+            'postgresql://',
+            strategy='mock',
+            executor=lambda sql, *args, **kwargs: statements.append(sql)
+        )
+        (
+            flexmock(database)
+            .should_receive('_get_admin_engine')
+            .and_return(engine)
+        )
+        return statements
+
+    def test_create_database_from_snapshot(self, statements):
+        create_database(
+            'postgres://postgres@localhost/db_test_sqlalchemy_util',
+            from_snapshot='my_snapshot'
+        )
+        assert statements == [
+            "CREATE DATABASE db_test_sqlalchemy_util ENCODING 'utf8' "
+            "TEMPLATE my_snapshot"
+        ]
+
+    def test_snapshot_database(self, statements):
+        flexmock(database).should_receive('database_exists').and_return(False)
+        name = snapshot_database(
+            'postgres://postgres@localhost/db_test_sqlalchemy_util',
+            'my_snapshot'
+        )
+        assert name == 'my_snapshot'
+        assert statements == [
+            "CREATE DATABASE my_snapshot ENCODING 'utf8' "
+            'TEMPLATE db_test_sqlalchemy_util'
+        ]
+
+
+class TestAdminEngineCache(object):
+
+    def test_sqlite_engine_is_shared(self):
+        assert (
+            _get_admin_engine('sqlite:///db_1.db') is
+            _get_admin_engine('sqlite:///db_2.db')
+        )
+
+    @pytest.mark.skipif('pymysql is None')
+    def test_engines_are_cached_by_server(self):
+        assert (
+            _get_admin_engine('mysql+pymysql://root@localhost/db_1') is
+            _get_admin_engine('mysql+pymysql://root@localhost/db_2')
+        )
+        assert (
+            _get_admin_engine('mysql+pymysql://root@localhost/db_1') is not
+            _get_admin_engine('mysql+pymysql://root@otherhost/db_1')
+        )
+
+    @pytest.mark.parametrize(
+        'dsn',
+        (
+            'postgres://postgres@localhost/db_1',
+            'postgresql://postgres@localhost/db_1',
+            'postgresql+psycopg2://postgres@localhost/db_1',
+        )
+    )
+    def test_postgresql_engine_uses_autocommit(self, dsn):
+        engine = flexmock(dispose=lambda: None)
+        (
+            flexmock(sa)
+            .should_receive('create_engine')
+            .with_args(object, isolation_level='AUTOCOMMIT')
+            .and_return(engine)
+            .once()
+        )
+        try:
+            admin_engine = _get_admin_engine(dsn)
+            assert admin_engine is engine
+        finally:
+            dispose_admin_engines()
+
+
+class TestBulkDatabasesSQLite(object):
+
+    @pytest.fixture
+    def dsns(self):
+        dsns = ['sqlite:///bulk_test_%d.db' % i for i in range(4)]
+        yield dsns
+        for dsn in dsns:
+            if database_exists(dsn):
+                drop_database(dsn)
+
+    def test_create_and_drop(self, dsns):
+        create_database(dsns[0])
+        created = create_databases(dsns, max_workers=2)
+        assert [str(url) for url in created] == dsns[1:]
+        assert all(database_exists(dsn) for dsn in dsns)
+
+        dropped = drop_databases(dsns[:3], max_workers=2)
+        assert [str(url) for url in dropped] == dsns[:3]
+        assert not any(database_exists(dsn) for dsn in dsns[:3])
+        assert database_exists(dsns[3])
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 import sqlalchemy as sa
 
@@ -137,3 +140,38 @@ class TestHasIndexWithFKConstraint(object):
             table.c.author_last_name
         )
         assert has_index(constraint)
+
+
+class TestHasIndexCacheInvalidation(object):
+
+    @pytest.fixture
+    def table(self):
+        return sa.Table(
+            'article',
+            sa.MetaData(),
+            sa.Column('id', sa.Integer, primary_key=True),
+            sa.Column('name', sa.String),
+            sa.Column('is_published', sa.Boolean)
+        )
+
+    def test_index_creation(self, table):
+        assert not has_index(table.c.name)
+        sa.Index('my_index', table.c.name, table.c.is_published)
+        assert has_index(table.c.name)
+        assert not has_index(table.c.is_published)
+
+    def test_column_creation(self, table):
+        table.append_column(sa.Column('slug', sa.String, index=True))
+        assert has_index(table.c.slug)
+
+    def test_lookup_does_not_keep_table_alive(self):
+        table = sa.Table(
+            'article',
+            sa.MetaData(),
+            sa.Column('id', sa.Integer, primary_key=True)
+        )
+        assert has_index(table.c.id)
+        ref = weakref.ref(table)
+        del table
+        gc.collect()
+        assert ref() is None
@@ -0,0 +1,47 @@
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_utils import get_fk_constraint_for_columns, index_coverage
+
+
+class TestIndexCoverage(object):
+
+    @pytest.fixture
+    def table(self, Base):
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            title = sa.Column(sa.String(100))
+            slug = sa.Column(sa.String(100), unique=True)
+            is_published = sa.Column(sa.Boolean, index=True)
+            author_id = sa.Column(sa.Integer, sa.ForeignKey(User.id))
+        return Article.__table__
+
+    def test_columns(self, table):
+        coverage = index_coverage([
+            table.c.id,
+            table.c.title,
+            table.c.slug,
+            table.c.is_published
+        ])
+        assert list(coverage.items()) == [
+            (table.c.id, {'indexed': True, 'unique': True}),
+            (table.c.title, {'indexed': False, 'unique': False}),
+            (table.c.slug, {'indexed': False, 'unique': True}),
+            (table.c.is_published, {'indexed': True, 'unique': False})
+        ]
+
+    def test_foreign_key_constraint(self, table):
+        constraint = get_fk_constraint_for_columns(table, table.c.author_id)
+        assert index_coverage([constraint]) == {
+            constraint: {'indexed': False, 'unique': False}
+        }
+
+    def test_column_that_belongs_to_an_alias(self, table):
+        alias = sa.orm.aliased(table)
+        with pytest.raises(TypeError):
+            index_coverage([alias.c.id])
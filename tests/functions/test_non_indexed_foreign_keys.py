@@ -64,3 +64,129 @@ class TestFindNonIndexedForeignKeys(object):
         ))
         assert 'category_id' in column_names
         assert 'author_id' not in column_names
+
+    def test_ddl(self, session, Base, engine):
+        assert non_indexed_foreign_keys(Base.metadata, engine, ddl=True) == [
+            'CREATE INDEX ix_article_category_id ON article (category_id)'
+        ]
+
+
+@pytest.mark.usefixtures('postgresql_dsn')
+class TestFindNonIndexedForeignKeysPostgres(TestFindNonIndexedForeignKeys):
+
+    def test_ddl(self, session, Base, engine):
+        assert non_indexed_foreign_keys(Base.metadata, engine, ddl=True) == [
+            'CREATE INDEX CONCURRENTLY ix_article_category_id '
+            'ON article (category_id)'
+        ]
+
+
+class TestFindNonIndexedCompositeForeignKeys(object):
+
+    @pytest.fixture
+    def Version(self, Base):
+        class Version(Base):
+            __tablename__ = 'version'
+            article_id = sa.Column(sa.Integer, primary_key=True)
+            number = sa.Column(sa.Integer, primary_key=True)
+        return Version
+
+    @pytest.fixture
+    def Comment(self, Base, Version):
+        class Comment(Base):
+            __tablename__ = 'comment'
+            id = sa.Column(sa.Integer, primary_key=True)
+            article_id = sa.Column(sa.Integer)
+            version_number = sa.Column(sa.Integer)
+            __table_args__ = (
+                sa.ForeignKeyConstraint(
+                    [article_id, version_number],
+                    [Version.article_id, Version.number]
+                ),
+                sa.Index('ix_comment', article_id, version_number, id)
+            )
+        return Comment
+
+    @pytest.fixture
+    def Attachment(self, Base, Version):
+        class Attachment(Base):
+            __tablename__ = 'attachment'
+            id = sa.Column(sa.Integer, primary_key=True)
+            article_id = sa.Column(sa.Integer)
+            version_number = sa.Column(sa.Integer)
+            __table_args__ = (
+                sa.ForeignKeyConstraint(
+                    [article_id, version_number],
+                    [Version.article_id, Version.number]
+                ),
+                sa.Index('ix_attachment', version_number, article_id),
+                sa.Index('ix_attachment_article_id', article_id)
+            )
+        return Attachment
+
+    @pytest.fixture
+    def init_models(self, Version, Comment, Attachment):
+        pass
+
+    def test_index_prefix_in_column_order(self, session, Base, engine):
+        fks = non_indexed_foreign_keys(Base.metadata, engine)
+        assert list(fks) == ['attachment']
+        assert [fk.columns.keys() for fk in fks['attachment']] == [
+            ['article_id', 'version_number']
+        ]
+
+
+@pytest.mark.usefixtures('postgresql_dsn')
+class TestFindNonIndexedCompositeForeignKeysPostgres(
+    TestFindNonIndexedCompositeForeignKeys
+):
+    pass
+
+
+@pytest.mark.usefixtures('postgresql_dsn')
+class TestFindNonIndexedForeignKeysWithSchemaPostgres(object):
+
+    @pytest.fixture
+    def schema(self, engine):
+        engine.execute('CREATE SCHEMA IF NOT EXISTS other')
+        yield 'other'
+        engine.execute('DROP SCHEMA IF EXISTS other CASCADE')
+
+    @pytest.fixture
+    def User(self, Base, schema):
+        class User(Base):
+            __tablename__ = 'user'
+            __table_args__ = {'schema': schema}
+            id = sa.Column(sa.Integer, primary_key=True)
+        return User
+
+    @pytest.fixture
+    def Article(self, Base, User, schema):
+        class Article(Base):
+            __tablename__ = 'article'
+            __table_args__ = {'schema': schema}
+            id = sa.Column(sa.Integer, primary_key=True)
+            author_id = sa.Column(sa.Integer, sa.ForeignKey(User.id))
+        return Article
+
+    @pytest.fixture
+    def init_models(self, User, Article):
+        pass
+
+    def test_finds_foreign_keys_of_tables_in_schema(
+        self,
+        session,
+        Base,
+        engine
+    ):
+        fks = non_indexed_foreign_keys(Base.metadata, engine)
+        assert list(fks) == ['other.article']
+        fk = fks['other.article'][0]
+        assert fk.columns.keys() == ['author_id']
+        assert fk.elements[0].target_fullname == 'other.user.id'
+
+    def test_ddl(self, session, Base, engine):
+        assert non_indexed_foreign_keys(Base.metadata, engine, ddl=True) == [
+            'CREATE INDEX CONCURRENTLY ix_article_author_id '
+            'ON other.article (author_id)'
+        ]
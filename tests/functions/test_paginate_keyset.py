@@ -0,0 +1,146 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_utils import paginate_keyset
+from sqlalchemy_utils.functions.sort_query import (
+    _decode_cursor,
+    _encode_cursor,
+    _keyset_criteria
+)
+
+
+@pytest.fixture
+def Article(Base):
+    class Article(Base):
+        __tablename__ = 'article'
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column(sa.Unicode(255))
+        rating = sa.Column(sa.Integer)
+    return Article
+
+
+@pytest.fixture
+def init_models(Article):
+    pass
+
+
+@pytest.fixture
+def articles(session, Article):
+    articles = [
+        Article(id=1, name=u'a', rating=2),
+        Article(id=2, name=u'b', rating=1),
+        Article(id=3, name=u'c', rating=2),
+        Article(id=4, name=u'd', rating=1),
+        Article(id=5, name=u'e', rating=3)
+    ]
+    session.add_all(articles)
+    session.commit()
+    return articles
+
+
+def paginate_all(query, per_page):
+    pages = [paginate_keyset(query, per_page=per_page)]
+    while pages[-1].has_next:
+        pages.append(
+            paginate_keyset(
+                query,
+                cursor=pages[-1].next_cursor,
+                per_page=per_page
+            )
+        )
+    return [page.items for page in pages]
+
+
+class TestPaginateKeyset(object):
+
+    def test_first_page(self, session, Article, articles):
+        page = paginate_keyset(session.query(Article), per_page=2)
+        assert page.items == articles[0:2]
+        assert page.has_next
+
+    def test_last_page(self, session, Article, articles):
+        page = paginate_keyset(session.query(Article), per_page=5)
+        assert page.items == articles
+        assert page.next_cursor is None
+
+    def test_ascending_order(self, session, Article, articles):
+        query = session.query(Article).order_by(Article.rating)
+        assert paginate_all(query, 2) == [
+            [articles[1], articles[3]],
+            [articles[0], articles[2]],
+            [articles[4]]
+        ]
+
+    def test_descending_order(self, session, Article, articles):
+        query = session.query(Article).order_by(sa.desc(Article.rating))
+        assert paginate_all(query, 2) == [
+            [articles[4], articles[2]],
+            [articles[0], articles[3]],
+            [articles[1]]
+        ]
+
+    def test_mixed_order(self, session, Article, articles):
+        query = session.query(Article).order_by(
+            Article.rating,
+            sa.desc(Article.id)
+        )
+        assert paginate_all(query, 3) == [
+            [articles[3], articles[1], articles[2]],
+            [articles[0], articles[4]]
+        ]
+
+    def test_column_query(self, session, Article, articles):
+        query = session.query(Article.id, Article.name).order_by(Article.id)
+        pages = paginate_all(query, 3)
+        assert pages == [
+            [(1, u'a'), (2, u'b'), (3, u'c')],
+            [(4, u'd'), (5, u'e')]
+        ]
+        assert pages[0][0].name == u'a'
+
+    def test_invalid_cursor(self, session, Article, articles):
+        with pytest.raises(ValueError):
+            paginate_keyset(session.query(Article), cursor='invalid')
+
+    def test_textual_order_by(self, session, Article, articles):
+        with pytest.raises(TypeError):
+            paginate_keyset(session.query(Article).order_by('name'))
+
+
+class TestKeysetCriteria(object):
+
+    def test_row_values(self, Article):
+        columns = [
+            (Article.__table__.c.rating, False),
+            (Article.__table__.c.id, False)
+        ]
+        assert str(_keyset_criteria(columns, [1, 2], row_values=True)) == (
+            '(article.rating, article.id) > (:param_1, :param_2)'
+        )
+
+    def test_expanded_criteria(self, Article):
+        columns = [
+            (Article.__table__.c.rating, False),
+            (Article.__table__.c.id, True)
+        ]
+        assert str(_keyset_criteria(columns, [1, 2], row_values=True)) == (
+            'article.rating > :param_1 OR '
+            'article.rating = :param_1 AND article.id < :param_2'
+        )
+
+
+class TestCursorEncoding(object):
+
+    @pytest.mark.parametrize('values', (
+        [1, u'a', None, 1.5],
+        [datetime(2017, 1, 2, 3, 4, 5, 6), Decimal('1.25')],
+    ))
+    def test_round_trip(self, values):
+        assert _decode_cursor(_encode_cursor(values)) == values
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError):
+            _encode_cursor([object()])
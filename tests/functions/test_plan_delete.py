@@ -0,0 +1,307 @@
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_utils import plan_delete
+
+
+class TestPlanDelete(object):
+
+    @pytest.fixture
+    def User(self, Base):
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            name = sa.Column(sa.Unicode(255))
+        return User
+
+    @pytest.fixture
+    def Article(self, Base, User):
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            author_id = sa.Column(sa.Integer, sa.ForeignKey('user.id'))
+            owner_id = sa.Column(
+                sa.Integer, sa.ForeignKey('user.id', ondelete='SET NULL')
+            )
+
+            author = sa.orm.relationship(User, foreign_keys=[author_id])
+        return Article
+
+    @pytest.fixture
+    def Comment(self, Base, Article):
+        class Comment(Base):
+            __tablename__ = 'comment'
+            id = sa.Column(sa.Integer, primary_key=True)
+            article_id = sa.Column(sa.Integer, sa.ForeignKey('article.id'))
+
+            article = sa.orm.relationship(Article)
+        return Comment
+
+    @pytest.fixture
+    def BlogPost(self, Base, User):
+        class BlogPost(Base):
+            __tablename__ = 'blog_post'
+            id = sa.Column(sa.Integer, primary_key=True)
+            owner_id = sa.Column(
+                sa.Integer, sa.ForeignKey('user.id', ondelete='CASCADE')
+            )
+        return BlogPost
+
+    @pytest.fixture
+    def init_models(self, User, Article, Comment, BlogPost):
+        pass
+
+    def test_plan_is_topologically_ordered(self, session, User):
+        user = User(id=1)
+        session.add(user)
+        session.commit()
+
+        plan = plan_delete(user)
+        assert [t.name for t in plan.tables] == ['comment', 'article', 'user']
+
+    def test_repr(self, session, User):
+        user = User(id=1)
+        session.add(user)
+        session.commit()
+
+        assert repr(plan_delete(user)) == (
+            "<DeletePlan tables=['comment', 'article', 'user']>"
+        )
+
+    def test_execute_deletes_dependent_rows(
+        self,
+        session,
+        User,
+        Article,
+        Comment
+    ):
+        user = User(name=u'John')
+        user2 = User(name=u'Jack')
+        article = Article(author=user)
+        article2 = Article(author=user2)
+        session.add_all([
+            Comment(article=article),
+            Comment(article=article),
+            Comment(article=article2)
+        ])
+        session.commit()
+
+        counts = plan_delete(user).execute(session)
+        assert counts == [2, 1, 1]
+        session.expire_all()
+        assert session.query(User).all() == [user2]
+        assert session.query(Article).all() == [article2]
+        assert session.query(Comment).count() == 1
+
+    def test_query_argument(self, session, User, Article, Comment):
+        users = [User(name=u'John'), User(name=u'Jack'), User(name=u'Jim')]
+        session.add_all([
+            Comment(article=Article(author=user)) for user in users
+        ])
+        session.commit()
+
+        plan_delete(
+            session.query(User).filter(User.name.in_([u'John', u'Jim']))
+        ).execute(session)
+        session.expire_all()
+        assert session.query(User).all() == [users[1]]
+        assert session.query(Article).count() == 1
+        assert session.query(Comment).count() == 1
+
+
+class TestPlanDeleteWithCascadingDependents(object):
+
+    @pytest.fixture
+    def User(self, Base):
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+        return User
+
+    @pytest.fixture
+    def BlogPost(self, Base, User):
+        class BlogPost(Base):
+            __tablename__ = 'blog_post'
+            id = sa.Column(sa.Integer, primary_key=True)
+            owner_id = sa.Column(
+                sa.Integer, sa.ForeignKey('user.id', ondelete='CASCADE')
+            )
+        return BlogPost
+
+    @pytest.fixture
+    def Comment(self, Base, BlogPost):
+        class Comment(Base):
+            __tablename__ = 'comment'
+            id = sa.Column(sa.Integer, primary_key=True)
+            post_id = sa.Column(sa.Integer, sa.ForeignKey('blog_post.id'))
+        return Comment
+
+    @pytest.fixture
+    def init_models(self, User, BlogPost, Comment):
+        pass
+
+    def test_plans_dependents_of_cascaded_rows(self, session, User):
+        user = User(id=1)
+        session.add(user)
+        session.commit()
+
+        plan = plan_delete(user)
+        assert [t.name for t in plan.tables] == ['comment', 'user']
+
+
+class TestPlanDeleteWithDiamondDependency(object):
+
+    @pytest.fixture
+    def User(self, Base):
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+        return User
+
+    @pytest.fixture
+    def Article(self, Base, User):
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            author_id = sa.Column(sa.Integer, sa.ForeignKey('user.id'))
+        return Article
+
+    @pytest.fixture
+    def BlogPost(self, Base, User):
+        class BlogPost(Base):
+            __tablename__ = 'blog_post'
+            id = sa.Column(sa.Integer, primary_key=True)
+            owner_id = sa.Column(sa.Integer, sa.ForeignKey('user.id'))
+        return BlogPost
+
+    @pytest.fixture
+    def Comment(self, Base, Article, BlogPost):
+        class Comment(Base):
+            __tablename__ = 'comment'
+            id = sa.Column(sa.Integer, primary_key=True)
+            article_id = sa.Column(sa.Integer, sa.ForeignKey('article.id'))
+            post_id = sa.Column(sa.Integer, sa.ForeignKey('blog_post.id'))
+        return Comment
+
+    @pytest.fixture
+    def Attachment(self, Base, Comment):
+        class Attachment(Base):
+            __tablename__ = 'attachment'
+            id = sa.Column(sa.Integer, primary_key=True)
+            comment_id = sa.Column(sa.Integer, sa.ForeignKey('comment.id'))
+        return Attachment
+
+    @pytest.fixture
+    def init_models(self, User, Article, BlogPost, Comment, Attachment):
+        pass
+
+    def test_one_statement_per_table(self, session, User):
+        user = User(id=1)
+        session.add(user)
+        session.commit()
+
+        plan = plan_delete(user)
+        assert len(plan) == 5
+        assert [t.name for t in plan.tables] == [
+            'attachment', 'comment', 'article', 'blog_post', 'user'
+        ]
+
+    def test_execute(
+        self,
+        session,
+        User,
+        Article,
+        BlogPost,
+        Comment,
+        Attachment
+    ):
+        session.add_all([
+            User(id=1),
+            User(id=2),
+            Article(id=1, author_id=1),
+            Article(id=2, author_id=2),
+            BlogPost(id=1, owner_id=1),
+            BlogPost(id=2, owner_id=2),
+            Comment(id=1, article_id=1, post_id=2),
+            Comment(id=2, article_id=2, post_id=1),
+            Comment(id=3, article_id=2, post_id=2),
+            Attachment(id=1, comment_id=1),
+            Attachment(id=2, comment_id=2),
+            Attachment(id=3, comment_id=3),
+        ])
+        session.commit()
+
+        counts = plan_delete(session.query(User).get(1)).execute(session)
+        assert counts == [2, 2, 1, 1, 1]
+        session.expire_all()
+        assert [c.id for c in session.query(Comment)] == [3]
+        assert [a.id for a in session.query(Attachment)] == [3]
+
+
+class TestPlanDeleteWithCompositeForeignKey(object):
+
+    @pytest.fixture
+    def User(self, Base):
+        class User(Base):
+            __tablename__ = 'user'
+            first_name = sa.Column(sa.Unicode(255), primary_key=True)
+            last_name = sa.Column(sa.Unicode(255), primary_key=True)
+        return User
+
+    @pytest.fixture
+    def Article(self, Base, User):
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            author_first_name = sa.Column(sa.Unicode(255))
+            author_last_name = sa.Column(sa.Unicode(255))
+            __table_args__ = (
+                sa.ForeignKeyConstraint(
+                    [author_first_name, author_last_name],
+                    [User.first_name, User.last_name]
+                ),
+            )
+        return Article
+
+    @pytest.fixture
+    def init_models(self, User, Article):
+        pass
+
+    def test_execute(self, session, User, Article):
+        user = User(first_name=u'John', last_name=u'Smith')
+        user2 = User(first_name=u'John', last_name=u'Doe')
+        session.add_all([
+            user,
+            user2,
+            Article(author_first_name=u'John', author_last_name=u'Smith'),
+            Article(author_first_name=u'John', author_last_name=u'Doe')
+        ])
+        session.commit()
+
+        assert plan_delete(user).execute(session) == [1, 1]
+        session.expire_all()
+        assert session.query(User).all() == [user2]
+        assert session.query(Article).count() == 1
+
+
+class TestPlanDeleteWithSelfReferentialForeignKey(object):
+
+    @pytest.fixture
+    def Category(self, Base):
+        class Category(Base):
+            __tablename__ = 'category'
+            id = sa.Column(sa.Integer, primary_key=True)
+            parent_id = sa.Column(sa.Integer, sa.ForeignKey('category.id'))
+        return Category
+
+    @pytest.fixture
+    def init_models(self, Category):
+        pass
+
+    def test_raises_value_error(self, session, Category):
+        category = Category(id=1)
+        session.add(category)
+        session.commit()
+
+        with pytest.raises(ValueError):
+            plan_delete(category)
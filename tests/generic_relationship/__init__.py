@@ -1,4 +1,12 @@
+import pytest
 import six
+from flexmock import flexmock
+
+from sqlalchemy_utils import (
+    assert_max_queries,
+    generic_selectinload,
+    prefetch_generic
+)
 
 
 class GenericRelationshipTestCase(object):
@@ -103,3 +111,93 @@ class GenericRelationshipTestCase(object):
         statement = Event.object.is_type(User)
         q = session.query(Event).filter(statement)
         assert q.first() is not None
+
+    def test_generic_selectinload(self, session, User, Event):
+        users = [User(), User(), User()]
+
+        session.add_all(users)
+        session.commit()
+
+        session.add_all([Event(object=user) for user in users])
+        session.add(Event(object=users[0]))
+        session.commit()
+        session.expire_all()
+
+        with assert_max_queries(3, bind=session.bind):
+            events = (
+                session.query(Event)
+                .options(generic_selectinload(Event.object))
+                .order_by(Event.id)
+                .all()
+            )
+            assert [event.object for event in events] == users + users[:1]
+
+    def test_generic_selectinload_with_non_generic_attribute(self, Event):
+        with pytest.raises(TypeError):
+            generic_selectinload(Event.id)
+
+    def test_get_uses_identity_map(self, session, User, Event):
+        user = User()
+        session.add(user)
+        session.commit()
+        session.add(Event(object=user))
+        session.commit()
+
+        event = session.query(Event).one()
+        session.query(User).all()
+
+        flexmock(session).should_receive('query').never()
+        assert event.object is user
+
+    def test_selectinload_uses_identity_map(self, session, User, Event):
+        users = [User(), User()]
+        session.add_all(users)
+        session.commit()
+        session.add_all([Event(object=user) for user in users])
+        session.commit()
+
+        session.query(User).all()
+        # The events and their target ids are selected, but the targets
+        # are taken from the identity map.
+        with assert_max_queries(2, bind=session.bind):
+            events = (
+                session.query(Event)
+                .options(generic_selectinload(Event.object))
+                .order_by(Event.id)
+                .all()
+            )
+            assert [event.object for event in events] == users
+
+    def test_prefetch_generic(self, session, User, Event):
+        users = [User(), User(), User()]
+
+        session.add_all(users)
+        session.commit()
+
+        session.add_all([Event(object=user) for user in users])
+        session.commit()
+        session.expire_all()
+
+        events = session.query(Event).order_by(Event.id).all()
+        with assert_max_queries(1, bind=session.bind):
+            assert prefetch_generic(events, Event.object) == users
+            assert [event.object for event in events] == users
+
+    def test_prefetch_generic_skips_identity_map_hits(
+        self,
+        session,
+        User,
+        Event
+    ):
+        users = [User(), User()]
+
+        session.add_all(users)
+        session.commit()
+
+        session.add_all([Event(object=user) for user in users])
+        session.commit()
+
+        events = session.query(Event).order_by(Event.id).all()
+        session.query(User).all()
+        with assert_max_queries(0, bind=session.bind):
+            assert prefetch_generic(events, Event.object) == users
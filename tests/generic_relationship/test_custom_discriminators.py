@@ -0,0 +1,117 @@
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_utils import generic_relationship, generic_selectinload
+
+
+@pytest.fixture
+def User(Base):
+    class User(Base):
+        __tablename__ = 'user'
+        id = sa.Column(sa.Integer, primary_key=True)
+    return User
+
+
+@pytest.fixture
+def Building(Base):
+    class Building(Base):
+        __tablename__ = 'building'
+        id = sa.Column(sa.Integer, primary_key=True)
+    return Building
+
+
+@pytest.fixture
+def Event(Base, User):
+    class Event(Base):
+        __tablename__ = 'event'
+        id = sa.Column(sa.Integer, primary_key=True)
+
+        object_type = sa.Column(sa.SmallInteger)
+        object_id = sa.Column(sa.Integer)
+
+        object = generic_relationship(
+            object_type,
+            object_id,
+            discriminators={User: 1, 'Building': 2}
+        )
+    return Event
+
+
+@pytest.fixture
+def init_models(User, Building, Event):
+    pass
+
+
+class TestGenericRelationshipWithCustomDiscriminators(object):
+
+    def test_set_and_get(self, session, User, Building, Event):
+        user = User()
+        building = Building()
+        session.add_all([user, building])
+        session.commit()
+
+        events = [Event(object=user), Event(object=building)]
+        assert [event.object_type for event in events] == [1, 2]
+
+        session.add_all(events)
+        session.commit()
+        session.expire_all()
+
+        assert events[0].object == user
+        assert events[1].object == building
+
+    def test_unknown_discriminator(self, session, User, Event):
+        event = Event(object_type=3, object_id=1)
+        session.add(event)
+        session.commit()
+        assert event.object is None
+
+    def test_set_object_without_discriminator(self, session, Event):
+        event = Event()
+        with pytest.raises(ValueError):
+            event.object = event
+
+    def test_compare_query(self, session, User, Building, Event):
+        user = User()
+        building = Building()
+        session.add_all([user, building])
+        session.commit()
+        session.add_all([Event(object=user), Event(object=building)])
+        session.commit()
+
+        q = session.query(Event)
+        assert q.filter(Event.object == user).count() == 1
+        assert q.filter(Event.object.is_type(Building)).one().object == (
+            building
+        )
+
+    def test_generic_selectinload(self, session, User, Building, Event):
+        user = User()
+        building = Building()
+        session.add_all([user, building])
+        session.commit()
+        session.add_all([Event(object=user), Event(object=building)])
+        session.commit()
+        session.expire_all()
+
+        events = (
+            session.query(Event)
+            .options(generic_selectinload(Event.object))
+            .order_by(Event.id)
+            .all()
+        )
+        assert [event.__dict__['object'] for event in events] == [
+            user, building
+        ]
+
+
+class TestGenericTargetLookup(object):
+
+    def test_lookup_is_rebuilt_on_configuration(self, Event, User, Building):
+        sa.orm.configure_mappers()
+        prop = Event.object.property
+        assert prop._lookups is None
+        target = prop.get_target(1)
+        assert target.class_ is User
+        assert target.mapper is sa.inspect(User)
+        assert prop.get_discriminator(User) == (1, target)
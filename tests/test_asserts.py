@@ -4,6 +4,8 @@ from sqlalchemy.dialects.postgresql import ARRAY
 
 from sqlalchemy_utils import (
     assert_max_length,
+    assert_max_queries,
+    assert_max_query_time,
     assert_max_value,
     assert_min_value,
     assert_non_nullable,
@@ -158,3 +160,65 @@ class TestAssertMaxValue(object):
             assert_max_value(user, 'age', 151)
         with pytest.raises(AssertionError):
             assert_max_value(user, 'age', 151)
+
+
+class TestAssertMaxQueries(object):
+
+    @pytest.fixture
+    def Article(self, Base):
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            name = sa.Column(sa.Unicode(255))
+        return Article
+
+    @pytest.fixture
+    def init_models(self, Article):
+        pass
+
+    def test_within_budget(self, session, Article):
+        with assert_max_queries(1, bind=session.bind) as queries:
+            session.query(Article).all()
+        assert len(queries) == 1
+        assert queries[0].call_site.startswith(__file__.rstrip('c'))
+
+    def test_over_budget(self, session, Article):
+        with pytest.raises(AssertionError) as e:
+            with assert_max_queries(1, bind=session.bind):
+                for i in range(3):
+                    session.query(Article).get(i + 1)
+                session.query(Article).count()
+        message = str(e.value)
+        assert message.startswith('Expected at most 1 queries, got 4:')
+        assert '\n3 x SELECT article.id AS article_id' in message
+        assert 'WHERE article.id = ? (' in message
+        assert message.count('test_over_budget') == 2
+
+    def test_without_bind(self, session, Article):
+        with pytest.raises(AssertionError):
+            with assert_max_queries(0):
+                session.query(Article).all()
+
+    def test_removes_listeners(self, session, Article):
+        with assert_max_queries(0, bind=session.bind) as queries:
+            pass
+        session.query(Article).all()
+        assert queries == []
+
+    def test_query_time(self, session, Article):
+        with assert_max_query_time(10000, bind=session.bind) as queries:
+            session.query(Article).all()
+        assert len(queries) == 1
+
+        with pytest.raises(AssertionError) as e:
+            with assert_max_query_time(-1, bind=session.bind):
+                session.query(Article).all()
+        assert str(e.value).startswith(
+            'Expected queries to take at most -1 ms'
+        )
+
+    def test_removes_connection_info_key(self, session, Article):
+        info_keys = set(session.connection().info)
+        with assert_max_queries(1, bind=session.bind):
+            session.query(Article).all()
+        assert set(session.connection().info) == info_keys
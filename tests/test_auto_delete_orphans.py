@@ -2,7 +2,11 @@ import pytest
 import sqlalchemy as sa
 from sqlalchemy.orm import backref
 
-from sqlalchemy_utils import auto_delete_orphans, ImproperlyConfigured
+from sqlalchemy_utils import (
+    assert_max_queries,
+    auto_delete_orphans,
+    ImproperlyConfigured
+)
 
 
 @pytest.fixture
@@ -46,6 +50,7 @@ def Entry(Base, Tag, tagging_tbl, request):
         __tablename__ = 'entry'
 
         id = sa.Column(sa.Integer, primary_key=True)
+        title = sa.Column(sa.Unicode(255))
 
         tags = sa.orm.relationship(
             Tag,
@@ -100,6 +105,68 @@ class TestAutoDeleteOrphans(object):
         r1.tags.remove(t1)
         assert session.query(Tag).count() == 2
 
+    def test_only_removed_targets_are_deleted(self, session, Entry, Tag):
+        entry = Entry()
+        tag = Tag('t1')
+        entry.tags.append(tag)
+        session.add_all([entry, Tag('unused')])
+        session.commit()
+
+        entry.tags.remove(tag)
+        session.flush()
+        assert [tag.name for tag in session.query(Tag)] == ['unused']
+
+    def test_deleting_parent_deletes_orphans(self, session, Entry, Tag):
+        r1 = Entry()
+        r2 = Entry()
+        t1, t2 = Tag('t1'), Tag('t2')
+        r1.tags.extend([t1, t2])
+        r2.tags.append(t2)
+        session.add_all([r1, r2, Tag('unused')])
+        session.commit()
+
+        session.delete(r1)
+        session.flush()
+        assert sorted(tag.name for tag in session.query(Tag)) == [
+            't2', 'unused'
+        ]
+
+    def test_flush_with_unloaded_collection(self, session, Entry, Tag):
+        entry = Entry()
+        entry.tags.append(Tag('t1'))
+        session.add(entry)
+        session.commit()
+
+        entry.title = u'Some entry'
+        session.flush()
+        assert 'tags' not in sa.inspect(entry).dict
+        assert session.query(Tag).count() == 1
+
+    def test_removal_from_backref_side(self, session, Entry, Tag):
+        entry = Entry()
+        entry.tags.extend([Tag('t1'), Tag('t2')])
+        session.add(entry)
+        session.commit()
+        session.expire_all()
+
+        tag = session.query(Tag).filter(Tag.name == 't1').one()
+        tag.entries.remove(tag.entries[0])
+        assert 'tags' not in sa.inspect(entry).dict
+        session.flush()
+        assert [tag.name for tag in session.query(Tag)] == ['t2']
+
+    def test_no_delete_without_removed_targets(self, session, Entry, Tag):
+        entry = Entry()
+        session.add(entry)
+        session.commit()
+
+        entry.tags.append(Tag('t1'))
+        with assert_max_queries(2, bind=session.bind) as queries:
+            session.flush()
+        assert not any(
+            query.statement.startswith('DELETE') for query in queries
+        )
+
 
 class TestAutoDeleteOrphansWithoutBackref(object):
 
@@ -0,0 +1,151 @@
+from datetime import datetime
+
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_utils import bulk_insert, ChoiceType
+from sqlalchemy_utils.types.choice import Choice
+
+
+@pytest.fixture
+def Document(Base):
+    class Document(Base):
+        __tablename__ = 'document'
+        TYPES = [(u'memo', u'Memo'), (u'letter', u'Letter')]
+
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column(sa.Unicode(255), default=u'Untitled')
+        type = sa.Column(ChoiceType(TYPES))
+        created_at = sa.Column(sa.DateTime, default=datetime.now)
+    return Document
+
+
+@pytest.fixture
+def init_models(Document):
+    pass
+
+
+class TestBulkInsert(object):
+
+    def test_inserts_rows_in_chunks(self, session, Document):
+        rows = [{'name': u'Document %d' % i} for i in range(5)]
+        assert bulk_insert(session, Document, rows, chunk_size=2) == 5
+        assert session.query(Document).count() == 5
+        assert rows[0] == {'name': u'Document 0'}
+
+    def test_coerces_values(self, session, Document):
+        rows = [{'type': u'memo'}, {'type': Choice(u'letter', u'Letter')}]
+        bulk_insert(session, Document, rows)
+        documents = session.query(Document).order_by(Document.id).all()
+        assert [document.type.code for document in documents] == [
+            u'memo', u'letter'
+        ]
+
+    def test_fills_defaults(self, session, Document):
+        bulk_insert(session, Document, [{'name': u'Some'}, {}])
+        documents = session.query(Document).order_by(Document.id).all()
+        assert [document.name for document in documents] == [
+            u'Some', u'Untitled'
+        ]
+        assert all(
+            isinstance(document.created_at, datetime)
+            for document in documents
+        )
+
+    def test_uses_one_executemany_per_chunk(self, session, Document):
+        statements = []
+
+        @sa.event.listens_for(session.bind, 'before_cursor_execute')
+        def listener(conn, cursor, statement, params, context, executemany):
+            statements.append((statement, executemany))
+
+        bulk_insert(
+            session,
+            Document,
+            [{'name': u'Some'}, {'type': u'memo'}, {}],
+            chunk_size=3
+        )
+        assert len(statements) == 1
+        assert statements[0][1] is True
+
+
+class TestBulkInsertWithSQLDefaults(object):
+
+    @pytest.fixture
+    def Document(self, Base):
+        class Document(Base):
+            __tablename__ = 'document'
+            id = sa.Column(sa.Integer, primary_key=True)
+            name = sa.Column(sa.Unicode(255), default=u'Untitled')
+            status = sa.Column(sa.Unicode(20), server_default=u'draft')
+            created_at = sa.Column(sa.DateTime, default=sa.func.now())
+
+        Document.name_length = sa.orm.column_property(
+            sa.func.length(Document.name)
+        )
+        return Document
+
+    def test_column_property(self, session, Document):
+        bulk_insert(session, Document, [{'name': u'Some'}])
+        assert session.query(Document).one().name_length == 4
+
+    def test_sql_expression_defaults(self, session, Document):
+        bulk_insert(session, Document, [{'name': u'Some'}])
+        assert isinstance(session.query(Document).one().created_at, datetime)
+
+    def test_rows_with_different_server_default_keys(
+        self,
+        session,
+        Document
+    ):
+        bulk_insert(
+            session,
+            Document,
+            [{'status': u'published'}, {}, {'status': u'archived'}]
+        )
+        documents = session.query(Document).order_by(Document.id).all()
+        assert [document.status for document in documents] == [
+            u'published', u'draft', u'archived'
+        ]
+
+    def test_mixed_rows_without_defaults(self, session, Document):
+        bulk_insert(
+            session,
+            Document,
+            [{'name': u'Some'}, {'status': u'published'}],
+            defaults=False
+        )
+        documents = session.query(Document).order_by(Document.id).all()
+        assert [
+            (document.name, document.status) for document in documents
+        ] == [(u'Some', u'draft'), (u'Untitled', u'published')]
+
+
+class TestBulkInsertWithInheritance(object):
+
+    @pytest.fixture
+    def Memo(self, Base, Document):
+        class Memo(Document):
+            __tablename__ = 'memo'
+            id = sa.Column(
+                sa.Integer,
+                sa.ForeignKey(Document.id),
+                primary_key=True
+            )
+            subject = sa.Column(sa.Unicode(255))
+        return Memo
+
+    @pytest.fixture
+    def init_models(self, Document, Memo):
+        pass
+
+    def test_inserts_to_all_tables(self, session, Document, Memo):
+        bulk_insert(
+            session,
+            Memo,
+            [{'id': 1, 'type': u'memo', 'subject': u'Some subject'}]
+        )
+        memo = session.query(Memo).one()
+        assert memo.type.code == u'memo'
+        assert memo.name == u'Untitled'
+        assert memo.subject == u'Some subject'
@@ -3,7 +3,11 @@ from datetime import datetime
 import pytest
 import sqlalchemy as sa
 
-from sqlalchemy_utils.listeners import force_instant_defaults
+from sqlalchemy_utils import apply_instant_defaults
+from sqlalchemy_utils.listeners import (
+    _instant_defaults,
+    force_instant_defaults
+)
 
 force_instant_defaults()
 
@@ -27,3 +31,24 @@ class TestInstantDefaultListener(object):
     def test_callables_as_defaults(self, Article):
         article = Article()
         assert isinstance(article.created_at, datetime)
+
+    def test_defaults_are_precomputed(self, Article):
+        sa.orm.configure_mappers()
+        keys = [key for key, value, is_callable in _instant_defaults[Article]]
+        assert sorted(keys) == ['created_at', 'name']
+
+    def test_explicit_values_override_defaults(self, Article):
+        article = Article(name=u'Other article')
+        assert article.name == u'Other article'
+
+
+class TestApplyInstantDefaults(object):
+
+    def test_assigns_unset_attributes(self, Article):
+        articles = [Article(name=u'Other article'), Article()]
+        del articles[0].created_at
+        del articles[1].name
+        assert apply_instant_defaults(articles) == articles
+        assert articles[0].name == u'Other article'
+        assert isinstance(articles[0].created_at, datetime)
+        assert articles[1].name == u'Some article'
@@ -3,6 +3,7 @@ import sqlalchemy as sa
 from flexmock import flexmock
 
 from sqlalchemy_utils import proxy_dict, ProxyDict
+from sqlalchemy_utils.proxy_dict import expire_proxy_dicts
 
 
 @pytest.fixture
@@ -131,3 +132,144 @@ class TestProxyDict(object):
         article.translations['en']
         session.commit()
         article.translations['en']
+
+    def test_preload(self, connection, session, Article, ArticleTranslation):
+        article = Article()
+        article.translations['en'].name = u'Some article'
+        article.translations['fi'].name = u'Joku artikkeli'
+        session.add(article)
+        session.commit()
+        article.id
+
+        query_count = connection.query_count
+        article.translations.preload()
+        assert article.translations['en'].name == u'Some article'
+        assert article.translations['fi'].name == u'Joku artikkeli'
+        assert 'sv' not in article.translations
+        assert connection.query_count == query_count + 1
+
+    def test_get_many(self, connection, session, Article):
+        article = Article()
+        article.translations['en'].name = u'Some article'
+        article.translations['fi'].name = u'Joku artikkeli'
+        session.add(article)
+        session.commit()
+        article.id
+
+        query_count = connection.query_count
+        translations = article.translations.get_many(['en', 'fi', 'sv'])
+        assert sorted(translations.keys()) == ['en', 'fi']
+        assert translations['en'].name == u'Some article'
+        assert 'sv' not in article.translations
+        assert article.translations.get_many(['fi', 'sv']) == {
+            'fi': translations['fi']
+        }
+        assert connection.query_count == query_count + 1
+
+    def test_get_many_for_transient_parent(self, Article):
+        article = Article()
+        assert article.translations.get_many(['en']) == {}
+
+    def test_expire_clears_negative_lookups(self, session, Article):
+        article = Article()
+        session.add(article)
+        session.commit()
+        assert 'en' not in article.translations
+        article.translations['en'].name = u'Some article'
+        session.commit()
+        assert 'en' in article.translations
+
+    def test_expire_listener_is_registered_for_parent_class(self, Article):
+        Article().translations
+        assert sa.event.contains(Article, 'expire', expire_proxy_dicts)
+        assert not sa.event.contains(
+            sa.orm.mapper,
+            'expire',
+            expire_proxy_dicts
+        )
+
+    def test_expiring_other_attributes_keeps_cache(self, session, Article):
+        article = Article()
+        (
+            flexmock(ProxyDict)
+            .should_receive('fetch')
+            .once()
+        )
+        session.add(article)
+        session.commit()
+        article.translations['en']
+        session.expire(article, ['description'])
+        article.translations['en']
+
+    def test_expiring_collection_clears_cache(self, session, Article):
+        article = Article()
+        (
+            flexmock(ProxyDict)
+            .should_receive('fetch')
+            .twice()
+        )
+        session.add(article)
+        session.commit()
+        article.translations['en']
+        session.expire(article, ['_translations'])
+        article.translations['en']
+
+
+class TestProxyDictWithMaxSize(object):
+
+    @pytest.fixture
+    def Article(self, Base, ArticleTranslation):
+        class Article(Base):
+            __tablename__ = 'article'
+
+            id = sa.Column(sa.Integer, autoincrement=True, primary_key=True)
+            _translations = sa.orm.relationship(
+                ArticleTranslation,
+                lazy='dynamic',
+                cascade='all, delete-orphan',
+                passive_deletes=True,
+                backref=sa.orm.backref('parent'),
+            )
+
+            @property
+            def translations(self):
+                return proxy_dict(
+                    self,
+                    '_translations',
+                    ArticleTranslation.locale,
+                    max_size=2
+                )
+        return Article
+
+    def test_evicts_least_recently_used_keys(self, session, Article):
+        article = Article()
+        session.add(article)
+        session.commit()
+        translations = article.translations
+        translations['en']
+        translations['fi']
+        translations['en']
+        translations['sv']
+        assert list(translations.cache.keys()) == ['en', 'sv']
+
+    def test_preload_after_eviction_fetches(self, session, Article):
+        article = Article()
+        for locale in ['en', 'fi', 'sv']:
+            article.translations[locale].name = u'Some article'
+        session.add(article)
+        session.commit()
+        translations = article.translations.preload()
+        assert 'en' in translations
+        assert 'fi' in translations
+        assert 'sv' in translations
+
+    def test_get_many_after_eviction_fetches(self, session, Article):
+        article = Article()
+        for locale in ['en', 'fi', 'sv']:
+            article.translations[locale].name = u'Some article'
+        session.add(article)
+        session.commit()
+        translations = article.translations.preload()
+        assert sorted(translations.get_many(['en', 'fi', 'sv'])) == [
+            'en', 'fi', 'sv'
+        ]
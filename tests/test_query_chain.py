@@ -1,7 +1,9 @@
+from multiprocessing.pool import ThreadPool
+
 import pytest
 import sqlalchemy as sa
 
-from sqlalchemy_utils import QueryChain
+from sqlalchemy_utils import drop_database, QueryChain
 
 
 @pytest.fixture
@@ -108,3 +110,378 @@ class TestQueryChain(object):
 
     def test_count(self, chain):
         assert chain.count() == 9
+
+
+@pytest.fixture
+def union_chain(session, articles, Article):
+    return QueryChain(
+        [
+            session.query(Article).filter(Article.id > 2).order_by(
+                sa.desc(Article.id)
+            ),
+            session.query(Article).filter(Article.id <= 2).order_by(
+                Article.id
+            )
+        ],
+        union_all=True
+    )
+
+
+class TestQueryChainUnionAll(object):
+
+    def test_iter(self, union_chain, articles):
+        assert list(union_chain) == [
+            articles[3], articles[2], articles[0], articles[1]
+        ]
+
+    def test_iter_with_limit_and_offset(self, union_chain, articles):
+        assert list(union_chain.offset(1).limit(2)) == [
+            articles[2], articles[0]
+        ]
+
+    def test_executes_single_query(self, union_chain, connection):
+        query_count = connection.query_count
+        list(union_chain[1:3])
+        assert connection.query_count == query_count + 1
+
+    def test_iter_column_queries(self, session, articles, Article):
+        chain = QueryChain(
+            [
+                session.query(Article.id).filter(Article.id == 2),
+                session.query(Article.id).filter(Article.id == 1)
+            ],
+            union_all=True
+        )
+        rows = list(chain)
+        assert rows == [(2, ), (1, )]
+        assert rows[0].id == 2
+
+    def test_limited_queries(self, session, articles, Article):
+        chain = QueryChain(
+            [
+                session.query(Article).order_by(sa.desc(Article.id)).limit(2),
+                session.query(Article).order_by(Article.id).offset(1).limit(1)
+            ],
+            union_all=True
+        )
+        assert list(chain) == [articles[3], articles[2], articles[1]]
+        assert chain.count() == 3
+
+    def test_getitem_with_slice(self, union_chain):
+        assert union_chain[1:]._union_all
+
+    def test_count(self, union_chain, connection):
+        query_count = connection.query_count
+        assert union_chain.count() == 4
+        assert connection.query_count == query_count + 1
+
+
+class TestQueryChainStream(object):
+
+    def test_stream(self, chain):
+        assert list(chain.stream(batch_size=2)) == list(chain)
+
+    def test_stream_with_limit_and_offset(self, chain, articles, posts):
+        c = chain.offset(3).limit(4)
+        assert list(c.stream(batch_size=2)) == articles[1:] + posts[0:1]
+
+    def test_stream_batches(self, chain, users, articles, posts):
+        batches = list(chain.stream(batch_size=4, batches=True))
+        assert batches == [
+            users + articles[0:2],
+            articles[2:] + posts[0:2],
+            posts[2:]
+        ]
+
+    def test_stream_does_not_modify_queries(self, chain):
+        stream = chain.stream(batch_size=2)
+        next(stream)
+        assert chain.queries[0]._yield_per is None
+
+    def test_callback(self, chain):
+        sizes = []
+        list(chain.stream(batch_size=4, callback=lambda b: sizes.append(
+            len(b)
+        )))
+        assert sizes == [4, 4, 1]
+
+    def test_stream_union_all(self, union_chain, articles):
+        assert list(union_chain.stream(batch_size=3)) == [
+            articles[3], articles[2], articles[0], articles[1]
+        ]
+
+
+class Future(object):
+    def __init__(self, result):
+        self._result = result
+
+    def result(self):
+        return self._result
+
+    def cancel(self):
+        return False
+
+
+class SynchronousExecutor(object):
+    def submit(self, func, *args):
+        return Future(func(*args))
+
+
+@pytest.fixture
+def concurrent_chain(chain):
+    return QueryChain(chain.queries, executor=SynchronousExecutor())
+
+
+class TestQueryChainWithExecutor(object):
+
+    def test_iter(self, concurrent_chain, users, articles, posts):
+        assert list(concurrent_chain) == users + articles + posts
+
+    def test_iter_merges_objects_to_original_session(
+        self,
+        session,
+        concurrent_chain
+    ):
+        assert all(
+            sa.orm.object_session(obj) is session
+            for obj in concurrent_chain
+        )
+
+    def test_iter_with_limit_and_offset(
+        self,
+        concurrent_chain,
+        articles,
+        posts
+    ):
+        c = concurrent_chain.offset(3).limit(4)
+        assert list(c) == articles[1:] + posts[0:1]
+
+    def test_iter_with_offset_spanning_multiple_queries(
+        self,
+        concurrent_chain,
+        posts
+    ):
+        assert list(concurrent_chain.offset(7)) == posts[1:]
+
+    def test_iter_column_queries(self, session, articles, Article):
+        chain = QueryChain(
+            [
+                session.query(Article.id).filter(Article.id == 2),
+                session.query(Article.id).filter(Article.id == 1)
+            ],
+            executor=SynchronousExecutor()
+        )
+        rows = list(chain)
+        assert rows == [(2, ), (1, )]
+        assert rows[0].id == 2
+
+    def test_getitem_with_slice(self, concurrent_chain):
+        c = concurrent_chain[1:]
+        assert c._executor is concurrent_chain._executor
+
+    def test_count(self, concurrent_chain):
+        assert concurrent_chain.count() == 9
+
+
+class ThreadFuture(object):
+    def __init__(self, result):
+        self._result = result
+
+    def result(self):
+        return self._result.get()
+
+    def cancel(self):
+        return False
+
+
+class ThreadPoolExecutor(object):
+    def __init__(self, pool):
+        self.pool = pool
+
+    def submit(self, func, *args):
+        return ThreadFuture(self.pool.apply_async(func, args))
+
+
+@pytest.mark.usefixtures('sqlite_file_dsn')
+class TestQueryChainWithThreadPool(object):
+
+    @pytest.fixture(autouse=True)
+    def drop_database_file(self, dsn):
+        yield
+        drop_database(dsn)
+
+    @pytest.fixture
+    def Article(self, Base):
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            position = sa.Column(sa.Integer)
+        return Article
+
+    @pytest.fixture
+    def init_models(self, Article):
+        pass
+
+    @pytest.fixture
+    def executor(self):
+        pool = ThreadPool(2)
+        yield ThreadPoolExecutor(pool)
+        pool.terminate()
+
+    def test_iter(self, session, Article, executor):
+        articles = [Article(position=1), Article(position=2)]
+        session.add_all(articles)
+        session.commit()
+        session.expunge_all()
+
+        chain = QueryChain(
+            [
+                session.query(Article).filter_by(position=1),
+                session.query(Article).filter_by(position=2)
+            ],
+            executor=executor
+        )
+        assert [article.position for article in chain] == [1, 2]
+        assert all(
+            sa.orm.object_session(article) is session for article in chain
+        )
+
+    def test_keeps_unflushed_changes(self, session, Article, executor):
+        article = Article(position=1)
+        session.add(article)
+        session.commit()
+
+        article.position = 100
+        chain = QueryChain(
+            [session.query(Article), session.query(Article)],
+            executor=executor
+        )
+        assert list(chain) == [article, article]
+        assert article.position == 100
+        assert article in session.dirty
+
+
+class TestQueryChainMergeBy(object):
+
+    @pytest.fixture
+    def Article(self, Base):
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            position = sa.Column(sa.Integer)
+        return Article
+
+    @pytest.fixture
+    def BlogPost(self, Base):
+        class BlogPost(Base):
+            __tablename__ = 'blog_post'
+            id = sa.Column(sa.Integer, primary_key=True)
+            position = sa.Column(sa.Integer)
+        return BlogPost
+
+    @pytest.fixture
+    def init_models(self, Article, BlogPost):
+        pass
+
+    @pytest.fixture
+    def objects(self, session, Article, BlogPost):
+        objects = [
+            Article(position=1),
+            BlogPost(position=2),
+            BlogPost(position=3),
+            Article(position=4),
+            Article(position=5),
+            BlogPost(position=6)
+        ]
+        session.add_all(objects)
+        session.commit()
+        return objects
+
+    @pytest.fixture
+    def chain(self, session, Article, BlogPost):
+        return QueryChain([
+            session.query(Article),
+            session.query(BlogPost)
+        ])
+
+    def test_merge_by(self, chain, objects):
+        assert list(chain.merge_by('position')) == objects
+
+    def test_merge_by_desc(self, chain, objects):
+        assert list(chain.merge_by('position', desc=True)) == objects[::-1]
+
+    def test_merge_by_with_limit_and_offset(self, chain, objects):
+        c = chain.merge_by('position').offset(1).limit(3)
+        assert list(c) == objects[1:4]
+
+    def test_merge_by_with_executor(self, chain, objects):
+        chain = QueryChain(chain.queries, executor=SynchronousExecutor())
+        c = chain.merge_by('position', desc=True).limit(2)
+        assert list(c) == [objects[5], objects[4]]
+
+    @pytest.mark.parametrize('desc', (False, True))
+    def test_merge_by_with_null_keys(
+        self,
+        session,
+        chain,
+        objects,
+        Article,
+        BlogPost,
+        desc
+    ):
+        nulls = [Article(), BlogPost()]
+        session.add_all(nulls)
+        session.commit()
+        rows = list(chain.merge_by('position', desc=desc))
+        assert rows[:6] == (objects[::-1] if desc else objects)
+        assert set(rows[6:]) == set(nulls)
+
+    def test_merge_by_label(self, session, objects, Article, BlogPost):
+        chain = QueryChain([
+            session.query(Article, (Article.position * 10).label('rank')),
+            session.query(BlogPost, (BlogPost.position * 10).label('rank'))
+        ])
+        rows = list(chain.merge_by('rank', desc=True))
+        assert [row.rank for row in rows] == [60, 50, 40, 30, 20, 10]
+        assert [row[0] for row in rows] == objects[::-1]
+
+    def test_merge_by_with_limited_queries(
+        self,
+        session,
+        objects,
+        Article,
+        BlogPost
+    ):
+        chain = QueryChain([
+            session.query(Article).order_by(Article.position.desc()).limit(2),
+            session.query(BlogPost).order_by(BlogPost.position.desc()).limit(2)
+        ])
+        assert list(chain.merge_by('position')) == objects[2:]
+
+    def test_merge_by_with_executor_keeps_sessions(
+        self,
+        session,
+        objects,
+        Article,
+        BlogPost
+    ):
+        other_session = sa.orm.Session(bind=session.bind)
+        try:
+            chain = QueryChain(
+                [session.query(Article), other_session.query(BlogPost)],
+                executor=SynchronousExecutor()
+            )
+            for obj in chain.merge_by('position'):
+                assert sa.orm.object_session(obj) is (
+                    session if isinstance(obj, Article) else other_session
+                )
+        finally:
+            other_session.close()
+
+    def test_merge_by_unknown_key(self, chain, objects):
+        with pytest.raises(ValueError):
+            list(chain.merge_by('unknown'))
+
+    def test_merge_by_returns_new_chain(self, chain):
+        assert chain.merge_by('position')._merge_key == 'position'
+        assert chain._merge_key is None
@@ -1,8 +1,12 @@
 import pytest
 import sqlalchemy as sa
 
-from sqlalchemy_utils import sort_query
-from sqlalchemy_utils.functions import QuerySorterException
+from sqlalchemy_utils import compile_sorter, sort_query
+from sqlalchemy_utils.functions import (
+    QuerySorterException,
+    UnindexedSortWarning
+)
+from sqlalchemy_utils.functions.sort_query import suggest_sort_index
 
 from . import assert_contains
 
@@ -364,3 +368,146 @@ class TestSortQueryWithCustomPolymorphic(object):
             'category'
         )
         assert 'ORDER BY' in str(query)
+
+
+class TestCompileSorter(object):
+
+    @pytest.fixture
+    def query(self, session, Article):
+        return session.query(Article).join(Article.category)
+
+    def test_column_ascending(self, query):
+        sorter = compile_sorter(query, allowed=['name'])
+        assert_contains('ORDER BY article.name ASC', sorter(query, 'name'))
+
+    def test_column_descending(self, query):
+        sorter = compile_sorter(query, allowed=['name'])
+        assert_contains('ORDER BY article.name DESC', sorter(query, '-name'))
+
+    def test_joined_table_column(self, query):
+        sorter = compile_sorter(query, allowed=['name', 'category-name'])
+        assert_contains(
+            'ORDER BY category.name DESC, article.name ASC',
+            sorter(query, '-category-name', 'name')
+        )
+
+    def test_applies_to_queries_with_same_shape(self, query, Category):
+        sorter = compile_sorter(query, allowed=['category-name'])
+        query = query.filter(Category.name == u'Some category')
+        assert_contains(
+            'ORDER BY category.name ASC',
+            sorter(query, 'category-name')
+        )
+
+    def test_skips_keys_not_in_whitelist(self, query):
+        sorter = compile_sorter(query, allowed=['name'])
+        assert 'ORDER BY' not in str(sorter(query, 'id'))
+
+    def test_non_silent_mode(self, query):
+        sorter = compile_sorter(query, allowed=['name'], silent=False)
+        with pytest.raises(QuerySorterException):
+            sorter(query, 'id')
+
+    def test_unresolvable_allowed_key(self, query):
+        with pytest.raises(QuerySorterException):
+            compile_sorter(query, allowed=['unknown'])
+
+    def test_without_whitelist(self, query):
+        sorter = compile_sorter(query)
+        assert_contains('ORDER BY article.id DESC', sorter(query, '-id'))
+        assert 'id' in sorter.expressions
+
+    def test_does_not_cache_unknown_keys(self, query):
+        sorter = compile_sorter(query)
+        sorter(query, 'unknown', '-unknown_2')
+        assert 'unknown' not in sorter.expressions
+        assert 'unknown_2' not in sorter.expressions
+
+    def test_cache_max_size(self, query):
+        sorter = compile_sorter(query, max_size=1)
+        sorter(query, 'id')
+        query = sorter(query, 'name')
+        assert list(sorter.expressions) == ['name']
+        assert_contains('ORDER BY article.name ASC', query)
+
+    def test_calculated_value(self, session, Article, Category):
+        query = session.query(
+            Category, sa.func.count(Article.id).label('articles')
+        ).outerjoin(Category.articles).group_by(Category.id)
+        sorter = compile_sorter(query, allowed=['articles'])
+        assert_contains('ORDER BY articles DESC', sorter(query, '-articles'))
+
+
+class TestSortQueryIndexChecks(object):
+
+    @pytest.fixture
+    def query(self, session, Article):
+        return session.query(Article).filter(Article.category_id == 1)
+
+    def test_indexed_column(self, query, recwarn):
+        query = sort_query(query, 'name', unindexed='raise')
+        assert_contains('ORDER BY article.name ASC', query)
+
+    def test_raise(self, query):
+        with pytest.raises(QuerySorterException) as e:
+            sort_query(query, 'category_id', unindexed='raise')
+        assert (
+            'CREATE INDEX ix_article_category_id ON article (category_id)'
+            in str(e.value)
+        )
+
+    def test_warn(self, query):
+        with pytest.warns(UnindexedSortWarning):
+            query = sort_query(query, '-category_id', unindexed='warn')
+        assert_contains('ORDER BY article.category_id DESC', query)
+
+    def test_fallback(self, query):
+        query = sort_query(
+            query,
+            'category_id',
+            unindexed='fallback',
+            fallback='-id'
+        )
+        assert_contains('ORDER BY article.id DESC', query)
+
+    def test_fallback_without_fallback_sort(self, query):
+        query = sort_query(query, 'category_id', unindexed='fallback')
+        assert 'ORDER BY' not in str(query)
+
+    def test_skips_expressions_without_columns(self, session, Category):
+        query = session.query(Category)
+        query = sort_query(query, 'articles_count', unindexed='raise')
+        assert 'ORDER BY (SELECT count(article.id)' in str(query)
+
+    def test_invalid_option(self, query):
+        with pytest.raises(ValueError):
+            sort_query(query, 'name', unindexed='unknown')
+
+    def test_compiled_sorter(self, query):
+        sorter = compile_sorter(
+            query,
+            allowed=['name', 'category_id'],
+            unindexed='raise'
+        )
+        assert sorter.unindexed == set(['category_id'])
+        assert_contains('ORDER BY article.name ASC', sorter(query, 'name'))
+        with pytest.raises(QuerySorterException):
+            sorter(query, 'category_id')
+
+
+class TestSuggestSortIndex(object):
+
+    def test_composite_index(self, session, Article, Category):
+        query = (
+            session.query(Article)
+            .join(Article.category)
+            .filter(
+                Article.category_id == 1,
+                Article.name.in_([u'a', u'b']),
+                Category.name == u'c'
+            )
+        )
+        assert suggest_sort_index(query, Article.id) == (
+            'CREATE INDEX ix_article_category_id_name_id '
+            'ON article (category_id, name, id)'
+        )
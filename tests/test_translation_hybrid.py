@@ -1,10 +1,18 @@
 import pytest
 import sqlalchemy as sa
 from flexmock import flexmock
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import HSTORE
 from sqlalchemy.orm import aliased
+from sqlalchemy.schema import CreateIndex
 
-from sqlalchemy_utils import i18n, TranslationHybrid  # noqa
+from sqlalchemy_utils import (  # noqa
+    assert_max_queries,
+    i18n,
+    locale_cache,
+    translation_only,
+    TranslationHybrid
+)
 
 
 @pytest.fixture
@@ -125,3 +133,267 @@ class TestTranslationHybrid(object):
         CityAlias = aliased(City)
         query_str = str(session.query(CityAlias.name))
         assert query_str.endswith('FROM city AS city_1')
+
+
+@pytest.mark.skipif('i18n.babel is None')
+class TestTranslationHybridIndex(object):
+
+    def compile_indexes(self, indexes):
+        return [
+            str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+            for index in indexes
+        ]
+
+    def test_creates_index_for_each_locale(self, City, translation_hybrid):
+        indexes = translation_hybrid.index(
+            City.name_translations,
+            ['fi', 'sv']
+        )
+        assert self.compile_indexes(indexes) == [
+            "CREATE INDEX ix_city_name_translations_fi ON city "
+            "(coalesce(name_translations -> 'fi', name_translations -> 'en'))",
+            "CREATE INDEX ix_city_name_translations_sv ON city "
+            "(coalesce(name_translations -> 'sv', name_translations -> 'en'))"
+        ]
+
+    def test_indexes_are_attached_to_table(self, City, translation_hybrid):
+        indexes = translation_hybrid.index(City.name_translations, ['fi'])
+        assert set(indexes) <= City.__table__.indexes
+
+    def test_custom_name(self, City, translation_hybrid):
+        index = translation_hybrid.index(
+            City.__table__.c.name_translations,
+            ['fi'],
+            name='%(column)s_%(locale)s_idx'
+        )[0]
+        assert index.name == 'name_translations_fi_idx'
+
+    def test_dynamic_default_locale(self, Base):
+        translation_hybrid = TranslationHybrid('fi', lambda obj: obj.locale)
+
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            name_translations = sa.Column(HSTORE)
+            name = translation_hybrid(name_translations)
+            locale = sa.Column(sa.String)
+
+        indexes = translation_hybrid.index(Article.name_translations, ['fi'])
+        assert self.compile_indexes(indexes) == [
+            "CREATE INDEX ix_article_name_translations_fi ON article "
+            "(coalesce(name_translations -> 'fi', "
+            "name_translations -> article.locale))"
+        ]
+
+    def test_raises_for_unattached_column(self, translation_hybrid):
+        with pytest.raises(ValueError):
+            translation_hybrid.index(sa.Column(HSTORE), ['fi'])
+
+
+@pytest.mark.skipif('i18n.babel is None')
+class TestLocaleCache(object):
+
+    @pytest.fixture
+    def locale_getter(self, translation_hybrid):
+        calls = []
+
+        def get_locale():
+            calls.append(None)
+            return 'fi'
+        translation_hybrid.current_locale = get_locale
+        return calls
+
+    def test_resolves_locale_once(self, City, locale_getter):
+        city = City(name_translations={'fi': 'Helsinki'})
+        with locale_cache():
+            assert [city.name for _ in range(5)] == ['Helsinki'] * 5
+        assert len(locale_getter) == 1
+
+    def test_nested_blocks_share_cache(self, City, locale_getter):
+        city = City(name_translations={'fi': 'Helsinki'})
+        with locale_cache():
+            with locale_cache():
+                city.name
+            city.name
+        assert len(locale_getter) == 1
+
+    def test_cache_is_discarded_after_block(self, City, locale_getter):
+        city = City(name_translations={'fi': 'Helsinki'})
+        with locale_cache():
+            city.name
+        city.name
+        assert len(locale_getter) == 2
+
+    def test_per_object_locales_are_not_cached(self, City, translation_hybrid):
+        translation_hybrid.current_locale = lambda obj: obj.locale
+        cities = [
+            City(name_translations={'en': 'Helsinki'}),
+            City(name_translations={'sv': 'Helsingfors'})
+        ]
+        cities[1].locale = 'sv'
+        with locale_cache():
+            assert [city.name for city in cities] == [
+                'Helsinki', 'Helsingfors'
+            ]
+
+
+@pytest.mark.skipif('i18n.babel is None')
+class TestTranslationOnlyQuery(object):
+
+    def compile_query(self, query):
+        return str(
+            query._compile_context().statement.compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+    def test_selects_projection_instead_of_translations(self, City):
+        query = sa.orm.Session().query(City).options(
+            translation_only(City.name)
+        )
+        assert self.compile_query(query) == (
+            'SELECT city.id AS city_id, '
+            'city.name_translations -> %(name_translations_1)s AS anon_1, '
+            'city.name_translations -> %(name_translations_2)s AS anon_2 '
+            '\nFROM city'
+        )
+
+    def test_does_not_modify_mapper(self, City):
+        columns = list(sa.inspect(City).columns)
+        sa.orm.Session().query(City).options(
+            translation_only(City.name)
+        )._compile_context()
+        assert list(sa.inspect(City).columns) == columns
+
+    def test_aliased_entity(self, City):
+        CityAlias = aliased(City)
+        query = sa.orm.Session().query(CityAlias).options(
+            translation_only(CityAlias.name)
+        )
+        assert 'city_1.name_translations AS' not in self.compile_query(query)
+        assert self.compile_query(query).endswith('FROM city AS city_1')
+
+    def test_raises_for_non_translation_attribute(self, City):
+        with pytest.raises(TypeError):
+            translation_only(City.id)
+
+
+@pytest.mark.usefixtures('postgresql_dsn')
+@pytest.mark.skipif('i18n.babel is None')
+class TestTranslationOnly(object):
+
+    @pytest.fixture
+    def cities(self, session, City):
+        cities = [
+            City(name_translations={'fi': 'Helsinki', 'sv': 'Helsingfors'}),
+            City(name_translations={'en': 'Espoo'}),
+            City(name_translations={})
+        ]
+        session.add_all(cities)
+        session.commit()
+        session.expunge_all()
+
+    @pytest.mark.usefixtures('cities')
+    def test_reads_projected_translations(self, session, City):
+        cities = (
+            session.query(City)
+            .options(translation_only(City.name))
+            .order_by(City.id)
+            .all()
+        )
+        with assert_max_queries(0, bind=session.bind):
+            assert [city.name for city in cities] == [
+                'Helsinki', 'Espoo', None
+            ]
+        assert 'name_translations' not in cities[0].__dict__
+
+    @pytest.mark.usefixtures('cities')
+    def test_loading_does_not_modify_mapper(self, session, City):
+        columns = list(sa.inspect(City).columns)
+        cities = (
+            session.query(City)
+            .options(translation_only(City.name))
+            .order_by(City.id)
+            .all()
+        )
+        assert [city.name for city in cities] == ['Helsinki', 'Espoo', None]
+        assert list(sa.inspect(City).columns) == columns
+        session.expunge_all()
+        city = session.query(City).order_by(City.id).first()
+        assert city.name_translations == {
+            'fi': 'Helsinki', 'sv': 'Helsingfors'
+        }
+
+    @pytest.mark.usefixtures('cities')
+    def test_custom_locale(self, session, City, translation_hybrid):
+        cities = (
+            session.query(City)
+            .options(translation_only(City.name, 'sv'))
+            .order_by(City.id)
+            .all()
+        )
+        translation_hybrid.current_locale = 'sv'
+        with assert_max_queries(0, bind=session.bind):
+            assert [city.name for city in cities] == [
+                'Helsingfors', 'Espoo', None
+            ]
+
+    @pytest.mark.usefixtures('cities')
+    def test_loads_translations_for_other_locales(
+        self,
+        session,
+        City,
+        translation_hybrid
+    ):
+        city = (
+            session.query(City)
+            .options(translation_only(City.name))
+            .order_by(City.id)
+            .first()
+        )
+        translation_hybrid.current_locale = 'sv'
+        assert city.name == 'Helsingfors'
+        assert city.name_translations == {
+            'fi': 'Helsinki', 'sv': 'Helsingfors'
+        }
+
+    @pytest.mark.usefixtures('cities')
+    def test_projection_is_discarded_on_expire(self, session, City):
+        city = (
+            session.query(City)
+            .options(translation_only(City.name))
+            .order_by(City.id)
+            .first()
+        )
+        session.expire(city)
+        assert i18n._get_projection(city, 'name_translations') is None
+        assert city.name == 'Helsinki'
+
+    @pytest.mark.usefixtures('cities')
+    def test_setter_loads_translations(self, session, City):
+        city = (
+            session.query(City)
+            .options(translation_only(City.name))
+            .order_by(City.id)
+            .first()
+        )
+        city.name = 'Stadi'
+        assert city.name == 'Stadi'
+        assert city.name_translations['sv'] == 'Helsingfors'
+
+    @pytest.mark.usefixtures('cities')
+    def test_same_current_and_default_locale(
+        self,
+        session,
+        City,
+        translation_hybrid
+    ):
+        city = (
+            session.query(City)
+            .options(translation_only(City.name, 'en'))
+            .order_by(City.id)
+            .first()
+        )
+        translation_hybrid.current_locale = 'en'
+        with assert_max_queries(0, bind=session.bind):
+            assert city.name is None
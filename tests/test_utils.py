@@ -0,0 +1,28 @@
+from sqlalchemy_utils.utils import LRUCache
+
+
+class TestLRUCache(object):
+
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        assert cache.get('a') == 1
+        cache['c'] = 3
+        assert dict(cache) == {'a': 1, 'c': 3}
+        assert cache.evicted
+
+    def test_setdefault(self):
+        cache = LRUCache(1)
+        assert cache.setdefault('a', 1) == 1
+        assert cache.setdefault('a', 2) == 1
+        cache.setdefault('b', None)
+        assert list(cache.keys()) == ['b']
+
+    def test_items_do_not_touch_keys(self):
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        assert list(cache.items()) == [('a', 1), ('b', 2)]
+        cache['c'] = 3
+        assert list(cache.keys()) == ['b', 'c']